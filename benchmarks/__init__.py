@@ -0,0 +1,10 @@
+"""
+Measure dicognito's throughput.
+
+Generates reproducible synthetic corpora of several shapes, times the
+individual element handlers, Anonymizer.anonymize, and the command-line
+tool against them, and records the results as JSON that can be compared
+between versions.
+
+Run ``python -m benchmarks --help`` from the repository root for usage.
+"""
@@ -0,0 +1,121 @@
+"""Generate benchmark corpora, run benchmarks, and compare results."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from benchmarks import corpus, timing
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+DEFAULT_COUNTS = {
+    "ct-slices": 200,
+    "enhanced-multiframe": 3,
+    "deep-sr": 20,
+    "private-tags": 50,
+}
+
+
+def _generate(args: argparse.Namespace) -> None:
+    count = args.count or DEFAULT_COUNTS[args.shape]
+    filenames = corpus.generate_corpus(args.directory, args.shape, count, args.seed)
+    print(f"Wrote {len(filenames)} {args.shape} files to {args.directory}")
+
+
+def _run(args: argparse.Namespace) -> None:
+    results: list[timing.Result] = []
+    with tempfile.TemporaryDirectory(prefix="dicognito-benchmark-corpus-") as corpus_root:
+        for shape in args.shapes:
+            count = max(1, round(DEFAULT_COUNTS[shape] * args.scale))
+            directory = os.path.join(corpus_root, shape)
+            filenames = corpus.generate_corpus(directory, shape, count)
+            print(f"{shape}: {count} files", file=sys.stderr)
+
+            results.extend(timing.time_element_handlers(shape, filenames, args.repeats))
+            results.extend(timing.time_anonymize(shape, filenames, args.repeats))
+            results.extend(timing.time_anonymize_bytes(shape, filenames, args.repeats))
+            results.extend(timing.time_command_line(shape, directory, count, args.repeats))
+            results.extend(timing.time_command_line(shape, directory, count, args.repeats, ("--io-threads", "4")))
+            results.extend(timing.time_command_line(shape, directory, count, args.repeats, ("--header-only",)))
+            results.extend(timing.time_startup(shape, filenames[0], args.repeats))
+
+    _print_results(results)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(timing.to_json_object(results), output_file, indent=2)
+
+
+def _print_results(results: Sequence[timing.Result]) -> None:
+    row_format = "{:20} {:32} {:>6} {:>12} {:>12} {:>12}"
+    print(row_format.format("corpus", "benchmark", "files", "best (s)", "mean (s)", "files/s"))
+    for result in results:
+        print(
+            row_format.format(
+                result.corpus,
+                result.benchmark,
+                result.files,
+                f"{result.best_seconds:.4f}",
+                f"{result.mean_seconds:.4f}",
+                f"{result.files_per_second:.1f}",
+            ),
+        )
+
+
+def _compare(args: argparse.Namespace) -> None:
+    def load(filename: str) -> dict[tuple[str, str], dict[str, Any]]:
+        with open(filename) as results_file:
+            return {(result["corpus"], result["benchmark"]): result for result in json.load(results_file)["results"]}
+
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+
+    row_format = "{:20} {:32} {:>12} {:>12} {:>8}"
+    print(row_format.format("corpus", "benchmark", "baseline (s)", "candidate (s)", "speedup"))
+    for key in sorted(baseline.keys() & candidate.keys()):
+        baseline_seconds = baseline[key]["best_seconds"]
+        candidate_seconds = candidate[key]["best_seconds"]
+        speedup = baseline_seconds / candidate_seconds if candidate_seconds else float("inf")
+        print(row_format.format(*key, f"{baseline_seconds:.4f}", f"{candidate_seconds:.4f}", f"{speedup:.2f}x"))
+
+
+def main(main_args: Sequence[str] | None = None) -> None:
+    """Run the benchmark tool."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    subparsers = parser.add_subparsers(required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a synthetic corpus to a directory.")
+    generate_parser.add_argument("shape", choices=corpus.SHAPES)
+    generate_parser.add_argument("directory")
+    generate_parser.add_argument("--count", type=int, help="The number of files to write.")
+    generate_parser.add_argument("--seed", default="dicognito-benchmark")
+    generate_parser.set_defaults(action=_generate)
+
+    run_parser = subparsers.add_parser("run", help="Time dicognito against synthetic corpora.")
+    run_parser.add_argument("--shapes", nargs="+", choices=corpus.SHAPES, default=list(corpus.SHAPES))
+    run_parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply the default number of files in each corpus by SCALE.",
+    )
+    run_parser.add_argument("--repeats", type=int, default=3)
+    run_parser.add_argument("--output", "-o", help="Write results as JSON to OUTPUT.")
+    run_parser.set_defaults(action=_run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two JSON results files.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.set_defaults(action=_compare)
+
+    args = parser.parse_args(main_args)
+    args.action(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Generate reproducible synthetic DICOM corpora for benchmarking."""
+
+from __future__ import annotations
+
+import os
+import random
+from typing import TYPE_CHECKING
+
+import pydicom
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.sequence import Sequence
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CT_IMAGE_STORAGE = "1.2.840.10008.5.1.4.1.1.2"
+ENHANCED_MR_IMAGE_STORAGE = "1.2.840.10008.5.1.4.1.1.4.1"
+COMPREHENSIVE_SR_STORAGE = "1.2.840.10008.5.1.4.1.1.88.33"
+
+_LAST_NAMES = ("SMITH", "JONES", "GARCIA", "NGUYEN", "MULLER", "ROSSI", "TANAKA", "OKAFOR")
+_FIRST_NAMES = ("ALEX", "SAM", "JORDAN", "TAYLOR", "MORGAN", "CASEY", "RILEY", "JAMIE")
+
+
+class _Generator:
+    """Makes consistent patient, study, and series values from a seeded random source."""
+
+    def __init__(self, seed: str) -> None:
+        self.random = random.Random(seed)  # noqa: S311
+        self.seed = seed
+
+    def uid(self, *parts: object) -> str:
+        return generate_uid(prefix=None, entropy_srcs=[self.seed, *map(str, parts)])
+
+    def name(self) -> str:
+        return f"{self.random.choice(_LAST_NAMES)}^{self.random.choice(_FIRST_NAMES)}"
+
+    def date(self) -> str:
+        return f"{self.random.randint(1990, 2024):04}{self.random.randint(1, 12):02}{self.random.randint(1, 28):02}"
+
+    def time(self) -> str:
+        return f"{self.random.randint(0, 23):02}{self.random.randint(0, 59):02}{self.random.randint(0, 59):02}.123456"
+
+    def base_dataset(self, sop_class_uid: str, patient: int, study: int, series: int, instance: int) -> Dataset:
+        dataset = Dataset()
+        dataset.SOPClassUID = sop_class_uid
+        dataset.SOPInstanceUID = self.uid("instance", patient, study, series, instance)
+        dataset.StudyInstanceUID = self.uid("study", patient, study)
+        dataset.SeriesInstanceUID = self.uid("series", patient, study, series)
+        dataset.FrameOfReferenceUID = self.uid("frame", patient, study, series)
+
+        dataset.PatientName = f"PATIENT{patient}^{_FIRST_NAMES[patient % len(_FIRST_NAMES)]}"
+        dataset.PatientID = f"PID{patient:06}"
+        dataset.PatientBirthDate = f"19{50 + patient % 50:02}0101"
+        dataset.PatientSex = "FM"[patient % 2]
+        dataset.PatientAddress = f"{patient} MAIN STREET"
+        dataset.OtherPatientIDs = f"OPID{patient:06}"
+        dataset.IssuerOfPatientID = "HOSPITAL"
+
+        dataset.AccessionNumber = f"ACC{patient:04}{study:04}"
+        dataset.StudyID = f"S{study}"
+        dataset.StudyDate = f"2020{1 + study % 12:02}15"
+        dataset.StudyTime = "101010.000"
+        dataset.SeriesDate = dataset.StudyDate
+        dataset.SeriesTime = "101500.000"
+        dataset.SeriesNumber = series
+        dataset.InstanceNumber = instance
+        dataset.ContentDate = dataset.StudyDate
+        dataset.ContentTime = "102000.000"
+        dataset.ReferringPhysicianName = "REFERRING^DOCTOR"
+        dataset.OperatorsName = "OPERATOR^ONE"
+        dataset.PerformingPhysicianName = "PERFORMING^DOCTOR"
+        dataset.InstitutionName = "GENERAL HOSPITAL"
+        dataset.InstitutionAddress = "1 HOSPITAL ROAD"
+        dataset.InstitutionalDepartmentName = "RADIOLOGY"
+        dataset.StationName = "STATION1"
+        dataset.BurnedInAnnotation = "NO"
+        return dataset
+
+    def add_image(self, dataset: Dataset, rows: int, columns: int, frames: int = 1) -> None:
+        dataset.SamplesPerPixel = 1
+        dataset.PhotometricInterpretation = "MONOCHROME2"
+        dataset.Rows = rows
+        dataset.Columns = columns
+        dataset.BitsAllocated = 16
+        dataset.BitsStored = 12
+        dataset.HighBit = 11
+        dataset.PixelRepresentation = 0
+        if frames > 1:
+            dataset.NumberOfFrames = frames
+        dataset.PixelData = self.random.randbytes(rows * columns * 2 * frames)
+
+
+def _ct_slices(generator: _Generator, count: int) -> Iterator[Dataset]:
+    """Many small CT slices: a few patients, studies, and series."""
+    for index in range(count):
+        patient, study, series = index % 3, index % 5, index % 10
+        dataset = generator.base_dataset(CT_IMAGE_STORAGE, patient, study, series, index)
+        dataset.Modality = "CT"
+        dataset.ImagePositionPatient = [0, 0, index]
+        dataset.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        dataset.SliceThickness = 1
+        dataset.AcquisitionDate = dataset.StudyDate
+        dataset.AcquisitionTime = generator.time()
+        referenced_image = Dataset()
+        referenced_image.ReferencedSOPClassUID = CT_IMAGE_STORAGE
+        referenced_image.ReferencedSOPInstanceUID = generator.uid("localizer", patient, study)
+        dataset.ReferencedImageSequence = Sequence([referenced_image])
+        generator.add_image(dataset, 64, 64)
+        yield dataset
+
+
+def _enhanced_multiframe(generator: _Generator, count: int) -> Iterator[Dataset]:
+    """Large enhanced multi-frame instances, with a functional group item per frame."""
+    frames = 200
+    for index in range(count):
+        dataset = generator.base_dataset(ENHANCED_MR_IMAGE_STORAGE, 0, 0, 0, index)
+        dataset.Modality = "MR"
+        dataset.AcquisitionDateTime = dataset.StudyDate + "101010.000000"
+        per_frame_items = []
+        for frame in range(frames):
+            frame_content = Dataset()
+            frame_content.FrameAcquisitionDateTime = dataset.AcquisitionDateTime
+            frame_content.FrameReferenceDateTime = dataset.AcquisitionDateTime
+            frame_content.FrameAcquisitionNumber = frame
+            derivation_source = Dataset()
+            derivation_source.ReferencedSOPClassUID = ENHANCED_MR_IMAGE_STORAGE
+            derivation_source.ReferencedSOPInstanceUID = generator.uid("source", index, frame)
+            derivation = Dataset()
+            derivation.SourceImageSequence = Sequence([derivation_source])
+            item = Dataset()
+            item.FrameContentSequence = Sequence([frame_content])
+            item.DerivationImageSequence = Sequence([derivation])
+            per_frame_items.append(item)
+        dataset.PerFrameFunctionalGroupsSequence = Sequence(per_frame_items)
+        generator.add_image(dataset, 256, 256, frames)
+        yield dataset
+
+
+def _deep_sr(generator: _Generator, count: int) -> Iterator[Dataset]:
+    """Structured reports with deeply nested content items."""
+    depth = 6
+    width = 4
+
+    def content_items(level: int) -> Sequence:
+        items = []
+        for position in range(width):
+            item = Dataset()
+            item.RelationshipType = "CONTAINS"
+            if level < depth:
+                item.ValueType = "CONTAINER"
+                item.ContinuityOfContent = "SEPARATE"
+                if position == 0:
+                    item.ContentSequence = content_items(level + 1)
+            else:
+                item.ValueType = "PNAME"
+                item.PersonName = generator.name()
+            item.ObservationDateTime = generator.date() + "101010"
+            item.ObservationUID = generator.uid("observation", level, position, generator.random.random())
+            items.append(item)
+        return Sequence(items)
+
+    for index in range(count):
+        dataset = generator.base_dataset(COMPREHENSIVE_SR_STORAGE, index % 3, 0, 0, index)
+        dataset.Modality = "SR"
+        dataset.ValueType = "CONTAINER"
+        dataset.ContinuityOfContent = "SEPARATE"
+        dataset.VerifyingObserverSequence = Sequence([Dataset()])
+        dataset.VerifyingObserverSequence[0].VerifyingObserverName = generator.name()
+        dataset.VerifyingObserverSequence[0].VerificationDateTime = generator.date() + "101010"
+        dataset.ContentSequence = content_items(1)
+        yield dataset
+
+
+def _private_tags(generator: _Generator, count: int) -> Iterator[Dataset]:
+    """Small images with many vendor private blocks."""
+    for index in range(count):
+        dataset = generator.base_dataset(CT_IMAGE_STORAGE, index % 3, 0, 0, index)
+        dataset.Modality = "CT"
+        for group in range(0x0009, 0x0051, 2):
+            block = dataset.private_block(group, f"VENDOR {group:04X}", create=True)
+            for element in range(0x40):
+                block.add_new(element, "LO", f"PRIVATE VALUE {index} {element}")
+        generator.add_image(dataset, 64, 64)
+        yield dataset
+
+
+SHAPES: dict[str, Callable[[_Generator, int], Iterator[Dataset]]] = {
+    "ct-slices": _ct_slices,
+    "enhanced-multiframe": _enhanced_multiframe,
+    "deep-sr": _deep_sr,
+    "private-tags": _private_tags,
+}
+"""The corpus shapes that can be generated, and the functions that generate them."""
+
+
+def generate_datasets(shape: str, count: int, seed: str = "dicognito-benchmark") -> Iterator[Dataset]:
+    """
+    Generate datasets of the given shape.
+
+    The same shape, count, and seed always produce the same datasets.
+    """
+    generator = _Generator(f"{seed}-{shape}")
+    for dataset in SHAPES[shape](generator, count):
+        dataset.file_meta = FileMetaDataset()
+        dataset.file_meta.MediaStorageSOPClassUID = dataset.SOPClassUID
+        dataset.file_meta.MediaStorageSOPInstanceUID = dataset.SOPInstanceUID
+        dataset.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        yield dataset
+
+
+def generate_corpus(directory: str, shape: str, count: int, seed: str = "dicognito-benchmark") -> list[str]:
+    """
+    Write a corpus of the given shape to a directory.
+
+    Returns the names of the files written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+    for index, dataset in enumerate(generate_datasets(shape, count, seed)):
+        filename = os.path.join(directory, f"{shape}-{index:06}.dcm")
+        pydicom.dcmwrite(filename, dataset, enforce_file_format=True)
+        filenames.append(filename)
+    return filenames
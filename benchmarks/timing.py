@@ -0,0 +1,233 @@
+"""Time dicognito's components against a corpus."""
+
+from __future__ import annotations
+
+import copy
+import functools
+import io
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import pydicom
+
+import dicognito
+import dicognito.__main__
+from dicognito.anonymizer import Anonymizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pydicom.dataelem import DataElement
+    from pydicom.dataset import Dataset
+
+SEED = "dicognito-benchmark"
+
+
+@dataclass
+class Result:
+    """The timing of one benchmark against one corpus."""
+
+    corpus: str
+    benchmark: str
+    files: int
+    repeats: int
+    best_seconds: float
+    mean_seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        """Files processed per second, in the best run."""
+        return self.files / self.best_seconds if self.best_seconds else float("inf")
+
+
+def _time(function: Callable[[], None], setup: Callable[[], None], repeats: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeats):
+        setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def _load_datasets(filenames: Sequence[str], *, convert: bool = True) -> list[Dataset]:
+    datasets: list[Dataset] = []
+    for filename in filenames:
+        dataset = pydicom.dcmread(filename)
+        if convert:
+            # Convert all raw elements now, so parsing isn't counted against the handlers.
+            dataset.walk(lambda _dataset, _element: None)
+        datasets.append(dataset)
+    return datasets
+
+
+def time_element_handlers(corpus: str, filenames: Sequence[str], repeats: int) -> list[Result]:
+    """
+    Time each of a default Anonymizer's element handlers, individually, on every element of the corpus.
+
+    Also times walking the corpus with a handler that does nothing, for comparison.
+    """
+    originals = _load_datasets(filenames)
+    datasets: list[Dataset] = []
+
+    def make_copies() -> None:
+        datasets[:] = copy.deepcopy(originals)
+
+    def no_op(_dataset: Dataset, _data_element: DataElement) -> bool:
+        return False
+
+    handlers: list[tuple[str, Callable[[Dataset, DataElement], Any]]] = [("walk", no_op)]
+    name_counts: dict[str, int] = {}
+    for element_handler in Anonymizer(seed=SEED)._element_handlers:  # noqa: SLF001
+        handler_name = type(element_handler).__name__
+        name_counts[handler_name] = name_counts.get(handler_name, 0) + 1
+        if name_counts[handler_name] > 1:
+            handler_name += f"#{name_counts[handler_name]}"
+        handlers.append((f"handler:{handler_name}", element_handler))
+
+    results = []
+    for name, handler in handlers:
+
+        def walk_all(handler: Callable[[Dataset, DataElement], Any] = handler) -> None:
+            for dataset in datasets:
+                dataset.walk(handler)
+
+        best, mean = _time(walk_all, make_copies, repeats)
+        results.append(Result(corpus, name, len(filenames), repeats, best, mean))
+    return results
+
+
+def time_anonymize(corpus: str, filenames: Sequence[str], repeats: int) -> list[Result]:
+    """
+    Time Anonymizer.anonymize on every dataset in the corpus.
+
+    The datasets are anonymized as read, so the time includes converting
+    any raw elements the handlers are interested in.
+    """
+    originals = _load_datasets(filenames, convert=False)
+    datasets: list[Dataset] = []
+
+    def make_copies() -> None:
+        datasets[:] = copy.deepcopy(originals)
+
+    def anonymize_all() -> None:
+        anonymizer = Anonymizer(seed=SEED)
+        for dataset in datasets:
+            anonymizer.anonymize(dataset)
+
+    best, mean = _time(anonymize_all, make_copies, repeats)
+    return [Result(corpus, "anonymize", len(filenames), repeats, best, mean)]
+
+
+def time_anonymize_bytes(corpus: str, filenames: Sequence[str], repeats: int) -> list[Result]:
+    """
+    Time anonymizing every file of the corpus held in memory as bytes.
+
+    Compares Anonymizer.anonymize_bytes with a round trip through pydicom:
+    reading the bytes from an io.BytesIO, anonymizing the dataset, and
+    saving it to another io.BytesIO.
+    """
+    buffers = []
+    for filename in filenames:
+        with open(filename, "rb") as file:
+            buffers.append(file.read())
+
+    def round_trip() -> None:
+        anonymizer = Anonymizer(seed=SEED)
+        for buffer in buffers:
+            dataset = pydicom.dcmread(io.BytesIO(buffer))
+            anonymizer.anonymize(dataset)
+            output_file = io.BytesIO()
+            dataset.save_as(output_file, enforce_file_format=True)
+            output_file.getvalue()
+
+    def anonymize_bytes() -> None:
+        anonymizer = Anonymizer(seed=SEED)
+        for buffer in buffers:
+            anonymizer.anonymize_bytes(buffer)
+
+    results = []
+    for name, function in (("bytes:round-trip", round_trip), ("bytes:anonymize_bytes", anonymize_bytes)):
+        best, mean = _time(function, lambda: None, repeats)
+        results.append(Result(corpus, name, len(filenames), repeats, best, mean))
+    return results
+
+
+def time_command_line(
+    corpus: str,
+    directory: str,
+    file_count: int,
+    repeats: int,
+    extra_arguments: Sequence[str] = (),
+) -> list[Result]:
+    """Time the command-line tool (in-process) anonymizing the corpus into a new directory."""
+    with tempfile.TemporaryDirectory(prefix="dicognito-benchmark-output-") as output_root:
+        output_directory = os.path.join(output_root, "out")
+
+        def remove_output() -> None:
+            shutil.rmtree(output_directory, ignore_errors=True)
+
+        def run() -> None:
+            dicognito.__main__.main(
+                (directory, "--output-directory", output_directory, "--quiet", "--seed", SEED, *extra_arguments),
+            )
+
+        best, mean = _time(run, remove_output, repeats)
+
+    name = " ".join(("cli", *extra_arguments))
+    return [Result(corpus, name, file_count, repeats, best, mean)]
+
+
+def time_startup(corpus: str, filename: str, repeats: int) -> list[Result]:
+    """
+    Time new dicognito processes reporting their version, and anonymizing a single file of the corpus.
+
+    Each run starts a new Python interpreter, so the times include importing
+    dicognito and its dependencies, as they would for a script that runs
+    dicognito once per study.
+    """
+    with tempfile.TemporaryDirectory(prefix="dicognito-benchmark-output-") as output_root:
+        output_directory = os.path.join(output_root, "out")
+
+        def remove_output() -> None:
+            shutil.rmtree(output_directory, ignore_errors=True)
+
+        def run(*arguments: str) -> None:
+            subprocess.run((sys.executable, "-m", "dicognito", *arguments), check=True, stdout=subprocess.DEVNULL)
+
+        results = []
+        for name, arguments in (
+            ("startup --version", ("--version",)),
+            ("startup one file", (filename, "--output-directory", output_directory, "--quiet", "--seed", SEED)),
+        ):
+            best, mean = _time(functools.partial(run, *arguments), remove_output, repeats)
+            results.append(Result(corpus, name, 1, repeats, best, mean))
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Describe the environment the benchmarks ran in."""
+    return {
+        "dicognito": dicognito.__version__,
+        "pydicom": pydicom.__version__,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def to_json_object(results: Sequence[Result]) -> dict[str, Any]:
+    """Convert results to an object that can be written as JSON."""
+    return {
+        "environment": environment(),
+        "results": [{**asdict(result), "files_per_second": result.files_per_second} for result in results],
+    }
@@ -1,99 +1,587 @@
-"""Anonymize one or more DICOM files' headers (not pixel data)."""
+"""
+Anonymize one or more DICOM files' headers (not pixel data).
+
+Modules that are slow to import, such as pydicom, are imported only when
+needed, so options like --version and --help respond quickly.
+"""
 
 from __future__ import annotations
 
+import collections
+import contextlib
 import glob
+import hashlib
+import json
 import logging
 import os.path
 import sys
+import time
 from typing import TYPE_CHECKING
 
-import pydicom
-
+import dicognito
 from dicognito._config import parse_arguments
-from dicognito.anonymizer import Anonymizer
-from dicognito.exceptions import TagError
-from dicognito.filters import BurnedInAnnotationGuard, SaveInPlace, SaveToSOPInstanceUID, Summarize
+from dicognito.exceptions import ManifestError, StreamError, TagError
+from dicognito.filters import (
+    BurnedInAnnotationGuard,
+    RecordInManifest,
+    SaveInPlace,
+    SaveToArchive,
+    SaveToSOPInstanceUID,
+    Summarize,
+    WriteToStream,
+)
 from dicognito.pipeline import Pipeline
-from dicognito.value_keeper import ValueKeeper
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    import argparse
+    import concurrent.futures
+    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+    from typing import Any
+
+    import pydicom
+
+    from dicognito.anonymizer import Anonymizer
+    from dicognito.manifest import Manifest
+    from dicognito.mapping_store import MappingStore
+    from dicognito.profiling import Profile
+
+
+def _get_directory_id(directory: str) -> tuple[int, int]:
+    stat = os.stat(directory)
+    return (stat.st_dev, stat.st_ino)
+
+
+def _get_filenames_from_directory(directory: str, excluded_directories: Collection[tuple[int, int]]) -> Iterator[str]:
+    # Walk depth-first, holding one open scandir iterator per level, so memory
+    # is bounded by the depth of the tree rather than by its size.
+    # Like os.walk, don't follow symbolic links to directories, and skip
+    # directories that can't be read. Also skip files that are still being
+    # written, such as when anonymizing in place.
+    from dicognito.header_only import TEMPORARY_FILE_SUFFIX
 
+    if excluded_directories and _get_directory_id(directory) in excluded_directories:
+        return
+    try:
+        scanners = [os.scandir(directory)]
+    except OSError:
+        return
+    try:
+        while scanners:
+            entry = next(scanners[-1], None)
+            if entry is None:
+                scanners.pop().close()
+            elif not entry.is_dir():
+                if not entry.name.endswith(TEMPORARY_FILE_SUFFIX):
+                    yield entry.path
+            elif not entry.is_symlink() and not (
+                excluded_directories and _get_directory_id(entry.path) in excluded_directories
+            ):
+                try:
+                    scanners.append(os.scandir(entry.path))
+                except OSError:
+                    continue
+    finally:
+        for scanner in scanners:
+            scanner.close()
 
-def _get_filenames_from_source(source: str) -> Iterable[str]:
-    if os.path.isfile(source):
-        yield source
+
+def _get_filenames_from_source(source: str, excluded_directories: Collection[tuple[int, int]]) -> Iterator[str]:
+    from dicognito import streams
+
+    if source == streams.STREAM_NAME:
+        yield from streams.read_members(sys.stdin.buffer)
+    elif os.path.isfile(source):
+        from dicognito import archives
+
+        if archives.is_archive(source):
+            yield from archives.read_members(source)
+        else:
+            yield source
     elif os.path.isdir(source):
-        for dirpath, _, filenames in os.walk(source):
-            for filename in filenames:
-                yield os.path.join(dirpath, filename)
+        yield from _get_filenames_from_directory(source, excluded_directories)
     else:
-        for expanded_source in glob.glob(source):
-            for filename in _get_filenames_from_source(expanded_source):
-                yield filename
+        # Only archives named as sources are read as archives. Like those in
+        # directories, archives matched by globs are treated as any other file.
+        for expanded_source in glob.iglob(source):
+            if os.path.isdir(expanded_source):
+                yield from _get_filenames_from_directory(expanded_source, excluded_directories)
+            else:
+                yield expanded_source
 
 
-def _get_filenames_from_sources(sources: Iterable[str]) -> Iterable[str]:
+def _get_filenames_from_sources(sources: Iterable[str], excluded_directories: Iterable[str] = ()) -> Iterator[str]:
+    """
+    Find the files to anonymize, as they are needed.
+
+    Files in excluded_directories (typically the output directory) are never
+    found, so newly-written anonymized files are not anonymized again.
+    """
+    excluded_directory_ids = {_get_directory_id(directory) for directory in excluded_directories}
     for source in sources:
-        yield from _get_filenames_from_source(source)
+        yield from _get_filenames_from_source(source, excluded_directory_ids)
+
+
+def _read_dataset(filename: str) -> pydicom.dataset.FileDataset:
+    import pydicom
 
+    from dicognito.archives import ArchiveMember
 
-def _get_datasets_from_sources(sources: Iterable[str]) -> Iterable[pydicom.dataset.Dataset]:
-    for filename in list(_get_filenames_from_sources(sources)):
+    if isinstance(filename, ArchiveMember):
+        return filename.read_dataset()
+    return pydicom.dcmread(filename, force=False)
+
+
+def _read_header(filename: str) -> pydicom.dataset.FileDataset:
+    from dicognito import header_only
+    from dicognito.archives import ArchiveMember
+
+    # Archive members' pixel data can't be copied from the original file later, so read them completely.
+    if isinstance(filename, ArchiveMember):
+        return filename.read_dataset()
+    return header_only.read_header(filename)
+
+
+def _read_file(
+    filename: str,
+    read_dataset: Callable[[str], pydicom.dataset.FileDataset],
+) -> tuple[pydicom.dataset.FileDataset | None, float]:
+    """Read a file, returning its dataset (or None if it's not DICOM) and the seconds taken to read it."""
+    import pydicom
+
+    start = time.perf_counter()
+    try:
+        dataset = read_dataset(filename)
+    except pydicom.errors.InvalidDicomError:
+        logging.info("File %s appears not to be DICOM. Skipping.", filename)
+        dataset = None
+    return dataset, time.perf_counter() - start
+
+
+def _get_datasets_from_filenames(
+    filenames: Iterable[str],
+    read_dataset: Callable[[str], pydicom.dataset.FileDataset] = _read_dataset,
+) -> Iterator[tuple[pydicom.dataset.FileDataset, float]]:
+    for filename in filenames:
+        dataset, read_seconds = _read_file(filename, read_dataset)
+        if dataset is not None:
+            yield dataset, read_seconds
+
+
+def _get_shard_key(filename: str, shard_by: str) -> str:
+    if shard_by == "study":
+        import pydicom
+
+        from dicognito.archives import ArchiveMember
+
+        # Only the StudyInstanceUID is parsed. Other values are skipped over, and pixel data is never reached.
         try:
-            with pydicom.dcmread(filename, force=False) as dataset:
-                yield dataset
-        except pydicom.errors.InvalidDicomError:  # noqa: PERF203
-            logging.info("File %s appears not to be DICOM. Skipping.", filename)
+            study_instance_uid = pydicom.dcmread(
+                filename.open() if isinstance(filename, ArchiveMember) else filename,
+                stop_before_pixels=True,
+                specific_tags=["StudyInstanceUID"],
+            ).get("StudyInstanceUID")
+        except (pydicom.errors.InvalidDicomError, OSError):
+            study_instance_uid = None
+        if study_instance_uid:
+            return str(study_instance_uid)
+    return filename
 
 
-def main(main_args: Sequence[str] | None = None) -> None:
-    """Run the anonymizer."""
-    if main_args is None:
-        main_args = sys.argv[1:]
+def _is_in_shard(filename: str, shard: tuple[int, int], shard_by: str) -> bool:
+    """Determine whether a file belongs to a shard, using a hash that is the same in every process and on every host."""
+    (shard_number, shard_count) = shard
+    key_hash = hashlib.blake2b(_get_shard_key(filename, shard_by).encode("utf8"), digest_size=8).digest()
+    return int.from_bytes(key_hash, "big") % shard_count == shard_number - 1
+
+
+def _get_filenames_from_arguments(args: argparse.Namespace, manifest: Manifest | None) -> Iterator[str]:
+    excluded_directories = [args.output_directory] if args.output_directory else []
+    filenames = _get_filenames_from_sources(args.sources, excluded_directories)
+    if args.shard is not None:
+        filenames = (filename for filename in filenames if _is_in_shard(filename, args.shard, args.shard_by))
+    if manifest is not None and args.resume:
+        filenames = (filename for filename in filenames if not manifest.is_done(filename))
+    return filenames
 
-    args = parse_arguments(main_args)
 
-    numeric_level = getattr(logging, args.log_level.upper(), None)
+def _configure_logging(log_level: str) -> None:
+    numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
-        msg = f"Invalid log level: {args.log_level}"
+        msg = f"Invalid log level: {log_level}"
         raise ValueError(msg)  # noqa: TRY004
     logging.basicConfig(format="", level=numeric_level)
 
-    if not args.in_place and not args.output_directory:
-        logging.warning(
-            "Neither --output-directory/-o nor --in-place/-i were specified. This will be an error in the future.",
-        )
 
-    anonymizer = Anonymizer(id_prefix=args.id_prefix, id_suffix=args.id_suffix, seed=args.seed)
-    if args.keep_elements:
-        try:
-            for keep_element in args.keep_elements:
-                anonymizer.add_element_handler(ValueKeeper(keep_element))
-        except TagError as e:
-            print(f"Error when attempting to keep element value: {e}", file=sys.stderr)
-            sys.exit(1)
+def _open_mapping_store(args: argparse.Namespace) -> contextlib.AbstractContextManager[MappingStore | None]:
+    from dicognito.mapping_store import MappingStore
+
+    return MappingStore(args.mapping_store) if args.mapping_store else contextlib.nullcontext()
+
+
+def _build_anonymizer(args: argparse.Namespace, seed: str | None, mapping_store: MappingStore | None) -> Anonymizer:
+    from dicognito.anonymizer import Anonymizer
+    from dicognito.value_keeper import ValueKeeper
+
+    anonymizer = Anonymizer(
+        id_prefix=args.id_prefix,
+        id_suffix=args.id_suffix,
+        seed=seed,
+        hash_algorithm=args.hash_algorithm,
+        mapping_store=mapping_store,
+    )
+    for keep_element in args.keep_elements or ():
+        anonymizer.add_element_handler(ValueKeeper(keep_element))
+    if args.profile is not None:
+        anonymizer.enable_profiling()
+    return anonymizer
+
+
+def _get_configuration(args: argparse.Namespace, seed: str) -> dict[str, Any]:
+    """Describe the options that affect how files are anonymized, to be recorded in a manifest."""
+    return {
+        "dicognito": dicognito.__version__,
+        "seed": seed,
+        "hash_algorithm": args.hash_algorithm,
+        "id_prefix": args.id_prefix,
+        "id_suffix": args.id_suffix,
+        "keep_elements": args.keep_elements or [],
+        "header_only": args.header_only,
+        "overwrite_header": args.overwrite_header,
+        "output_directory": args.output_directory and os.path.abspath(args.output_directory),
+        "output_archive": args.output_archive and os.path.abspath(args.output_archive),
+        "output_layout": args.output_layout,
+        "assume_burned_in_annotation": args.assume_burned_in_annotation,
+        "on_burned_in_annotation": args.on_burned_in_annotation,
+        "mapping_store": args.mapping_store and os.path.abspath(args.mapping_store),
+        "shard": args.shard and list(args.shard),
+        "shard_by": args.shard_by,
+    }
+
 
+def _open_manifest(args: argparse.Namespace) -> Manifest | None:
+    from dicognito.manifest import Manifest
+
+    return Manifest(args.manifest) if args.manifest else None
+
+
+def _start_or_resume_run(args: argparse.Namespace, manifest: Manifest, seed: str, *, resuming: bool) -> None:
+    configuration = _get_configuration(args, seed)
+    if not resuming:
+        manifest.start(configuration)
+        return
+    try:
+        manifest.resume(configuration)
+    except ManifestError as e:
+        print(f"Cannot resume the run recorded in {args.manifest}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _build_pipeline(args: argparse.Namespace, manifest: Manifest | None) -> tuple[Pipeline, Summarize | None]:
+    save: SaveToSOPInstanceUID | SaveToArchive | WriteToStream | SaveInPlace
+    if args.output_directory:
+        save = SaveToSOPInstanceUID(args.output_directory, args.output_layout)
+    elif args.output_archive:
+        save = SaveToArchive(args.output_archive, args.output_layout)
+    elif args.output_stream:
+        save = WriteToStream(sys.stdout.buffer)
+    else:
+        save = SaveInPlace(overwrite_header=args.overwrite_header)
     pipeline = Pipeline()
+    if manifest is not None:
+        pipeline.add(RecordInManifest(manifest, save.output_filename))
     pipeline.add(BurnedInAnnotationGuard(args.assume_burned_in_annotation, args.on_burned_in_annotation))
-    if not args.quiet:
-        pipeline.add(Summarize())
-    pipeline.add(args.output_directory and SaveToSOPInstanceUID(args.output_directory) or SaveInPlace())
+    summarize = None
+    if (not args.quiet and not args.output_stream) or args.summary_file:
+        summarize = Summarize(args.summary_format, args.summary_file)
+        pipeline.add(summarize)
+    pipeline.add(save)
+    return pipeline, summarize
 
-    pipeline.before_any()
 
-    for dataset in _get_datasets_from_sources(args.sources):
+def _get_dataset_reader(args: argparse.Namespace) -> Callable[[str], pydicom.dataset.FileDataset]:
+    return _read_header if args.header_only else _read_dataset
+
+
+def _anonymize_dataset(dataset: pydicom.dataset.Dataset, anonymizer: Anonymizer, pipeline: Pipeline) -> float:
+    """Run the pipeline's before_each stage and anonymize the dataset, returning the seconds taken."""
+    start = time.perf_counter()
+    pipeline.before_each(dataset)
+    anonymizer.anonymize(dataset)
+    return time.perf_counter() - start
+
+
+def _finish_dataset(
+    dataset: pydicom.dataset.Dataset,
+    pipeline: Pipeline,
+    profile: Profile | None,
+    read_seconds: float,
+    anonymize_seconds: float,
+) -> None:
+    """Run the pipeline's after_each stage (which typically writes the dataset) and profile the file."""
+    start = time.perf_counter()
+    pipeline.after_each(dataset)
+    if profile is not None:
+        profile.add_file(dataset.filename, read_seconds, anonymize_seconds, time.perf_counter() - start)
+
+
+def _anonymize_serially(
+    args: argparse.Namespace,
+    anonymizer: Anonymizer,
+    pipeline: Pipeline,
+    filenames: Iterable[str],
+) -> int:
+    """Anonymize the files one at a time, returning the number that couldn't be converted."""
+    read_dataset = _get_dataset_reader(args)
+    failure_count = 0
+    for filename in filenames:
         try:
-            pipeline.before_each(dataset)
-            anonymizer.anonymize(dataset)
-            pipeline.after_each(dataset)
+            dataset, read_seconds = _read_file(filename, read_dataset)
+            if dataset is not None:
+                anonymize_seconds = _anonymize_dataset(dataset, anonymizer, pipeline)
+                _finish_dataset(dataset, pipeline, anonymizer.profile, read_seconds, anonymize_seconds)
         except Exception:  # noqa: PERF203
-            logging.exception("Error occurred while converting %s. Aborting.", dataset.filename)
-            sys.exit(1)
+            logging.exception("Error occurred while converting %s. Skipping.", filename)
+            failure_count += 1
+    return failure_count
+
+
+class _OverlappedAnonymizer:
+    """
+    Anonymizes files while others are being read and written.
+
+    Files are read ahead by a pool of threads and, after anonymization on
+    the calling thread, handed to a single writer thread that runs the
+    pipeline's after_each stage, which writes them. The after_each stages run
+    one at a time, in the order the datasets were anonymized, but may overlap
+    later datasets' before_each stages.
+
+    The number of files read but not yet anonymized, and the number of files
+    anonymized but not yet written, are each bounded, so memory use is
+    limited no matter how quickly files can be read or written.
+
+    Files that can't be converted are logged and skipped, and counted in
+    failure_count.
+    """
+
+    def __init__(self, args: argparse.Namespace, anonymizer: Anonymizer, pipeline: Pipeline) -> None:
+        import concurrent.futures
+
+        self.anonymizer = anonymizer
+        self.pipeline = pipeline
+        self.read_dataset = _get_dataset_reader(args)
+        self.max_pending = args.io_threads * 4
+        self.readers = concurrent.futures.ThreadPoolExecutor(args.io_threads, thread_name_prefix="dicognito-read")
+        self.writers = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="dicognito-write")
+        self.reads: collections.deque[
+            tuple[str, concurrent.futures.Future[tuple[pydicom.dataset.FileDataset | None, float]]]
+        ] = collections.deque()
+        self.writes: collections.deque[tuple[str, concurrent.futures.Future[None]]] = collections.deque()
+        self.failure_count = 0
+
+    def anonymize_files(self, filenames: Iterable[str]) -> int:
+        """Anonymize the files, returning the number that couldn't be converted."""
+        with self.readers, self.writers:
+            for filename in filenames:
+                self.reads.append((filename, self.readers.submit(_read_file, filename, self.read_dataset)))
+                if len(self.reads) >= self.max_pending:
+                    self._anonymize_oldest_read()
+            while self.reads:
+                self._anonymize_oldest_read()
+            while self.writes:
+                self._finish_oldest_write()
+        return self.failure_count
+
+    def _anonymize_oldest_read(self) -> None:
+        filename, read = self.reads.popleft()
+        try:
+            dataset, read_seconds = read.result()
+            if dataset is None:
+                return
+            anonymize_seconds = _anonymize_dataset(dataset, self.anonymizer, self.pipeline)
+        except Exception:
+            logging.exception("Error occurred while converting %s. Skipping.", filename)
+            self.failure_count += 1
+            return
+        write = self.writers.submit(
+            _finish_dataset,
+            dataset,
+            self.pipeline,
+            self.anonymizer.profile,
+            read_seconds,
+            anonymize_seconds,
+        )
+        self.writes.append((filename, write))
+        if len(self.writes) >= self.max_pending:
+            self._finish_oldest_write()
+
+    def _finish_oldest_write(self) -> None:
+        filename, write = self.writes.popleft()
+        try:
+            write.result()
+        except Exception:
+            logging.exception("Error occurred while converting %s. Skipping.", filename)
+            self.failure_count += 1
+
+
+class _Worker:
+    """Anonymizes files in a worker process, using the per-dataset stages of its own pipeline."""
+
+    def __init__(self, args: argparse.Namespace, seed: str) -> None:
+        from dicognito.mapping_store import MappingStore
+
+        self.mapping_store = MappingStore(args.mapping_store) if args.mapping_store else None
+        self.anonymizer = _build_anonymizer(args, seed, self.mapping_store)
+        self.pipeline, self.summarize = _build_pipeline(args, _open_manifest(args))
+        self.read_dataset = _get_dataset_reader(args)
+
+    def anonymize_file(self, filename: str) -> tuple[dict[tuple[str, str, str], int], Profile | None]:
+        for dataset, read_seconds in _get_datasets_from_filenames((filename,), self.read_dataset):
+            anonymize_seconds = _anonymize_dataset(dataset, self.anonymizer, self.pipeline)
+            _finish_dataset(dataset, self.pipeline, self.anonymizer.profile, read_seconds, anonymize_seconds)
+
+        # The worker process may be stopped without warning, so don't hold new mappings.
+        if self.mapping_store is not None:
+            self.mapping_store.flush()
+
+        summary_counts = {} if self.summarize is None else self.summarize.pop_counts()
+        profile = self.anonymizer.profile
+        if profile is not None:
+            self.anonymizer.enable_profiling()
+        return summary_counts, profile
+
+
+_worker: _Worker
+
+
+def _initialize_worker(args: argparse.Namespace, seed: str) -> None:
+    global _worker  # noqa: PLW0603
+    _configure_logging(args.log_level)
+    _worker = _Worker(args, seed)
+
+
+def _anonymize_file_in_worker(filename: str) -> tuple[dict[tuple[str, str, str], int], Profile | None]:
+    return _worker.anonymize_file(filename)
+
+
+def _anonymize_in_parallel(
+    args: argparse.Namespace,
+    filenames: Iterable[str],
+    seed: str,
+    summarize: Summarize | None,
+    profile: Profile | None,
+) -> int:
+    """Anonymize the files in worker processes, returning the number that couldn't be converted."""
+    import concurrent.futures
+
+    # Bound the number of files submitted but not yet finished, rather than
+    # creating a future for every file up front.
+    max_pending = args.jobs * 4
+    pending: collections.deque[
+        tuple[str, concurrent.futures.Future[tuple[dict[tuple[str, str, str], int], Profile | None]]]
+    ] = collections.deque()
+    failure_count = 0
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=_initialize_worker,
+        initargs=(args, seed),
+    ) as executor:
+
+        def finish_oldest() -> None:
+            nonlocal failure_count
+            filename, future = pending.popleft()
+            try:
+                summary_counts, file_profile = future.result()
+            except Exception:
+                logging.exception("Error occurred while converting %s. Skipping.", filename)
+                failure_count += 1
+                return
+            if summarize is not None:
+                summarize.merge(summary_counts)
+            if profile is not None and file_profile is not None:
+                profile.merge(file_profile)
+
+        for filename in filenames:
+            pending.append((filename, executor.submit(_anonymize_file_in_worker, filename)))
+            if len(pending) >= max_pending:
+                finish_oldest()
+        while pending:
+            finish_oldest()
+    return failure_count
+
+
+def _report_profile(profile: Profile, output_filename: str, *, output_stream: bool) -> None:
+    if output_filename:
+        with open(output_filename, "w") as output_file:
+            json.dump(profile.to_json_object(), output_file, indent=2)
+    else:
+        # Don't mix the report into anonymized instances written to standard output.
+        print(profile.report(), file=sys.stderr if output_stream else sys.stdout)
+
+
+def _run(args: argparse.Namespace, mapping_store: MappingStore | None) -> None:
+    manifest = _open_manifest(args)
+    resumed_configuration = manifest.configuration if manifest is not None and args.resume else None
+    seed = args.seed
+    if seed is None and resumed_configuration is not None:
+        seed = resumed_configuration["seed"]
+
+    try:
+        anonymizer = _build_anonymizer(args, seed, mapping_store)
+    except TagError as e:
+        print(f"Error when attempting to keep element value: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if manifest is not None:
+        _start_or_resume_run(args, manifest, anonymizer.seed, resuming=resumed_configuration is not None)
+
+    pipeline, summarize = _build_pipeline(args, manifest)
+    filenames = _get_filenames_from_arguments(args, manifest)
+
+    pipeline.before_any()
+
+    try:
+        if args.jobs > 1:
+            failure_count = _anonymize_in_parallel(args, filenames, anonymizer.seed, summarize, anonymizer.profile)
+        elif args.io_threads > 0 and not args.output_stream:
+            failure_count = _OverlappedAnonymizer(args, anonymizer, pipeline).anonymize_files(filenames)
+        else:
+            # Instances written to standard output are written in the order they were read.
+            failure_count = _anonymize_serially(args, anonymizer, pipeline, filenames)
+    except StreamError as e:
+        print(f"Cannot read DICOM objects from standard input: {e}", file=sys.stderr)
+        sys.exit(1)
 
     pipeline.after_all()
 
+    if manifest is not None:
+        manifest.close()
+
+    if anonymizer.profile is not None:
+        _report_profile(anonymizer.profile, args.profile, output_stream=args.output_stream)
+
+    if failure_count:
+        logging.error("%d file(s) could not be converted.", failure_count)
+        sys.exit(1)
+
+
+def main(main_args: Sequence[str] | None = None) -> None:
+    """Run the anonymizer."""
+    if main_args is None:
+        main_args = sys.argv[1:]
+
+    args = parse_arguments(main_args)
+
+    _configure_logging(args.log_level)
+
+    if not args.in_place and not args.output_directory and not args.output_archive and not args.output_stream:
+        logging.warning(
+            "Neither --output-directory/-o nor --in-place/-i were specified. This will be an error in the future.",
+        )
+
+    with _open_mapping_store(args) as mapping_store:
+        _run(args, mapping_store)
+
 
 if __name__ == "__main__":
     main()
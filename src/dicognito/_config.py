@@ -4,11 +4,9 @@ import argparse
 import sys
 from typing import TYPE_CHECKING
 
-import pydicom
-
 import dicognito
-from dicognito.anonymizer import Anonymizer
-from dicognito.filters import BurnedInAnnotationGuard
+from dicognito.filters import BurnedInAnnotationGuard, SaveToSOPInstanceUID, Summarize
+from dicognito.randomizer import Randomizer
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -39,6 +37,8 @@ class WhatIfAction(argparse.Action):
         values: str | Sequence[Any] | None,  # noqa: ARG002
         option_string: str | None = None,  # noqa: ARG002
     ) -> None:
+        from dicognito.anonymizer import Anonymizer
+
         print(Anonymizer().describe_actions())
         parser.exit()
 
@@ -68,6 +68,7 @@ class VersionAction(argparse.Action):
         values: str | Sequence[Any] | None,  # noqa: ARG002
         option_string: str | None = None,  # noqa: ARG002
     ) -> None:
+        import importlib.metadata
         import platform
 
         def print_table(version_rows: Sequence[tuple[str, str]]) -> None:
@@ -82,13 +83,47 @@ class VersionAction(argparse.Action):
             ("platform", platform.platform()),
             ("Python", sys.version),
             ("dicognito", dicognito.__version__),
-            ("pydicom", pydicom.__version__),
+            # Read the installed version rather than importing pydicom, which is slow.
+            ("pydicom", importlib.metadata.version("pydicom")),
         ]
 
         print_table(version_rows)
         parser.exit()
 
 
+def _positive_int(value: str) -> int:
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        msg = f"invalid positive integer value: '{value}'"
+        raise argparse.ArgumentTypeError(msg)
+    return result
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        result = int(value)
+    except ValueError:
+        result = -1
+    if result < 0:
+        msg = f"invalid non-negative integer value: '{value}'"
+        raise argparse.ArgumentTypeError(msg)
+    return result
+
+
+def _shard(value: str) -> tuple[int, int]:
+    try:
+        (shard_number, shard_count) = map(int, value.split("/"))
+    except ValueError:
+        shard_number = shard_count = 0
+    if not 1 <= shard_number <= shard_count:
+        msg = f"invalid shard: '{value}'. Must be i/N, where 1 <= i <= N"
+        raise argparse.ArgumentTypeError(msg)
+    return (shard_number, shard_count)
+
+
 def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -96,8 +131,13 @@ def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
         metavar="source",
         type=str,
         nargs="+",
-        help="The directories or file globs (e.g. *.dcm) to anonymize. Directories "
-        "will be recursed, and all files found within will be anonymized.",
+        help="The directories, file globs (e.g. *.dcm), or tar or zip archives to anonymize. "
+        "Directories will be recursed, and all files found within will be anonymized. "
+        "Archives named as sources have their members read without extracting them to disk; "
+        "archives found in directories or by globs are not read. "
+        "Use - to read DICOM objects from standard input, each preceded by its length as an "
+        "8-byte big-endian integer. Unless --output-directory or --output-archive is given, "
+        "the anonymized objects are then written to standard output the same way, in order.",
     )
     output_location_group = parser.add_mutually_exclusive_group()
     output_location_group.add_argument(
@@ -108,6 +148,21 @@ def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
         help="Write anonymized files to OUTPUT_DIRECTORY. The output filename will be "
         "the new SOP Instance UID. OUTPUT_DIRECTORY will be created if necessary.",
     )
+    output_location_group.add_argument(
+        "--output-archive",
+        metavar="ARCHIVE",
+        help="Write anonymized files into a new tar or zip archive, ARCHIVE, replacing any "
+        "existing file. The archive type is chosen by the name's suffix: .zip, .tar, or a "
+        "compressed tar such as .tar.gz.",
+    )
+    parser.add_argument(
+        "--output-layout",
+        default=SaveToSOPInstanceUID.LAYOUTS[0],
+        choices=SaveToSOPInstanceUID.LAYOUTS,
+        help="How to arrange anonymized files in OUTPUT_DIRECTORY or ARCHIVE: all at the top level (flat), "
+        "in subdirectories named by a hash of the SOP Instance UID (hash), "
+        "or in PatientID/StudyInstanceUID/SeriesInstanceUID subdirectories (hierarchy).",
+    )
     output_location_group.add_argument(
         "--in-place",
         "-i",
@@ -116,6 +171,21 @@ def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
         "anonymizing the same files will cause date elements to move farther into "
         "the past.",
     )
+    parser.add_argument(
+        "--header-only",
+        action="store_true",
+        help="Read and rewrite only each file's header. Pixel data is copied "
+        "directly from the original file, without being loaded, which is much "
+        "faster for large files.",
+    )
+    parser.add_argument(
+        "--overwrite-header",
+        action="store_true",
+        help="With --in-place and --header-only, write each anonymized header over the "
+        "original one, without rewriting the pixel data, if the new header is no longer "
+        "than the original. Shorter headers are padded with a private element. "
+        "Files whose headers don't fit are replaced as usual.",
+    )
     parser.add_argument(
         "--id-prefix",
         "-p",
@@ -166,7 +236,20 @@ def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
         "--quiet",
         "-q",
         action="store_true",
-        help="Reduce the verbosity of output. Suppresses summary of anonymized studies.",
+        help="Reduce the verbosity of output. Suppresses summary of anonymized studies, "
+        "unless it is written to a file with --summary-file.",
+    )
+    parser.add_argument(
+        "--summary-format",
+        default=Summarize.FORMATS[0],
+        choices=Summarize.FORMATS,
+        help="The format of the summary of anonymized studies. "
+        "csv and json include the number of instances of each study.",
+    )
+    parser.add_argument(
+        "--summary-file",
+        metavar="FILE",
+        help="Write the summary of anonymized studies to FILE instead of printing it.",
     )
     parser.add_argument(
         "--log-level",
@@ -183,7 +266,130 @@ def parse_arguments(main_args: Sequence[str]) -> argparse.Namespace:
         "Omitting this value allows dicognito to generate its own random seed, which "
         "may be slightly more secure, but does not support reproducible anonymization.",
     )
+    parser.add_argument(
+        "--hash-algorithm",
+        action="store",
+        type=str,
+        default=Randomizer.HASH_ALGORITHMS[0],
+        choices=Randomizer.HASH_ALGORITHMS,
+        help="The hash algorithm used to generate anonymized element values. "
+        "md5 is fastest; blake2b is a stronger hash, keyed by the seed. "
+        "Anonymized values are only reproducible using the same seed and hash algorithm.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        action="store",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Anonymize files using N worker processes. All workers share the same seed, "
+        "so the results are identical to those of a single-process run.",
+    )
+    parser.add_argument(
+        "--shard",
+        action="store",
+        type=_shard,
+        metavar="i/N",
+        help="Split the files among N separate runs, perhaps on different hosts, and anonymize only "
+        "those in the i-th part (counting from 1). Requires --seed, and every run must be given the "
+        "same sources and seed. Together, the N runs produce the same output as a single run would.",
+    )
+    parser.add_argument(
+        "--shard-by",
+        action="store",
+        choices=("path", "study"),
+        default="path",
+        help="How to assign files to shards when --shard is given: by the path of the file, or by "
+        "the StudyInstanceUID read from its header, so all of a study's files are anonymized by "
+        "the same run.",
+    )
+    parser.add_argument(
+        "--mapping-store",
+        action="store",
+        metavar="FILE",
+        help="Record the replacement chosen for each ID, UI, and PN value in the SQLite database FILE. "
+        "Values recorded by earlier runs are given the same replacements again, whatever the seed.",
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store",
+        metavar="FILE",
+        help="Record each anonymized file, and the configuration (including the seed) used, "
+        "in the SQLite database FILE, so an interrupted run can be resumed with --resume.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the run recorded in the --manifest, skipping files that were already "
+        "anonymized. The recorded seed is used unless --seed is given. Fails if the "
+        "configuration differs from that of the recorded run.",
+    )
+    parser.add_argument(
+        "--io-threads",
+        action="store",
+        type=_non_negative_int,
+        default=0,
+        metavar="N",
+        help="Read files using N threads, and write them on another thread, so files are read and "
+        "written while others are anonymized. By default, or with 0, files are read, anonymized, "
+        "and written one at a time. Ignored when --jobs is greater than 1.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="Record how long each element handler takes, how many elements it "
+        "claims, and how long reading, anonymizing, and writing take, in total "
+        "and for the slowest files. "
+        "The report is printed, or written as JSON to FILE if one is given.",
+    )
     parser.add_argument("--what-if", action=WhatIfAction)
     parser.add_argument("--version", action=VersionAction)
 
-    return parser.parse_args(main_args)
+    args = parser.parse_args(main_args)
+    if args.resume and not args.manifest:
+        parser.error("argument --resume: requires --manifest")
+    if args.overwrite_header and not (args.in_place and args.header_only):
+        parser.error("argument --overwrite-header: requires --in-place and --header-only")
+    if args.shard and args.seed is None:
+        # Without a shared seed, each shard's run would choose its own, and replace values differently.
+        parser.error("argument --shard: requires --seed")
+    _check_archive_arguments(parser, args)
+    _check_stream_arguments(parser, args)
+    return args
+
+
+def _check_archive_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from dicognito import archives
+
+    if args.output_archive:
+        if not archives.is_archive(args.output_archive):
+            parser.error(
+                f"argument --output-archive: must end with one of {', '.join(archives.ARCHIVE_SUFFIXES)}",
+            )
+        if args.jobs > 1:
+            parser.error("argument --output-archive: not allowed with --jobs greater than 1")
+        if args.manifest:
+            parser.error("argument --manifest: not allowed with --output-archive")
+    if any(archives.is_archive(source) for source in args.sources):
+        if not args.output_directory and not args.output_archive:
+            parser.error("archive sources require --output-directory or --output-archive")
+        if args.manifest:
+            parser.error("argument --manifest: not allowed with archive sources")
+
+
+def _check_stream_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from dicognito.streams import STREAM_NAME
+
+    args.output_stream = False
+    if STREAM_NAME not in args.sources:
+        return
+    if args.in_place:
+        parser.error(f"argument --in-place: not allowed with source {STREAM_NAME}")
+    if args.manifest:
+        parser.error(f"argument --manifest: not allowed with source {STREAM_NAME}")
+    args.output_stream = not args.output_directory and not args.output_archive
+    if args.output_stream and args.jobs > 1:
+        parser.error("argument --jobs: must be 1 when writing to standard output")
@@ -0,0 +1,73 @@
+"""Load the tables of values used to build replacement names and addresses."""
+
+from __future__ import annotations
+
+import functools
+import importlib.resources
+import itertools
+
+
+@functools.cache
+def _load_tables() -> dict[str, tuple[str, ...]]:
+    tables: dict[str, list[str]] = {}
+    table: list[str] = []
+    text = importlib.resources.files("dicognito").joinpath("tables.txt").read_text(encoding="utf-8")
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("["):
+            table = tables.setdefault(line.strip("[]"), [])
+        else:
+            table.append(line)
+    return {name: tuple(values) for name, values in tables.items()}
+
+
+def load_table(name: str) -> tuple[str, ...]:
+    """
+    Get one of the tables of values.
+
+    The tables are read from the package's tables.txt the first time any
+    of them is needed.
+
+    Parameters
+    ----------
+    name : str
+        The name of the table, such as "last_names" or "cities".
+
+    Returns
+    -------
+    The table's values, in order.
+
+    """
+    return _load_tables()[name]
+
+
+class Table:
+    """
+    A class attribute holding the values of one or more tables, loaded the first time it's used.
+
+    Examples
+    --------
+    >>> class Names:
+    >>>     _first_names = Table("female_first_names", "male_first_names")
+
+    """
+
+    def __init__(self, *names: str) -> None:
+        """
+        Create a new Table.
+
+        Parameters
+        ----------
+        names : str
+            The names of the tables whose values, in order, make up this one.
+
+        """
+        self._names = names
+        self._values: tuple[str, ...] | None = None
+
+    def __get__(self, instance: object, owner: type | None = None) -> tuple[str, ...]:
+        """Get the values, loading them if necessary."""
+        if self._values is None:
+            self._values = tuple(itertools.chain.from_iterable(load_table(name) for name in self._names))
+        return self._values
@@ -1,9 +1,11 @@
 """Replace AD values with something that obscures the patient's identity."""
 
-from collections.abc import Iterator
+import functools
+from collections.abc import Collection, Iterator, Sequence
 
 import pydicom
 
+from dicognito._tables import Table
 from dicognito.element_anonymizer import ElementAnonymizer
 from dicognito.randomizer import Randomizer
 
@@ -72,224 +74,69 @@ class AddressAnonymizer(ElementAnonymizer):
             for keyword in map(pydicom.datadict.keyword_for_tag, self._value_factories.keys())
         )
 
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return self._value_factories.keys()
+
     def get_street_address(self, original_value: str) -> str:
         """Generate a new street address based on an original value."""
-        (street_number_index, street_index) = self.randomizer.get_ints_from_ranges(
+        indices = self.randomizer.get_ints_from_ranges(original_value, *self._street_address_ranges)
+        return self._street_address_from_indices(indices)
+
+    def get_region(self, original_value: str) -> str:
+        """Generate a new region based on an original value."""
+        indices = self.randomizer.get_ints_from_ranges(original_value, *self._region_ranges)
+        return self._region_from_indices(indices)
+
+    def get_country(self, original_value: str) -> str:
+        """Generate a new country based on an original value."""
+        indices = self.randomizer.get_ints_from_ranges(original_value, *self._country_ranges)
+        return self._country_from_indices(indices)
+
+    def get_address(self, original_value: str) -> tuple[str, str, str]:
+        """
+        Generate a new street address, region, and country based on an original value.
+
+        The parts are the same as those generated by get_street_address,
+        get_region, and get_country, but the original value is hashed only once.
+        """
+        (street_address_indices, region_indices, country_indices) = self.randomizer.get_ints_from_range_groups(
             original_value,
-            1000,
-            len(self._streets),
+            self._street_address_ranges,
+            self._region_ranges,
+            self._country_ranges,
+        )
+        return (
+            self._street_address_from_indices(street_address_indices),
+            self._region_from_indices(region_indices),
+            self._country_from_indices(country_indices),
         )
+
+    def _street_address_from_indices(self, indices: Sequence[int]) -> str:
+        (street_number_index, street_index) = indices
         street_number = street_number_index + 1
         return f"{street_number} {self._streets[street_index]}"
 
-    def get_region(self, original_value: str) -> str:
-        """Generate a new region based on an original value."""
-        (city_index,) = self.randomizer.get_ints_from_ranges(original_value, len(self._cities))
+    def _region_from_indices(self, indices: Sequence[int]) -> str:
+        (city_index,) = indices
         return self._cities[city_index]
 
-    def get_country(self, original_value: str) -> str:
-        """Generate a new country based on an original value."""
-        (country_index,) = self.randomizer.get_ints_from_ranges(original_value, len(self._countries))
+    def _country_from_indices(self, indices: Sequence[int]) -> str:
+        (country_index,) = indices
         return self._countries[country_index]
 
-    # from https://www.randomlists.com/random-street-names?qty=100&dup=false, mostly
-    _streets = (
-        "JACKSON STREET",
-        "ROUTE 41",
-        "HILLCREST AVENUE",
-        "5TH STREET",
-        "RIDGE AVENUE",
-        "CREEKSIDE DRIVE",
-        "ORCHARD LANE",
-        "MECHANIC STREET",
-        "3RD STREET NORTH",
-        "CANTERBURY COURT",
-        "ASHLEY COURT",
-        "CYPRESS COURT",
-        "SCHOOL STREET",
-        "FRANKLIN STREET",
-        "RIVER STREET",
-        "COBBLESTONE COURT",
-        "DELAWARE AVENUE",
-        "5TH STREET WEST",
-        "4TH STREET NORTH",
-        "WILLOW LANE",
-        "MYRTLE STREET",
-        "CHESTNUT STREET",
-        "COURT STREET",
-        "FAIRVIEW ROAD",
-        "WINDING WAY",
-        "IVY LANE",
-        "8TH STREET",
-        "HARRISON AVENUE",
-        "AMHERST STREET",
-        "HUDSON STREET",
-        "FRONT STREET SOUTH",
-        "RAILROAD STREET",
-        "HAWTHORNE AVENUE",
-        "GRANT STREET",
-        "TANGLEWOOD DRIVE",
-        "DOGWOOD DRIVE",
-        "EDGEWOOD DRIVE",
-        "FAWN COURT",
-        "2ND STREET EAST",
-        "SUMMIT STREET",
-        "LAUREL DRIVE",
-        "ANN STREET",
-        "ELMWOOD AVENUE",
-        "CROSS STREET",
-        "WINDSOR COURT",
-        "RIVER ROAD",
-        "VIRGINIA AVENUE",
-        "FOREST AVENUE",
-        "HEATHER LANE",
-        "1ST STREET",
-        "2ND STREET NORTH",
-        "MYRTLE AVENUE",
-        "WOODLAND ROAD",
-        "8TH AVENUE",
-        "BROOKSIDE DRIVE",
-        "SMITH STREET",
-        "MAPLE LANE",
-        "STATE STREET",
-        "HAWTHORNE LANE",
-        "QUEEN STREET",
-        "OVERLOOK CIRCLE",
-        "4TH AVENUE",
-        "JEFFERSON STREET",
-        "HILLTOP ROAD",
-        "INVERNESS DRIVE",
-        "MAGNOLIA COURT",
-        "DOGWOOD LANE",
-        "HENRY STREET",
-        "SPRING STREET",
-        "FRANKLIN COURT",
-        "LOCUST STREET",
-        "YORK STREET",
-        "RIVERSIDE DRIVE",
-        "CEMETERY ROAD",
-        "MAIN STREET",
-        "HIGHLAND DRIVE",
-        "PINE STREET",
-        "LOIS LANE",
-        "CANTERBURY DRIVE",
-        "MAIN STREET EAST",
-        "HARRISON STREET",
-        "CLINTON STREET",
-        "MADISON AVENUE",
-        "2ND STREET WEST",
-        "SUMMIT AVENUE",
-        "WOODLAND AVENUE",
-        "CAMBRIDGE COURT",
-        "SHADY LANE",
-        "GEORGE STREET",
-        "LAUREL STREET",
-        "BRIARWOOD COURT",
-        "IVY COURT",
-        "LAFAYETTE AVENUE",
-        "YORK ROAD",
-        "VALLEY VIEW ROAD",
-        "CREEK ROAD",
-        "SYCAMORE LANE",
-        "PEARL STREET",
-        "11TH STREET",
-        "ROUTE 1",
-    )
+    _streets = Table("streets")
+    _cities = Table("cities")
+    _countries = Table("countries")
+
+    @functools.cached_property
+    def _street_address_ranges(self) -> tuple[int, ...]:
+        return (1000, len(self._streets))
 
-    # from https://www.randomlists.com/random-world-cities?qty=50&dup=false
-    _cities = (
-        "MADRID",
-        "BENGALURU",
-        "AHMEDABAD",
-        "LOS ANGELES",
-        "BAKU",
-        "ALGIERS",
-        "SHIRAZ",
-        "DONGGUAN",
-        "QUITO",
-        "TORONTO",
-        "WUHAN",
-        "HONG KONG",
-        "MELBOURNE",
-        "MAPUTO",
-        "XI'AN",
-        "RECIFE",
-        "SANTA CRUZ DE LA SIERRA",
-        "SHANGHAI",
-        "MONTERREY",
-        "HAVANA",
-        "TAIPEI",
-        "ABIDJAN",
-        "KARACHI",
-        "TASHKENT",
-        "MUMBAI",
-        "SHIJIAZHUANG",
-        "JAKARTA",
-        "NANJING",
-        "HYDERABAD",
-        "XIAMEN",
-        "FAISALABAD",
-        "QUANZHOU",
-        "BOGOTA",
-        "KUALA LUMPUR",
-        "FOSHAN",
-        "BAGHDAD",
-        "ROSTOV-ON-DON",
-        "KAOHSIUNG",
-        "PHOENIX",
-        "SYDNEY",
-        "PESHAWAR",
-        "ADDIS ABABA",
-        "RIO DE JANEIRO",
-        "BARCELONA",
-        "SAPPORO",
-        "MONTEVIDEO",
-        "ASTANA",
-        "AHVAZ",
-        "TEHRAN",
-        "HEFEI",
-    )
+    @functools.cached_property
+    def _region_ranges(self) -> tuple[int, ...]:
+        return (len(self._cities),)
 
-    # from https://www.randomlists.com/random-country?qty=40&dup=false
-    _countries = (
-        "UKRAINE",
-        "DJIBOUTI",
-        "COLOMBIA",
-        "ALGERIA",
-        "ERITREA",
-        "BELIZE",
-        "UNITED STATES OF AMERICA",
-        "POLAND",
-        "TOKELAU",
-        "JORDAN",
-        "RUSSIAN FEDERATION",
-        "BRITISH INDIAN OCEAN TERRITORY",
-        "SURINAME",
-        "NORTHERN MARIANA ISLANDS",
-        "FRENCH SOUTHERN TERRITORIES",
-        "JERSEY",
-        "ANGUILLA",
-        "UZBEKISTAN",
-        "CHINA",
-        "ISRAEL",
-        "MALI",
-        "SAINT VINCENT AND THE GRENADINES",
-        "SYRIAN ARAB REPUBLIC",
-        "IRAQ",
-        "SOMALIA",
-        "ESTONIA",
-        "KIRIBATI",
-        "NORFOLK ISLAND",
-        "COSTA RICA",
-        "KYRGYZSTAN",
-        "LAO PEOPLE'S DEMOCRATIC REPUBLIC",
-        "ISLE OF MAN",
-        "BOTSWANA",
-        "CANADA",
-        "FALKLAND ISLANDS (MALVINAS)",
-        "WALLIS AND FUTUNA",
-        "AFGHANISTAN",
-        "CHAD",
-        "SRI LANKA",
-        "LATVIA",
-    )
+    @functools.cached_property
+    def _country_ranges(self) -> tuple[int, ...]:
+        return (len(self._countries),)
@@ -0,0 +1,107 @@
+"""Facts about a dataset that element handlers share while it's being anonymized."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pydicom
+
+
+class AnonymizationContext:
+    """
+    Facts about the dataset being anonymized, each looked up at most once.
+
+    The Anonymizer creates a new context for each top-level dataset it
+    anonymizes, and shares it with the element handlers, so facts about the
+    whole dataset are available even while anonymizing elements nested in
+    sequences. See anonymizing and current_context.
+    """
+
+    def __init__(self, dataset: pydicom.dataset.Dataset) -> None:
+        """
+        Create a new AnonymizationContext.
+
+        Parameters
+        ----------
+        dataset : pydicom.dataset.Dataset
+            The top-level dataset being anonymized.
+
+        """
+        self.dataset = dataset
+        self._private_creators: dict[tuple[int, int, int], str | None] = {}
+
+    @functools.cached_property
+    def patient_sex(self) -> str | None:
+        """The top-level dataset's PatientSex, or None if it has none."""
+        patient_sex: str | None = self.dataset.get("PatientSex")
+        return patient_sex
+
+    def private_creator(self, dataset: pydicom.dataset.Dataset, tag: int) -> str | None:
+        """
+        Find the private creator of a private element.
+
+        Parameters
+        ----------
+        dataset : pydicom.dataset.Dataset
+            The dataset that holds the private element: the top-level dataset
+            or one nested within it.
+        tag : int
+            The tag of the private element.
+
+        Returns
+        -------
+        The value of the private creator element that reserved the element's
+        block, or None if there is none.
+
+        """
+        group = tag >> 16
+        block = (tag >> 8) & 0xFF
+        key = (id(dataset), group, block)
+        try:
+            return self._private_creators[key]
+        except KeyError:
+            pass
+
+        creator_element = dataset.get((group, block), None)
+        creator: str | None = None if creator_element is None else creator_element.value
+        self._private_creators[key] = creator
+        return creator
+
+
+# Each thread (or task) has its own current context, and each anonymization
+# restores the one it replaced, so anonymizations may run concurrently or
+# nest, even when they share element handlers.
+_current_context: contextvars.ContextVar[AnonymizationContext | None] = contextvars.ContextVar(
+    "dicognito_anonymization_context",
+    default=None,
+)
+
+
+def current_context() -> AnonymizationContext | None:
+    """Return the context of the dataset being anonymized, or None outside of anonymization."""
+    return _current_context.get()
+
+
+@contextlib.contextmanager
+def anonymizing(dataset: pydicom.dataset.Dataset) -> Iterator[AnonymizationContext]:
+    """
+    Make a new context for a dataset the current one, until the block ends.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The top-level dataset about to be anonymized.
+
+    """
+    context = AnonymizationContext(dataset)
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
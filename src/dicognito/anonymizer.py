@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, cast
 
+from pydicom.datadict import dictionary_has_tag, dictionary_VR
+from pydicom.dataelem import RawDataElement
+from pydicom.tag import tag_in_exception
+
+from dicognito import header_only
 from dicognito.addressanonymizer import AddressAnonymizer
+from dicognito.anonymization_context import anonymizing
 from dicognito.dataset_updater import DatasetUpdater, DeidentificationMethodUpdater, PatientIdentityRemovedUpdater
 from dicognito.datetimeanonymizer import DateTimeAnonymizer
 from dicognito.equipmentanonymizer import EquipmentAnonymizer
 from dicognito.fixedvalueanonymizer import FixedValueAnonymizer
 from dicognito.idanonymizer import IDAnonymizer
 from dicognito.pnanonymizer import PNAnonymizer
+from dicognito.profiling import HandlerStatistics, Profile
 from dicognito.randomizer import Randomizer
 from dicognito.uianonymizer import UIAnonymizer
 from dicognito.unwantedelements import UnwantedElementsStripper
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, MutableSequence, Sequence
+    from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
 
     import pydicom
 
+    from dicognito.datetimeanonymizer import PrivateElement
     from dicognito.element_anonymizer import ElementAnonymizer
+    from dicognito.mapping_store import MappingStore
 
 
 class Anonymizer:
@@ -40,6 +50,11 @@ class Anonymizer:
     >>>     anonymizer.anonymize(dataset)
     >>>     dataset.save_as("new filename")
 
+    Anonymizing an instance held in memory:
+
+    >>> anonymizer = Anonymizer()
+    >>> anonymized_bytes = anonymizer.anonymize_bytes(original_bytes)
+
     Anonymizing several instances:
 
     >>> anonymizer = Anonymizer()
@@ -50,7 +65,17 @@ class Anonymizer:
 
     """
 
-    def __init__(self, id_prefix: str = "", id_suffix: str = "", seed: str | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        id_prefix: str = "",
+        id_suffix: str = "",
+        seed: str | None = None,
+        cache_size: int = 4096,
+        hash_algorithm: str = "md5",
+        mapping_store: MappingStore | None = None,
+        ui_exempt_tags: Iterable[int] = (),
+        date_time_pairs: Iterable[tuple[int | PrivateElement, int | PrivateElement]] = (),
+    ) -> None:
         """
         Create a new Anonymizer.
 
@@ -65,12 +90,35 @@ class Anonymizer:
         seed : Optional[str]
             Seeds the data randomizer, which will produce consistent results when
             invoked with the same seed.
+        cache_size : int
+            The number of original values for which the randomizer will
+            remember its results, to avoid recomputing them. Values shared
+            by many instances, such as patient, study, and series identifiers,
+            will typically be remembered throughout a run. Shifted dates
+            and times are remembered likewise.
+        hash_algorithm : str
+            The hash algorithm the randomizer uses to derive new values,
+            one of dicognito.randomizer.Randomizer.HASH_ALGORITHMS.
+            Results are only reproducible with the same seed and algorithm.
+        mapping_store : Optional[dicognito.mapping_store.MappingStore]
+            Records the replacements chosen for IDs, UIs, and PNs. Values
+            recorded by an earlier run are replaced as they were then,
+            whatever the seed.
+        ui_exempt_tags : iterable of int
+            Tags of UI elements whose values should not be replaced, in
+            addition to class UIDs and TransferSyntaxUID.
+        date_time_pairs : iterable of (int | PrivateElement, int | PrivateElement)
+            Additional (DA element, TM element) pairs, such as private ones,
+            whose time is shifted along with the date. Elements are given by
+            tag or, if private, as dicognito.datetimeanonymizer.PrivateElement
+            (group, private creator, and offset in the private block).
 
         """
         minimum_offset_hours = 62 * 24
         maximum_offset_hours = 730 * 24
 
-        randomizer = Randomizer(seed)
+        randomizer = Randomizer(seed, cache_size, hash_algorithm, mapping_store)
+        self._randomizer = randomizer
 
         date_offset_hours = -(
             randomizer.to_int("date_offset") % (maximum_offset_hours - minimum_offset_hours) + minimum_offset_hours
@@ -90,7 +138,7 @@ class Anonymizer:
                 "ReferencedPatientPhotoSequence",
                 "ResponsibleOrganization",
             ),
-            UIAnonymizer(randomizer),
+            UIAnonymizer(randomizer, ui_exempt_tags),
             PNAnonymizer(randomizer),
             IDAnonymizer(
                 randomizer,
@@ -115,14 +163,57 @@ class Anonymizer:
             EquipmentAnonymizer(address_anonymizer),
             FixedValueAnonymizer("RequestingService", ""),
             FixedValueAnonymizer("CurrentPatientLocation", ""),
-            DateTimeAnonymizer(date_offset_hours),
+            DateTimeAnonymizer(date_offset_hours, cache_size, date_time_pairs),
         ]
+        self._profile: Profile | None = None
+        self._handler_statistics: dict[int, HandlerStatistics] = {}
+        self._build_dispatch_table()
 
         self._dataset_updaters: Sequence[DatasetUpdater] = [
             DeidentificationMethodUpdater(),
             PatientIdentityRemovedUpdater(),
         ]
 
+    @property
+    def seed(self) -> str:
+        """
+        The seed used by this anonymizer's randomizer.
+
+        When no seed was supplied to the constructor, this is the generated
+        one. Another Anonymizer created with this seed (and the same
+        options) will anonymize instances identically.
+        """
+        return self._randomizer.seed
+
+    @property
+    def profile(self) -> Profile | None:
+        """The profile being recorded, or None if profiling is not enabled."""
+        return self._profile
+
+    def enable_profiling(self) -> Profile:
+        """
+        Start recording how each element handler is used.
+
+        From now on, each anonymization records, for each element handler,
+        how many elements it was offered, how many it claimed (and their
+        tags), and how long it took. Enabling profiling again discards the
+        statistics recorded so far and starts a new profile.
+
+        Returns
+        -------
+        dicognito.profiling.Profile
+            The profile that will record the statistics.
+
+        """
+        self._profile = Profile()
+        self._assign_handler_statistics()
+        return self._profile
+
+    def disable_profiling(self) -> None:
+        """Stop recording how each element handler is used."""
+        self._profile = None
+        self._handler_statistics = {}
+
     def anonymize(self, dataset: pydicom.dataset.Dataset) -> None:
         """
         Anonymize a dataset in place.
@@ -136,11 +227,129 @@ class Anonymizer:
             A DICOM dataset to anonymize.
 
         """
-        dataset.file_meta.walk(self._anonymize_element)
-        dataset.walk(self._anonymize_element)
+        # Choose once per dataset, so there's no cost per element when not profiling.
+        anonymize_element = self._anonymize_element if self._profile is None else self._profile_element
+        with anonymizing(dataset):
+            dataset.file_meta.walk(anonymize_element)
+            self._walk(dataset, anonymize_element)
         for updater in self._dataset_updaters:
             updater(dataset)
 
+    def anonymize_bytes(self, buffer: bytes | bytearray | memoryview) -> bytes:
+        """
+        Anonymize a DICOM Part-10 object held in memory.
+
+        Only the header is parsed. The pixel data is copied from the buffer
+        once, directly into the result, without being parsed.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview
+            The DICOM object to anonymize. It is not changed.
+
+        Returns
+        -------
+        The anonymized DICOM object.
+
+        Raises
+        ------
+        pydicom.errors.InvalidDicomError
+            If the buffer does not hold a DICOM object.
+
+        """
+        dataset = header_only.read_header_from_buffer(buffer)
+        self.anonymize(dataset)
+        return header_only.to_bytes(dataset)
+
+    def anonymize_bytes_to(
+        self,
+        buffer: bytes | bytearray | memoryview,
+        output_buffer: bytearray | memoryview,
+    ) -> int:
+        """
+        Anonymize a DICOM Part-10 object held in memory, writing the result into a buffer.
+
+        Only the header is parsed. The pixel data is copied from the buffer
+        once, directly into the output buffer, without being parsed.
+
+        Parameters
+        ----------
+        buffer : bytes | bytearray | memoryview
+            The DICOM object to anonymize. It is not changed.
+        output_buffer : bytearray | memoryview
+            The writable buffer to write the anonymized DICOM object into,
+            starting at its beginning. It is not resized.
+
+        Returns
+        -------
+        The number of bytes written.
+
+        Raises
+        ------
+        pydicom.errors.InvalidDicomError
+            If the buffer does not hold a DICOM object.
+        ValueError
+            If the anonymized object is larger than the output buffer.
+            Nothing is written.
+
+        """
+        dataset = header_only.read_header_from_buffer(buffer)
+        self.anonymize(dataset)
+        return header_only.write_into(dataset, output_buffer)
+
+    def _walk(
+        self,
+        dataset: pydicom.dataset.Dataset,
+        anonymize_element: Callable[[pydicom.dataset.Dataset, pydicom.dataelem.DataElement], None],
+    ) -> None:
+        """
+        Visit the dataset's elements, recursing into sequences, as Dataset.walk does.
+
+        Unlike Dataset.walk, raw elements that no handler is interested in are
+        not converted, and so are written out just as they were read.
+        """
+        for tag in sorted(dataset.keys()):
+            with tag_in_exception(tag):
+                # get_item is annotated as returning a DataElement, but returns
+                # the RawDataElement if the element hasn't been converted.
+                raw_element = cast(
+                    "pydicom.dataelem.DataElement | RawDataElement", dataset.get_item(tag, keep_deferred=True)
+                )
+                if isinstance(raw_element, RawDataElement):
+                    vr = self._get_raw_vr(raw_element)
+                    if vr is not None and vr != "SQ":
+                        key = (tag, vr)
+                        handlers = self._dispatch_table.get(key)
+                        if handlers is None:
+                            handlers = self._find_handlers(key)
+                        if not handlers:
+                            continue
+
+                data_element = dataset[tag]
+                anonymize_element(dataset, data_element)
+                # The handler may have deleted the element.
+                if tag in dataset and data_element.VR == "SQ":
+                    for item in data_element.value:
+                        self._walk(item, anonymize_element)
+
+    @staticmethod
+    def _get_raw_vr(raw_element: RawDataElement) -> str | None:
+        """
+        Find the VR a raw element will have once it's converted, without converting it.
+
+        Returns None if the VR can't be known without converting the element,
+        which is the case for private elements whose VR wasn't recorded in the file.
+        """
+        vr = raw_element.VR
+        if vr is not None and vr != "UN":
+            return str(vr)
+        if dictionary_has_tag(raw_element.tag):
+            vr = dictionary_VR(raw_element.tag)
+            # Ambiguous VRs such as "US or SS" are only resolved on conversion.
+            if " or " not in vr:
+                return str(vr)
+        return None
+
     def describe_actions(self) -> str:
         """Describe all the actions this anonymizer performs."""
 
@@ -165,8 +374,82 @@ class Anonymizer:
 
         """
         self._element_handlers.insert(0, handler)
+        self._build_dispatch_table()
+        if self._profile is not None:
+            self._assign_handler_statistics()
+
+    def _build_dispatch_table(self) -> None:
+        """
+        Index the element handlers by the tags, VRs, and groups they declare.
+
+        The dispatch table itself, which maps (tag, VR) to the handlers to try,
+        in order, is filled lazily by _find_handlers.
+        """
+        self._handler_positions_by_tag: dict[int, list[int]] = {}
+        self._handler_positions_by_vr: dict[str, list[int]] = {}
+        self._handler_positions_by_group: dict[int, list[int]] = {}
+        self._unselective_handler_positions: list[int] = []
+
+        for position, handler in enumerate(self._element_handlers):
+            tags = handler.handled_tags()
+            vrs = handler.handled_vrs()
+            groups = handler.handled_groups()
+            if not (tags or vrs or groups):
+                self._unselective_handler_positions.append(position)
+            for tag in tags:
+                self._handler_positions_by_tag.setdefault(tag, []).append(position)
+            for vr in vrs:
+                self._handler_positions_by_vr.setdefault(vr, []).append(position)
+            for group in groups:
+                self._handler_positions_by_group.setdefault(group, []).append(position)
+
+        self._dispatch_table: dict[tuple[int, str], tuple[ElementAnonymizer, ...]] = {}
+
+    def _find_handlers(self, key: tuple[int, str]) -> tuple[ElementAnonymizer, ...]:
+        tag, vr = key
+        positions = {
+            *self._handler_positions_by_tag.get(tag, ()),
+            *self._handler_positions_by_vr.get(vr, ()),
+            *self._handler_positions_by_group.get(tag >> 16, ()),
+            *self._unselective_handler_positions,
+        }
+        handlers = tuple(self._element_handlers[position] for position in sorted(positions))
+        self._dispatch_table[key] = handlers
+        return handlers
 
     def _anonymize_element(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.dataelem.DataElement) -> None:
-        for handler in self._element_handlers:
+        key = (data_element.tag, data_element.VR)
+        handlers = self._dispatch_table.get(key)
+        if handlers is None:
+            handlers = self._find_handlers(key)
+        for handler in handlers:
             if handler(dataset, data_element):
                 return
+
+    def _assign_handler_statistics(self) -> None:
+        if self._profile is None:
+            return
+        name_counts: dict[str, int] = {}
+        self._handler_statistics = {}
+        for handler in self._element_handlers:
+            name = type(handler).__name__
+            name_counts[name] = name_counts.get(name, 0) + 1
+            if name_counts[name] > 1:
+                name += f"#{name_counts[name]}"
+            self._handler_statistics[id(handler)] = self._profile.handlers.setdefault(name, HandlerStatistics())
+
+    def _profile_element(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.dataelem.DataElement) -> None:
+        key = (data_element.tag, data_element.VR)
+        handlers = self._dispatch_table.get(key)
+        if handlers is None:
+            handlers = self._find_handlers(key)
+        for handler in handlers:
+            statistics = self._handler_statistics[id(handler)]
+            start = time.perf_counter()
+            claimed = handler(dataset, data_element)
+            statistics.seconds += time.perf_counter() - start
+            statistics.calls += 1
+            if claimed:
+                statistics.claims += 1
+                statistics.claimed_tags[key[0]] = statistics.claimed_tags.get(key[0], 0) + 1
+                return
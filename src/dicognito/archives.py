@@ -0,0 +1,234 @@
+"""
+Read DICOM files from, and write them to, tar and zip archives.
+
+Archives are recognized by their names' suffixes (see ARCHIVE_SUFFIXES).
+Their members are read in a single sequential pass, without extracting
+the archive to disk: each member's contents are held in memory or, if
+large, spooled to a temporary file until the member is read as a dataset.
+
+Examples
+--------
+>>> anonymizer = Anonymizer()
+>>> with ArchiveWriter("anonymized.zip") as archive:
+>>>     for member in read_members("studies.tar.gz"):
+>>>         dataset = member.read_dataset()
+>>>         anonymizer.anonymize(dataset)
+>>>         with tempfile.TemporaryFile() as file:
+>>>             dataset.save_as(file, enforce_file_format=True)
+>>>             archive.add(dataset.SOPInstanceUID + ".dcm", file)
+
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from typing import IO, TYPE_CHECKING
+
+import pydicom
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+    from typing import Final, Literal
+
+ARCHIVE_SUFFIXES: Final = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+"""The suffixes of the names of files that are treated as archives."""
+
+SPOOL_SIZE: Final = 16 * 1024 * 1024
+"""The size above which a member's contents are spooled to a temporary file, rather than held in memory."""
+
+_COMPRESSED_TAR_MODES: Final[dict[str, Literal["w:gz", "w:bz2", "w:xz"]]] = {
+    ".gz": "w:gz",
+    ".tgz": "w:gz",
+    ".bz2": "w:bz2",
+    ".tbz2": "w:bz2",
+    ".xz": "w:xz",
+    ".txz": "w:xz",
+}
+
+
+def is_archive(filename: str) -> bool:
+    """Determine whether a file is an archive, by its name."""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+class ArchiveMember(str):  # noqa: SLOT000
+    """
+    The name of a file in an archive, holding the file's contents.
+
+    The name is the archive's name joined with the member's path within
+    the archive, so an ArchiveMember can be used wherever a filename is
+    expected, such as in log messages. The contents are discarded once the
+    member has been read as a dataset. Objects read from streams by
+    dicognito.streams are also ArchiveMembers.
+    """
+
+    contents: IO[bytes]
+
+    def __new__(cls, name: str, contents: IO[bytes]) -> ArchiveMember:  # noqa: PYI034
+        """
+        Create a new ArchiveMember.
+
+        Parameters
+        ----------
+        name : str
+            The archive's name joined with the member's path.
+        contents : IO[bytes]
+            The member's contents, which the ArchiveMember closes once read.
+
+        """
+        member = super().__new__(cls, name)
+        member.contents = contents
+        return member
+
+    def __reduce__(self) -> tuple[type[ArchiveMember], tuple[str, IO[bytes]]]:
+        """Support pickling, so members can be sent to worker processes, by reading the contents into memory."""
+        return (ArchiveMember, (str(self), io.BytesIO(self.open().read())))
+
+    def open(self) -> IO[bytes]:
+        """Return the member's contents, positioned at the start. The file must not be closed."""
+        self.contents.seek(0)
+        return self.contents
+
+    def read_dataset(self) -> pydicom.dataset.FileDataset:
+        """
+        Read the member as a DICOM dataset, and discard the contents.
+
+        The dataset's filename is the ArchiveMember.
+
+        Raises
+        ------
+        pydicom.errors.InvalidDicomError
+            If the member is not a DICOM file.
+
+        """
+        with self.contents:
+            dataset = pydicom.dcmread(self.open(), force=False)
+        dataset.filename = self
+        return dataset
+
+
+def read_members(filename: str) -> Iterator[ArchiveMember]:
+    """
+    Read each regular file in an archive, in the order they're stored.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the tar (optionally compressed) or zip archive.
+
+    """
+    if filename.lower().endswith(".zip"):
+        yield from _read_zip_members(filename)
+    else:
+        yield from _read_tar_members(filename)
+
+
+def _read_zip_members(filename: str) -> Iterator[ArchiveMember]:
+    with zipfile.ZipFile(filename) as archive:
+        for info in archive.infolist():
+            if not info.is_dir():
+                with archive.open(info) as member_file:
+                    yield ArchiveMember(os.path.join(filename, info.filename), _spool(member_file))
+
+
+def _read_tar_members(filename: str) -> Iterator[ArchiveMember]:
+    # Read the archive as a stream, so even compressed archives are read sequentially.
+    with tarfile.open(filename, "r|*") as archive:
+        for info in archive:
+            member_file = archive.extractfile(info) if info.isfile() else None
+            if member_file is not None:
+                yield ArchiveMember(os.path.join(filename, info.name), _spool(member_file))
+
+
+def _spool(member_file: IO[bytes]) -> IO[bytes]:
+    contents = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    shutil.copyfileobj(member_file, contents)
+    return contents
+
+
+class ArchiveWriter:
+    """
+    A new tar or zip archive, to which files are added one at a time.
+
+    The archive's format is chosen by its name's suffix. Tar archives may be
+    compressed, with a ".gz", ".bz2", or ".xz" suffix. Zip archive members
+    are stored without compression. Files may be added from several
+    threads.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Create a new archive, replacing any existing file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the archive. Must end with one of ARCHIVE_SUFFIXES.
+
+        """
+        if not is_archive(filename):
+            msg = f"Unknown archive type '{filename}'. Must end with one of {', '.join(ARCHIVE_SUFFIXES)}."
+            raise ValueError(msg)
+        self._lock = threading.Lock()
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        if filename.lower().endswith(".zip"):
+            self._zip = zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_STORED)
+        else:
+            mode = _COMPRESSED_TAR_MODES.get(os.path.splitext(filename)[1].lower())
+            self._tar = tarfile.open(filename, "w") if mode is None else tarfile.open(filename, mode)
+
+    def __enter__(self) -> ArchiveWriter:  # noqa: PYI034
+        """Return the archive, to be closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the archive."""
+        self.close()
+
+    def add(self, name: str, file: IO[bytes]) -> None:
+        """
+        Add a file to the archive.
+
+        Parameters
+        ----------
+        name : str
+            The member's path within the archive, using "/" as a separator.
+        file : IO[bytes]
+            The member's contents, which are read from the start of the file.
+
+        """
+        size = file.seek(0, os.SEEK_END)
+        file.seek(0)
+        with self._lock:
+            if self._zip is not None:
+                zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                with self._zip.open(zip_info, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as member_file:
+                    shutil.copyfileobj(file, member_file)
+            elif self._tar is not None:
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = size
+                tar_info.mtime = int(time.time())
+                tar_info.mode = 0o644
+                self._tar.addfile(tar_info, file)
+
+    def close(self) -> None:
+        """Finish writing the archive."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+            if self._tar is not None:
+                self._tar.close()
@@ -1,18 +1,28 @@
 """Replace date-based values with something that obscures the patient's identity."""
 
 import datetime
-from collections.abc import Iterator, MutableSequence
+import functools
+from collections.abc import Collection, Iterable, Iterator, MutableSequence
 from itertools import zip_longest
 
 import pydicom
 
+from dicognito.anonymization_context import AnonymizationContext
 from dicognito.element_anonymizer import ElementAnonymizer
 
+PrivateElement = tuple[int, str, int]
+"""A private element, identified by its group, its block's private creator, and its offset in the block."""
+
 
 class DateTimeAnonymizer(ElementAnonymizer):
     """Date/time anonymizers."""
 
-    def __init__(self, offset_hours: int) -> None:
+    def __init__(
+        self,
+        offset_hours: int,
+        cache_size: int = 4096,
+        date_time_pairs: Iterable[tuple[int | PrivateElement, int | PrivateElement]] = (),
+    ) -> None:
         """
         Create a new DateTimeAnonymizer.
 
@@ -21,9 +31,49 @@ class DateTimeAnonymizer(ElementAnonymizer):
         offset_hours : int
             The number of hours to shift dates and times by. May be
             negative or zero.
+        cache_size : int
+            The number of shifted date and time values to remember. When full,
+            the least recently used value is forgotten. If 0, no values are
+            remembered.
+        date_time_pairs : iterable of (int | PrivateElement, int | PrivateElement)
+            Additional (DA element, TM element) pairs whose time is to be shifted
+            along with the date. Each element is given by its tag or, if private,
+            as a PrivateElement, since private tags depend on where the block was
+            reserved. DA elements in the DICOM data dictionary are already paired
+            with the TM elements named like them, as StudyDate is with StudyTime.
 
         """
+        self.offset_hours = offset_hours
         self.offset = datetime.timedelta(hours=offset_hours)
+        self._shift_datetime = functools.lru_cache(maxsize=cache_size)(self._compute_shifted_datetime)
+
+        self._time_elements_by_date_tag: dict[int, int | PrivateElement] = {}
+        self._time_elements_by_private_date: dict[PrivateElement, int | PrivateElement] = {}
+        for keyword, tag in pydicom.datadict.keyword_dict.items():
+            if "Date" in keyword and pydicom.datadict.dictionary_VR(tag) == "DA":
+                time_tag = pydicom.datadict.keyword_dict.get(keyword.replace("Date", "Time"))
+                if time_tag is not None:
+                    self._time_elements_by_date_tag[tag] = time_tag
+        for date_element, time_element in date_time_pairs:
+            self.add_date_time_pair(date_element, time_element)
+
+    def add_date_time_pair(self, date_element: int | PrivateElement, time_element: int | PrivateElement) -> None:
+        """
+        Shift the value of a TM element along with that of a DA element.
+
+        Parameters
+        ----------
+        date_element : int | PrivateElement
+            The tag of the DA element or, if it's private, its group, private
+            creator, and offset in the private block.
+        time_element : int | PrivateElement
+            The TM element that holds the time for the date, given the same way.
+
+        """
+        if isinstance(date_element, int):
+            self._time_elements_by_date_tag[date_element] = time_element
+        else:
+            self._time_elements_by_private_date[date_element] = time_element
 
     def __call__(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.DataElement) -> bool:
         """
@@ -61,15 +111,19 @@ class DateTimeAnonymizer(ElementAnonymizer):
         yield "Replace all DT elements with anonymized values that precede the originals"
         yield "Replace all TM elements with anonymized values that precede the originals (only if replacing matching DA element)"
 
+    def handled_vrs(self) -> Collection[str]:
+        """Return the VRs of the elements this anonymizer may act on."""
+        return ("DA", "DT")
+
     def _anonymize_date_and_time(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.DataElement) -> None:
         dates = self._get_value_as_sequence(data_element)
 
         times: MutableSequence[str] = []
-        time_name = data_element.keyword.replace("Date", "Time")
+        time_tag = self._find_time_tag(dataset, data_element.tag)
 
-        if time_name in dataset:
-            time_element = dataset.data_element(time_name)
-            if time_element and time_element.value:
+        if time_tag is not None and time_tag in dataset:
+            time_element = dataset[time_tag]
+            if time_element.value:
                 times = self._get_value_as_sequence(time_element)
 
         new_dates = []
@@ -83,13 +137,69 @@ class DateTimeAnonymizer(ElementAnonymizer):
 
         data_element.value = new_dates
         if times:
-            time_element.value = new_times  # type: ignore[union-attr]
+            time_element.value = new_times
+
+    def _find_time_tag(self, dataset: pydicom.dataset.Dataset, date_tag: pydicom.tag.BaseTag) -> int | None:
+        if date_tag.is_private and self._time_elements_by_private_date:
+            context = self.context or AnonymizationContext(dataset)
+            private_creator = context.private_creator(dataset, date_tag)
+            time_element = (
+                None
+                if private_creator is None
+                else self._time_elements_by_private_date.get((date_tag.group, private_creator, date_tag.element & 0xFF))
+            )
+        else:
+            time_element = self._time_elements_by_date_tag.get(date_tag)
+
+        if time_element is None or isinstance(time_element, int):
+            return time_element
+        (group, private_creator, offset) = time_element
+        try:
+            return dataset.private_block(group, private_creator).get_tag(offset)
+        except KeyError:
+            return None
 
     def _anonymize_datetime(self, data_element: pydicom.DataElement) -> None:
         datetimes = self._get_value_as_sequence(data_element)
         data_element.value = [self._shift_datetime(datetime_value) for datetime_value in datetimes]
 
-    def _shift_datetime(self, datetime_value: str) -> str:
+    def _compute_shifted_datetime(self, datetime_value: str) -> str:
+        new_datetime_value = self._shift_datetime_arithmetically(datetime_value)
+        if new_datetime_value is None:
+            new_datetime_value = self._shift_datetime_by_parsing(datetime_value)
+        return new_datetime_value
+
+    def _shift_datetime_arithmetically(self, datetime_value: str) -> str | None:
+        """
+        Shift a date or datetime by counting hours from the start of the calendar.
+
+        Returns None for values that aren't simply digits or whose shifted
+        year would not have four digits, leaving them to _shift_datetime_by_parsing,
+        which reports errors and formats unusual values as it always has.
+        """
+        precision = min(len(datetime_value), 10)
+        if precision not in (4, 6, 8, 10):
+            return None
+        digits = datetime_value[:precision]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+
+        hour = int(digits[8:10] or 0)
+        if hour > 23:  # noqa: PLR2004
+            return None
+        try:
+            ordinal = datetime.date(int(digits[:4]), int(digits[4:6] or 1), int(digits[6:8] or 1)).toordinal()
+            new_ordinal, new_hour = divmod(ordinal * 24 + hour + self.offset_hours, 24)
+            new_date = datetime.date.fromordinal(new_ordinal)
+        except ValueError:
+            return None
+        if new_date.year < 1000:  # noqa: PLR2004
+            return None
+
+        new_digits = f"{new_date.year:04}{new_date.month:02}{new_date.day:02}{new_hour:02}"
+        return new_digits[:precision] + datetime_value[precision:]
+
+    def _shift_datetime_by_parsing(self, datetime_value: str) -> str:
         datetime_format = "%Y%m%d%H"[: len(datetime_value) - 2]
 
         old_datetime = datetime.datetime.strptime(datetime_value[:10], datetime_format)  # noqa: DTZ007
@@ -1,9 +1,18 @@
 """Base class for element anonymizers."""
 
-from collections.abc import Iterator
+from __future__ import annotations
 
-from pydicom import DataElement
-from pydicom.dataset import Dataset
+from typing import TYPE_CHECKING
+
+from dicognito.anonymization_context import current_context
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+    from pydicom import DataElement
+    from pydicom.dataset import Dataset
+
+    from dicognito.anonymization_context import AnonymizationContext
 
 
 class ElementAnonymizer:
@@ -14,8 +23,21 @@ class ElementAnonymizer:
     data_element to obscure patient identifiers. Where a DICOM element
     is linked to another in the same dataset (such as Study Date and Study
     Time), may alter additional elements.
+
+    Subclasses should declare which elements they may act on by overriding
+    handled_tags, handled_vrs, and/or handled_groups. The Anonymizer uses
+    these declarations to dispatch each element only to interested handlers.
+    A handler that declares none of them will be offered every element.
+
+    While anonymizing a dataset, the Anonymizer provides a context, which
+    handlers may consult for facts about the whole dataset.
     """
 
+    @property
+    def context(self) -> AnonymizationContext | None:
+        """The context of the dataset being anonymized on this thread, or None outside of anonymization."""
+        return current_context()
+
     def __call__(self, dataset: Dataset, data_element: DataElement) -> bool:
         """Anonymize an element (or related elements) to protect patient identity."""
         raise NotImplementedError
@@ -23,3 +45,15 @@ class ElementAnonymizer:
     def describe_actions(self) -> Iterator[str]:
         """Describe the actions this anonymizer performs."""
         raise NotImplementedError
+
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return ()
+
+    def handled_vrs(self) -> Collection[str]:
+        """Return the VRs of the elements this anonymizer may act on."""
+        return ()
+
+    def handled_groups(self) -> Collection[int]:
+        """Return the groups (typically private) of the elements this anonymizer may act on."""
+        return ()
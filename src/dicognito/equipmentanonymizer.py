@@ -1,6 +1,6 @@
 """Replace equipment-related values with something that obscures the patient's identity."""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 
 import pydicom
 
@@ -63,13 +63,14 @@ class EquipmentAnonymizer(ElementAnonymizer):
         yield "Replace InstitutionAddress with anonymized values (only if replacing matching InstitutionName element)"
         yield 'Replace InstitutionalDepartmentName with "RADIOLOGY"'
 
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return self._element_anonymizers.keys()
+
     def _anonymize_institution_name(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.DataElement) -> None:
-        region = self.address_anonymizer.get_region(data_element.value)
-        street_address = self.address_anonymizer.get_street_address(data_element.value)
+        (street_address, region, country) = self.address_anonymizer.get_address(data_element.value)
         street = street_address.split(" ", 1)[1]
-        dataset.InstitutionAddress = ", ".join(
-            [street_address, region, self.address_anonymizer.get_country(data_element.value)],
-        )
+        dataset.InstitutionAddress = f"{street_address}, {region}, {country}"
         data_element.value = region + "'S " + street + " CLINIC"
 
     def _anonymize_institution_address(
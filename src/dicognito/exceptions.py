@@ -16,3 +16,11 @@ class TagError(ValueError):
         """
         message = f"Bad tag name '{tag}'. Must be a well-known DICOM element name or a string in the form 'stuv,wxyz' where each character is a hexadecimal digit."
         super().__init__(message)
+
+
+class ManifestError(ValueError):
+    """Error raised when a manifest can't be used to resume a run."""
+
+
+class StreamError(ValueError):
+    """Error raised when a stream of length-prefixed DICOM objects is malformed."""
@@ -2,41 +2,148 @@
 
 from __future__ import annotations
 
+import csv
+import hashlib
+import heapq
 import itertools
+import json
 import logging
 import operator
 import os
-from typing import TYPE_CHECKING
+import re
+import sys
+import tempfile
+import threading
+from typing import IO, TYPE_CHECKING, TextIO
 
 from dicognito.pipeline import Filter
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     import pydicom
 
+    from dicognito.archives import ArchiveWriter
+    from dicognito.manifest import Manifest
+
 
 class Summarize(Filter):
-    """Summarizes newly-anonymized instances."""
+    """
+    Summarizes newly-anonymized instances.
+
+    Each distinct (AccessionNumber, PatientID, PatientName) row is counted
+    as instances are anonymized, so memory use depends on the number of
+    studies rather than the number of instances. When more than max_rows
+    distinct rows have been collected, they are spilled to a temporary file,
+    and all the files are merged when the summary is written.
+    """
+
+    FORMATS = ("table", "csv", "json")
+    """The formats in which the summary can be written."""
 
-    def __init__(self) -> None:
-        """Create a new Summarize."""
-        self.rows: list[Sequence[str]] = []
+    _elements = ("Accession Number", "Patient ID", "Patient Name")
+
+    def __init__(self, output_format: str = "table", output_filename: str | None = None, max_rows: int = 100_000):
+        """
+        Create a new Summarize.
+
+        Parameters
+        ----------
+        output_format : str
+            The format of the summary, one of FORMATS. "table" aligns the rows
+            for reading. "csv" and "json" also include the number of instances
+            of each row.
+        output_filename : str, optional
+            The name of the file to write the summary to. If None, the summary
+            is printed.
+        max_rows : int
+            The number of distinct rows to hold in memory before spilling them
+            to a temporary file.
+
+        """
+        if output_format not in self.FORMATS:
+            msg = f"Unknown summary format '{output_format}'. Must be one of {', '.join(self.FORMATS)}."
+            raise ValueError(msg)
+        self.output_format = output_format
+        self.output_filename = output_filename
+        self.max_rows = max_rows
+        self._counts: dict[tuple[str, str, str], int] = {}
+        self._spill_files: list[IO[str]] = []
+        # after_each may be called from several threads at once.
+        self._lock = threading.Lock()
 
     def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
-        """Remember elements identifying anonymized instance."""
-        self.rows.append(
-            (dataset.get("AccessionNumber", ""), dataset.get("PatientID", ""), str(dataset.get("PatientName", ""))),
+        """Count the elements identifying the anonymized instance."""
+        row = (
+            str(dataset.get("AccessionNumber", "")),
+            str(dataset.get("PatientID", "")),
+            str(dataset.get("PatientName", "")),
         )
+        with self._lock:
+            self._counts[row] = self._counts.get(row, 0) + 1
+            if len(self._counts) > self.max_rows:
+                self._spill()
+
+    def pop_counts(self) -> dict[tuple[str, str, str], int]:
+        """
+        Remove and return the rows counted so far (and not spilled) with their counts.
+
+        Used to pass rows to merge in another Summarize, such as from a worker process.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+    def merge(self, counts: Mapping[tuple[str, str, str], int]) -> None:
+        """Count rows collected by another Summarize, such as one running in a worker process."""
+        with self._lock:
+            for row, count in counts.items():
+                self._counts[row] = self._counts.get(row, 0) + count
+            if len(self._counts) > self.max_rows:
+                self._spill()
 
     def after_all(self) -> None:
         """Output elements identifying anonymized instance."""
-        elements = ("Accession Number", "Patient ID", "Patient Name")
-        widths = [len(el) for el in elements]
-
-        sorted_rows = sorted(self.rows)  # type: ignore[type-var]
-        output_rows = list(map(operator.itemgetter(0), itertools.groupby(sorted_rows)))
-        for row in output_rows:
+        try:
+            if self.output_filename is None:
+                self._write(sys.stdout)
+            else:
+                with open(self.output_filename, "w", encoding="utf-8") as output_file:
+                    self._write(output_file)
+        finally:
+            for spill_file in self._spill_files:
+                spill_file.close()
+            self._spill_files = []
+
+    def _spill(self) -> None:
+        spill_file = tempfile.TemporaryFile("w+", newline="", encoding="utf-8", prefix="dicognito-summary-")
+        csv.writer(spill_file).writerows((*row, count) for row, count in sorted(self._counts.items()))
+        self._spill_files.append(spill_file)
+        self._counts = {}
+
+    def _sorted_counts(self) -> Iterator[tuple[tuple[str, str, str], int]]:
+        """Yield each distinct row, in order, with its total count, merging any spilled rows."""
+        sources: list[Iterable[tuple[tuple[str, str, str], int]]] = [sorted(self._counts.items())]
+        for spill_file in self._spill_files:
+            spill_file.seek(0)
+            sources.append(
+                ((accession, patient_id, name), int(count))
+                for accession, patient_id, name, count in csv.reader(spill_file)
+            )
+        for row, row_counts in itertools.groupby(heapq.merge(*sources), key=operator.itemgetter(0)):
+            yield row, sum(count for _, count in row_counts)
+
+    def _write(self, output_file: TextIO) -> None:
+        if self.output_format == "csv":
+            self._write_csv(output_file)
+        elif self.output_format == "json":
+            self._write_json(output_file)
+        else:
+            self._write_table(output_file)
+
+    def _write_table(self, output_file: TextIO) -> None:
+        widths = [len(el) for el in self._elements]
+        for row, _ in self._sorted_counts():
             for i, v in enumerate(row):
                 widths[i] = max(widths[i], len(v))
 
@@ -46,10 +153,33 @@ class Summarize(Filter):
         row_format = header_format.replace("^", "<")
         lines = tuple("-" * width for (i, width) in enumerate(widths))
 
-        print(header_format.format(*elements))
-        print(header_format.format(*lines))
-        for row in output_rows:
-            print(row_format.format(*row))
+        print(header_format.format(*self._elements), file=output_file)
+        print(header_format.format(*lines), file=output_file)
+        for row, _ in self._sorted_counts():
+            print(row_format.format(*row), file=output_file)
+
+    def _write_csv(self, output_file: TextIO) -> None:
+        # Like the other formats, end lines with the platform's line ending, even when printing.
+        writer = csv.writer(output_file, lineterminator="\n")
+        writer.writerow((*self._elements, "Instances"))
+        writer.writerows((*row, count) for row, count in self._sorted_counts())
+
+    def _write_json(self, output_file: TextIO) -> None:
+        output_file.write("[")
+        separator = "\n"
+        for (accession_number, patient_id, patient_name), count in self._sorted_counts():
+            output_file.write(separator)
+            json.dump(
+                {
+                    "AccessionNumber": accession_number,
+                    "PatientID": patient_id,
+                    "PatientName": patient_name,
+                    "Instances": count,
+                },
+                output_file,
+            )
+            separator = ",\n"
+        output_file.write("\n]\n")
 
 
 class BurnedInAnnotationGuard(Filter):
@@ -108,28 +238,241 @@ class BurnedInAnnotationGuard(Filter):
 class SaveInPlace(Filter):
     """Saves anonymized instances into original files."""
 
-    def before_each(self, dataset: pydicom.dataset.Dataset) -> None:
-        """Remember original filename."""
-        self.output_filename = dataset.filename
+    def __init__(self, *, overwrite_header: bool = False):
+        """
+        Create a new SaveInPlace.
+
+        Parameters
+        ----------
+        overwrite_header : bool
+            Whether to write the anonymized header over the original one,
+            leaving the pixel data untouched, when possible. Only effective
+            for datasets read by header_only.read_header. When the header
+            can't be overwritten, the whole file is replaced.
+
+        """
+        self.overwrite_header = overwrite_header
+
+    def output_filename(self, dataset: pydicom.dataset.Dataset) -> str:
+        """Return the name of the file the dataset is saved to."""
+        filename: str = dataset.filename
+        return filename
 
     def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
         """Save to original filename."""
-        dataset.save_as(self.output_filename, enforce_file_format=True)
+        from dicognito import header_only
+
+        if self.overwrite_header and header_only.overwrite_header(dataset):
+            return
+        header_only.save_as(dataset, self.output_filename(dataset))
 
 
 class SaveToSOPInstanceUID(Filter):
-    """Saves anonymized instances to files named by new SOP Instance UID."""
+    """
+    Saves anonymized instances to files named by new SOP Instance UID.
+
+    The files are written directly into the output directory or, so that no
+    directory holds too many files, into subdirectories of it, according to
+    the layout:
+
+    flat
+        output_directory/SOPInstanceUID.dcm
+    hash
+        output_directory/ab/cd/SOPInstanceUID.dcm, where abcd are the first
+        hexadecimal digits of a hash of the SOP Instance UID
+    hierarchy
+        output_directory/PatientID/StudyInstanceUID/SeriesInstanceUID/SOPInstanceUID.dcm,
+        using the anonymized values
+    """
+
+    LAYOUTS = ("flat", "hash", "hierarchy")
+    """The ways in which files can be arranged in the output directory."""
+
+    def __init__(self, output_directory: str, layout: str = "flat"):
+        """
+        Create a new SaveToSOPInstanceUID.
+
+        Parameters
+        ----------
+        output_directory : str
+            The directory to save the anonymized instances in.
+        layout : str
+            How to arrange the files in the output directory, one of LAYOUTS.
 
-    def __init__(self, output_directory: str):
-        """Create a new SaveToSOPInstanceUID."""
+        """
+        if layout not in self.LAYOUTS:
+            msg = f"Unknown output layout '{layout}'. Must be one of {', '.join(self.LAYOUTS)}."
+            raise ValueError(msg)
         self.output_directory = output_directory
+        self.layout = layout
+        self._created_directories: set[str] = set()
 
     def before_any(self) -> None:
         """Ensure output directory exists."""
-        if not os.path.isdir(self.output_directory):
-            os.makedirs(self.output_directory)
+        self._ensure_directory(self.output_directory)
+
+    def output_filename(self, dataset: pydicom.dataset.Dataset) -> str:
+        """Return the name of the file the anonymized dataset is saved to."""
+        return os.path.join(self.output_directory, *_get_output_path(dataset, self.layout))
 
     def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
         """Save anonymized instance to file named by new SOP Instance UID."""
-        output_filename = os.path.join(self.output_directory, dataset.SOPInstanceUID + ".dcm")
-        dataset.save_as(output_filename, enforce_file_format=True)
+        from dicognito import header_only
+
+        output_filename = self.output_filename(dataset)
+        self._ensure_directory(os.path.dirname(output_filename))
+        header_only.save_as(dataset, output_filename)
+
+    def _ensure_directory(self, directory: str) -> None:
+        # Remember the directories that exist, so each is only created (or
+        # checked) once. Another thread may be creating the same directory.
+        if directory not in self._created_directories:
+            os.makedirs(directory, exist_ok=True)
+            self._created_directories.add(directory)
+
+
+class SaveToArchive(Filter):
+    """
+    Saves anonymized instances, named by new SOP Instance UID, into a new tar or zip archive.
+
+    The archive's members are arranged according to a layout, as for
+    SaveToSOPInstanceUID.
+    """
+
+    def __init__(self, archive_filename: str, layout: str = "flat"):
+        """
+        Create a new SaveToArchive.
+
+        Parameters
+        ----------
+        archive_filename : str
+            The name of the archive to create. Must end with one of
+            dicognito.archives.ARCHIVE_SUFFIXES.
+        layout : str
+            How to arrange the files in the archive, one of SaveToSOPInstanceUID.LAYOUTS.
+
+        """
+        if layout not in SaveToSOPInstanceUID.LAYOUTS:
+            msg = f"Unknown output layout '{layout}'. Must be one of {', '.join(SaveToSOPInstanceUID.LAYOUTS)}."
+            raise ValueError(msg)
+        self.archive_filename = archive_filename
+        self.layout = layout
+        self._archive: ArchiveWriter | None = None
+
+    def before_any(self) -> None:
+        """Create the archive."""
+        from dicognito.archives import ArchiveWriter
+
+        self._archive = ArchiveWriter(self.archive_filename)
+
+    def member_name(self, dataset: pydicom.dataset.Dataset) -> str:
+        """Return the name of the archive member the anonymized dataset is saved as."""
+        return "/".join(_get_output_path(dataset, self.layout))
+
+    def output_filename(self, dataset: pydicom.dataset.Dataset) -> str:
+        """Return the name of the archive member the anonymized dataset is saved as, joined to the archive's name."""
+        return os.path.join(self.archive_filename, *_get_output_path(dataset, self.layout))
+
+    def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
+        """Save anonymized instance as an archive member named by new SOP Instance UID."""
+        from dicognito import header_only
+
+        if self._archive is None:
+            msg = "The archive has not been created. Call before_any first."
+            raise RuntimeError(msg)
+        # Only one instance can be added to the archive at a time, so write the
+        # instance to a temporary file first, without holding up other threads.
+        with tempfile.TemporaryFile() as output_file:
+            header_only.write(dataset, output_file)
+            self._archive.add(self.member_name(dataset), output_file)
+
+    def after_all(self) -> None:
+        """Finish writing the archive."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class WriteToStream(Filter):
+    """Writes anonymized instances to a stream, such as standard output, each preceded by its length."""
+
+    def __init__(self, output_file: IO[bytes]):
+        """
+        Create a new WriteToStream.
+
+        Parameters
+        ----------
+        output_file : IO[bytes]
+            The stream to write to. See dicognito.streams for its format.
+
+        """
+        self.output_file = output_file
+        self._lock = threading.Lock()
+
+    def output_filename(self, dataset: pydicom.dataset.Dataset) -> str:  # noqa: ARG002
+        """Return the name of the stream the anonymized dataset is written to."""
+        return str(getattr(self.output_file, "name", "<stream>"))
+
+    def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
+        """Write anonymized instance to the stream."""
+        from dicognito import streams
+
+        with self._lock:
+            streams.write_dataset(dataset, self.output_file)
+
+
+def _get_output_path(dataset: pydicom.dataset.Dataset, layout: str) -> tuple[str, ...]:
+    """Return the parts of the path, relative to the output location, to save an anonymized dataset to."""
+    sop_instance_uid = str(dataset.SOPInstanceUID)
+    if layout == "hash":
+        digest = hashlib.blake2b(sop_instance_uid.encode("utf8"), digest_size=2).hexdigest()
+        subdirectories: tuple[str, ...] = (digest[:2], digest[2:])
+    elif layout == "hierarchy":
+        subdirectories = tuple(
+            _safe_filename(str(dataset.get(keyword, "")))
+            for keyword in ("PatientID", "StudyInstanceUID", "SeriesInstanceUID")
+        )
+    else:
+        subdirectories = ()
+    return (*subdirectories, _safe_filename(sop_instance_uid) + ".dcm")
+
+
+def _safe_filename(value: str) -> str:
+    """Make a value, such as a kept PatientID, safe to use as a file or directory name."""
+    safe_value = re.sub(r"[^A-Za-z0-9._-]", "_", value.strip())
+    return safe_value if safe_value.strip(".") else "_"
+
+
+class RecordInManifest(Filter):
+    """
+    Records anonymized instances in a manifest, so an interrupted run can be resumed.
+
+    Add to a pipeline before the filter that saves instances, so that
+    instances are recorded after they've been saved.
+    """
+
+    def __init__(self, manifest: Manifest, output_filename: Callable[[pydicom.dataset.Dataset], str]):
+        """
+        Create a new RecordInManifest.
+
+        Parameters
+        ----------
+        manifest : dicognito.manifest.Manifest
+            The manifest to record instances in.
+
+        output_filename : Callable[[pydicom.dataset.Dataset], str]
+            Returns the name of the file an anonymized instance was saved to.
+
+        """
+        self.manifest = manifest
+        self.output_filename = output_filename
+        self._original_stats: dict[int, os.stat_result] = {}
+
+    def before_each(self, dataset: pydicom.dataset.Dataset) -> None:
+        """Remember the original file's size and modification time."""
+        self._original_stats[id(dataset)] = os.stat(dataset.filename)
+
+    def after_each(self, dataset: pydicom.dataset.Dataset) -> None:
+        """Record the original and anonymized files in the manifest."""
+        stat = self._original_stats.pop(id(dataset))
+        self.manifest.record(dataset.filename, stat.st_size, stat.st_mtime_ns, self.output_filename(dataset))
@@ -1,6 +1,6 @@
 """Replace certain values to obscure patient's identity."""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 
 import pydicom
 
@@ -57,3 +57,7 @@ class FixedValueAnonymizer(ElementAnonymizer):
     def describe_actions(self) -> Iterator[str]:
         """Describe the actions this anonymizer performs."""
         yield f'Replace {pydicom.datadict.keyword_for_tag(self.tag)} with "{self.value}"'
+
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return (self.tag,)
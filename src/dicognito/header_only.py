@@ -0,0 +1,552 @@
+"""
+Read and write DICOM files' headers, passing pixel data through untouched.
+
+Reading stops before the top-level pixel data element, so the pixel data
+is never loaded. Any elements after the pixel data, such as private
+groups, digital signatures, or trailing padding, are read too, so they are
+anonymized along with the header. When the dataset is saved, the original
+pixel data element alone is copied directly from the original file, using
+os.copy_file_range or os.sendfile where available, between the anonymized
+header and the anonymized elements that follow it.
+
+Files are written under a temporary name, ending in TEMPORARY_FILE_SUFFIX,
+and renamed once complete, so partially-written files never appear under
+their final names.
+
+Alternatively, when anonymizing in place, overwrite_header writes the
+anonymized header over the original one, leaving the pixel data where it
+is on disk, if the new header can be made the same length as the old.
+
+DICOM objects held in memory are read by read_header_from_buffer, which
+likewise parses only the header. The pixel data is copied straight from
+the original buffer when the dataset is written, by to_bytes, write, or
+write_into.
+
+Examples
+--------
+>>> anonymizer = Anonymizer()
+>>> with read_header(filename) as dataset:
+>>>     anonymizer.anonymize(dataset)
+>>>     save_as(dataset, "new-" + filename)
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import shutil
+import struct
+import uuid
+import warnings
+from typing import TYPE_CHECKING, BinaryIO, cast
+
+import pydicom
+from pydicom.uid import DeflatedExplicitVRLittleEndian
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Final
+
+_PIXEL_DATA_OFFSET_ATTRIBUTE: Final = "dicognito_pixel_data_offset"
+_PIXEL_DATA_END_ATTRIBUTE: Final = "dicognito_pixel_data_end"
+_PIXEL_DATA_TAG_ATTRIBUTE: Final = "dicognito_pixel_data_tag"
+_SOURCE_BUFFER_ATTRIBUTE: Final = "dicognito_source_buffer"
+
+TEMPORARY_FILE_SUFFIX: Final = ".dicognito-tmp"
+
+_HEADER_READ_SIZE: Final = 64 * 1024
+_COPY_CHUNK_SIZE: Final = 1024 * 1024
+
+# Explicit VR elements with these VRs have 4-byte lengths, rather than 2-byte ones.
+_LONG_LENGTH_VRS: Final = frozenset(
+    (b"OB", b"OD", b"OF", b"OL", b"OV", b"OW", b"SQ", b"SV", b"UC", b"UN", b"UR", b"UT", b"UV")
+)
+_SEQUENCE_DELIMITATION_TAG: Final = 0xFFFEE0DD
+_UNDEFINED_LENGTH: Final = 0xFFFFFFFF
+
+PADDING_GROUP: Final = 0x7FDF
+PADDING_PRIVATE_CREATOR: Final = "DICOGNITO"
+
+
+def read_header(filename: str) -> pydicom.dataset.FileDataset:
+    """
+    Read a DICOM file, stopping before the pixel data.
+
+    Any elements after the pixel data are read as well. Files that use the
+    Deflated Explicit VR Little Endian transfer syntax can't have their pixel
+    data copied separately, so are read completely, as are files whose pixel
+    data element can't be parsed.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the DICOM file to read.
+
+    Raises
+    ------
+    pydicom.errors.InvalidDicomError
+        If the file is not a DICOM file.
+
+    """
+    with open(filename, "rb") as file:
+        dataset = pydicom.dcmread(file, stop_before_pixels=True, force=False)
+        pixel_data_offset = file.tell()
+        size = os.fstat(file.fileno()).st_size
+
+        def read_at(position: int, length: int) -> bytes:
+            file.seek(position)
+            return file.read(length)
+
+        pixel_data = None
+        if dataset.file_meta.get("TransferSyntaxUID") != DeflatedExplicitVRLittleEndian:
+            pixel_data = _find_pixel_data(dataset, pixel_data_offset, size, read_at)
+        if pixel_data is not None:
+            (pixel_data_tag, pixel_data_end) = pixel_data
+            if pixel_data_end < size:
+                file.seek(pixel_data_end)
+                _read_elements_after_pixel_data(dataset, file)
+
+    if pixel_data is None:
+        return pydicom.dcmread(filename, force=False)
+
+    _set_pixel_data_location(dataset, pixel_data_offset, pixel_data_end, pixel_data_tag)
+    return dataset
+
+
+def read_header_from_buffer(buffer: bytes | bytearray | memoryview) -> pydicom.dataset.FileDataset:
+    """
+    Read a DICOM object held in memory, stopping before the pixel data.
+
+    Any elements after the pixel data are read as well. Objects that use the
+    Deflated Explicit VR Little Endian transfer syntax, or whose pixel data
+    element can't be parsed, are read completely. Otherwise, only the header
+    and any elements after the pixel data of a buffer that isn't a bytes
+    object are copied while reading, so the pixel data is never copied.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview
+        The DICOM Part-10 object. It must not be changed until the dataset
+        has been written, since the pixel data is copied from it then.
+
+    Raises
+    ------
+    pydicom.errors.InvalidDicomError
+        If the buffer does not hold a DICOM object.
+
+    """
+    view = memoryview(buffer).cast("B")
+    # Reading from a BytesIO is much faster than from a file-like object
+    # implemented in Python. A BytesIO shares the memory of a bytes object,
+    # but copies other buffers, so read those from copies of ever-larger
+    # prefixes until one holds the whole header, leaving the pixel data
+    # uncopied.
+    read_size = len(view) if isinstance(buffer, bytes) else _HEADER_READ_SIZE
+    header = None
+    while header is None and read_size < len(view):
+        header = _read_header_from_prefix(view[:read_size])
+        read_size *= 2
+    if header is None:
+        reader = io.BytesIO(buffer if isinstance(buffer, bytes) else view)
+        header = (pydicom.dcmread(reader, stop_before_pixels=True, force=False), reader.tell())
+    (dataset, pixel_data_offset) = header
+
+    pixel_data = None
+    if dataset.file_meta.get("TransferSyntaxUID") != DeflatedExplicitVRLittleEndian:
+        pixel_data = _find_pixel_data(
+            dataset,
+            pixel_data_offset,
+            len(view),
+            lambda position, length: bytes(view[position : position + length]),
+        )
+    if pixel_data is None:
+        return pydicom.dcmread(io.BytesIO(buffer if isinstance(buffer, bytes) else view), force=False)
+
+    (pixel_data_tag, pixel_data_end) = pixel_data
+    if pixel_data_end < len(view):
+        _read_elements_after_pixel_data(dataset, io.BytesIO(view[pixel_data_end:]))
+    _set_pixel_data_location(dataset, pixel_data_offset, pixel_data_end, pixel_data_tag)
+    setattr(dataset, _SOURCE_BUFFER_ATTRIBUTE, view)
+    return dataset
+
+
+def _read_header_from_prefix(prefix: memoryview) -> tuple[pydicom.dataset.FileDataset, int] | None:
+    """Read the header from the start of a buffer, or return None if the header doesn't end before the prefix does."""
+    reader = io.BytesIO(prefix)
+    # A header cut short by the end of the prefix may raise any of several
+    # errors, or warn, so only report warnings once the header's known to be whole.
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        try:
+            dataset = pydicom.dcmread(reader, stop_before_pixels=True, force=False)
+        except Exception:  # noqa: BLE001
+            return None
+
+    # Reading stops before the end of the prefix only when it reaches the pixel data.
+    pixel_data_offset = reader.tell()
+    if pixel_data_offset >= len(prefix):
+        return None
+    for caught_warning in caught_warnings:
+        warnings.warn_explicit(
+            caught_warning.message,
+            caught_warning.category,
+            caught_warning.filename,
+            caught_warning.lineno,
+        )
+    return (dataset, pixel_data_offset)
+
+
+def to_bytes(dataset: pydicom.dataset.Dataset) -> bytes:
+    """
+    Encode a dataset as a DICOM Part-10 object.
+
+    If the dataset was read by read_header_from_buffer, the original pixel
+    data is copied from the buffer once, directly into the result.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to encode.
+
+    Returns
+    -------
+    The encoded object.
+
+    """
+    pixel_data_offset: int | None = getattr(dataset, _PIXEL_DATA_OFFSET_ATTRIBUTE, None)
+    source_buffer: memoryview | None = getattr(dataset, _SOURCE_BUFFER_ATTRIBUTE, None)
+    if pixel_data_offset is not None and source_buffer is not None:
+        (header, trailer) = _encode_around_pixel_data(dataset)
+        return b"".join((header, source_buffer[pixel_data_offset : _pixel_data_end(dataset)], trailer))
+    output_file = io.BytesIO()
+    write(dataset, output_file)
+    return output_file.getvalue()
+
+
+def write_into(dataset: pydicom.dataset.Dataset, output_buffer: bytearray | memoryview) -> int:
+    """
+    Encode a dataset as a DICOM Part-10 object, into the start of a writable buffer.
+
+    If the dataset was read by read_header_from_buffer, the original pixel
+    data is copied from the buffer once, directly into the output buffer.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to encode.
+    output_buffer : bytearray | memoryview
+        The buffer to write the object into. It is not resized.
+
+    Returns
+    -------
+    The number of bytes written.
+
+    Raises
+    ------
+    ValueError
+        If the object is larger than the output buffer. Nothing is written.
+
+    """
+    pixel_data_offset: int | None = getattr(dataset, _PIXEL_DATA_OFFSET_ATTRIBUTE, None)
+    source_buffer: memoryview | None = getattr(dataset, _SOURCE_BUFFER_ATTRIBUTE, None)
+    if pixel_data_offset is not None and source_buffer is not None:
+        (header, trailer) = _encode_around_pixel_data(dataset)
+        parts: tuple[bytes | memoryview, ...] = (
+            header,
+            source_buffer[pixel_data_offset : _pixel_data_end(dataset)],
+            trailer,
+        )
+    else:
+        parts = (to_bytes(dataset),)
+
+    size = sum(len(part) for part in parts)
+    with memoryview(output_buffer).cast("B") as output:
+        if size > len(output):
+            msg = f"The output buffer is too small: the object takes {size} bytes, but the buffer holds {len(output)}."
+            raise ValueError(msg)
+        position = 0
+        for part in parts:
+            output[position : position + len(part)] = part
+            position += len(part)
+    return size
+
+
+def save_as(dataset: pydicom.dataset.Dataset, filename: str) -> None:
+    """
+    Save a dataset as a DICOM file.
+
+    If the dataset was read by read_header, the original file's pixel data
+    is copied into the new file without being loaded. Otherwise, the
+    dataset is saved normally.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to save.
+
+    filename : str
+        The name of the file to write. The file is written under a temporary
+        name in the same directory, then renamed, replacing any existing file,
+        whose permissions are kept. May be the name of the file the dataset
+        was read from.
+
+    """
+    directory, basename = os.path.split(filename)
+    temporary_filename = os.path.join(directory, f".{basename}.{uuid.uuid4().hex}{TEMPORARY_FILE_SUFFIX}")
+    try:
+        with open(temporary_filename, "xb") as output_file:
+            write(dataset, output_file)
+        if os.path.exists(filename):
+            shutil.copymode(filename, temporary_filename)
+        os.replace(temporary_filename, filename)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temporary_filename)
+        raise
+
+
+def write(dataset: pydicom.dataset.Dataset, output_file: BinaryIO) -> None:
+    """
+    Write a dataset as a DICOM file to an open file.
+
+    If the dataset was read by read_header or read_header_from_buffer, the
+    original pixel data is copied into the new file without being loaded.
+    Otherwise, the dataset is written normally.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to write.
+
+    output_file : BinaryIO
+        The file to write to, opened for binary writing.
+
+    """
+    pixel_data_offset: int | None = getattr(dataset, _PIXEL_DATA_OFFSET_ATTRIBUTE, None)
+    source_buffer: memoryview | None = getattr(dataset, _SOURCE_BUFFER_ATTRIBUTE, None)
+    if pixel_data_offset is None:
+        dataset.save_as(output_file, enforce_file_format=True)
+        return
+
+    (header, trailer) = _encode_around_pixel_data(dataset)
+    pixel_data_end = _pixel_data_end(dataset)
+    output_file.write(header)
+    if source_buffer is not None:
+        output_file.write(source_buffer[pixel_data_offset:pixel_data_end])
+    else:
+        output_file.flush()
+        with open(dataset.filename, "rb") as source_file:
+            _copy_range(source_file, pixel_data_offset, pixel_data_end, output_file)
+    output_file.write(trailer)
+
+
+def overwrite_header(dataset: pydicom.dataset.Dataset) -> bool:
+    """
+    Overwrite the header of the file a dataset was read from, leaving the pixel data untouched.
+
+    The pixel data bytes on disk are never read or written. Any elements
+    after the pixel data are rewritten in place, and the file truncated
+    after them. This is only
+    possible if the dataset was read from a file by read_header and its header, when
+    encoded, is no longer than the original one. A shorter header is
+    lengthened by a private padding element, with creator
+    PADDING_PRIVATE_CREATOR in group PADDING_GROUP, which sorts just before
+    the pixel data. Any such padding element already in the dataset is
+    replaced.
+
+    Unlike save_as, a failure while writing the header can leave the file
+    damaged.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to save.
+
+    Returns
+    -------
+    True if the header was overwritten, or False if it could not be, in which
+    case the file is unchanged. The dataset may then be saved by save_as.
+
+    """
+    pixel_data_offset: int | None = getattr(dataset, _PIXEL_DATA_OFFSET_ATTRIBUTE, None)
+    if pixel_data_offset is None or hasattr(dataset, _SOURCE_BUFFER_ATTRIBUTE):
+        return False
+
+    _remove_padding(dataset)
+    (header, trailer) = _encode_around_pixel_data(dataset)
+    if len(header) < pixel_data_offset:
+        padding = dataset.private_block(PADDING_GROUP, PADDING_PRIVATE_CREATOR, create=True)
+        padding.add_new(0x00, "OB", b"")
+        padding_length = pixel_data_offset - len(_encode_around_pixel_data(dataset)[0])
+        # Element values always have even lengths.
+        if padding_length >= 0 and padding_length % 2 == 0:
+            padding[0x00].value = bytes(padding_length)
+            (header, trailer) = _encode_around_pixel_data(dataset)
+    if len(header) != pixel_data_offset:
+        _remove_padding(dataset)
+        return False
+
+    with open(dataset.filename, "r+b") as file:
+        file.write(header)
+        file.seek(_pixel_data_end(dataset))
+        file.write(trailer)
+        file.truncate()
+    return True
+
+
+def _find_pixel_data(
+    dataset: pydicom.dataset.FileDataset,
+    pixel_data_offset: int,
+    size: int,
+    read_at: Callable[[int, int], bytes],
+) -> tuple[int | None, int] | None:
+    """
+    Find the tag of the pixel data element that starts at the offset, and where the element ends.
+
+    The tag is None if there is no pixel data. Returns None if the element
+    can't be parsed, or runs past the end of the object.
+    """
+    if pixel_data_offset >= size:
+        return (None, size)
+
+    (is_implicit_vr, is_little_endian) = dataset.original_encoding
+    byte_order = "<" if is_little_endian else ">"
+    header = read_at(pixel_data_offset, 12)
+    if len(header) < 8:  # noqa: PLR2004
+        return None
+    (group, element) = struct.unpack_from(byte_order + "HH", header)
+    if is_implicit_vr:
+        (length,) = struct.unpack_from(byte_order + "L", header, 4)
+        position = pixel_data_offset + 8
+    elif header[4:6] in _LONG_LENGTH_VRS:
+        if len(header) < 12:  # noqa: PLR2004
+            return None
+        (length,) = struct.unpack_from(byte_order + "L", header, 8)
+        position = pixel_data_offset + 12
+    else:
+        (length,) = struct.unpack_from(byte_order + "H", header, 6)
+        position = pixel_data_offset + 8
+
+    end = _find_end_of_items(position, byte_order, read_at) if length == _UNDEFINED_LENGTH else position + length
+    if end is None or end > size:
+        return None
+    return (group << 16 | element, end)
+
+
+def _find_end_of_items(position: int, byte_order: str, read_at: Callable[[int, int], bytes]) -> int | None:
+    """Find the end of encapsulated pixel data: items, each with its own length, up to a sequence delimiter."""
+    while True:
+        item_header = read_at(position, 8)
+        if len(item_header) < 8:  # noqa: PLR2004
+            return None
+        (group, element, item_length) = struct.unpack(byte_order + "HHL", item_header)
+        position += 8
+        if (group << 16 | element) == _SEQUENCE_DELIMITATION_TAG:
+            return position
+        position += item_length
+
+
+def _read_elements_after_pixel_data(dataset: pydicom.dataset.FileDataset, file: BinaryIO) -> None:
+    """Add the elements from the file's position to its end, which follow the pixel data, to the dataset."""
+    # A dataset read from a file always knows its encoding.
+    (is_implicit_vr, is_little_endian) = cast("tuple[bool, bool]", dataset.original_encoding)
+    elements = pydicom.filereader.read_dataset(
+        file,
+        is_implicit_vr,
+        is_little_endian,
+        parent_encoding=dataset.original_character_set,
+    )
+    dataset.update(elements)
+
+
+def _set_pixel_data_location(
+    dataset: pydicom.dataset.Dataset,
+    pixel_data_offset: int,
+    pixel_data_end: int,
+    pixel_data_tag: int | None,
+) -> None:
+    setattr(dataset, _PIXEL_DATA_OFFSET_ATTRIBUTE, pixel_data_offset)
+    setattr(dataset, _PIXEL_DATA_END_ATTRIBUTE, pixel_data_end)
+    setattr(dataset, _PIXEL_DATA_TAG_ATTRIBUTE, pixel_data_tag)
+
+
+def _pixel_data_end(dataset: pydicom.dataset.Dataset) -> int:
+    pixel_data_end: int = getattr(dataset, _PIXEL_DATA_END_ATTRIBUTE)
+    return pixel_data_end
+
+
+def _encode_around_pixel_data(dataset: pydicom.dataset.Dataset) -> tuple[bytes, bytes]:
+    """Encode a dataset read without its pixel data as the bytes that go before the pixel data and those that go after."""
+    pixel_data_tag: int | None = getattr(dataset, _PIXEL_DATA_TAG_ATTRIBUTE, None)
+    trailing_elements = (
+        []
+        if pixel_data_tag is None
+        else [dataset.get_item(tag) for tag in sorted(dataset.keys()) if tag > pixel_data_tag]
+    )
+    if not trailing_elements:
+        return (_encode(dataset), b"")
+
+    for trailing_element in trailing_elements:
+        del dataset[trailing_element.tag]
+    try:
+        header = _encode(dataset)
+    finally:
+        for trailing_element in trailing_elements:
+            dataset[trailing_element.tag] = trailing_element
+
+    # The trailing elements are encoded last, so are whatever follows the header
+    # when the whole dataset is encoded. Encoding them this way ensures they use
+    # the same transfer syntax and character set as the header.
+    return (header, _encode(dataset)[len(header) :])
+
+
+def _encode(dataset: pydicom.dataset.Dataset) -> bytes:
+    buffer = io.BytesIO()
+    dataset.save_as(buffer, enforce_file_format=True)
+    return buffer.getvalue()
+
+
+def _remove_padding(dataset: pydicom.dataset.Dataset) -> None:
+    try:
+        padding = dataset.private_block(PADDING_GROUP, PADDING_PRIVATE_CREATOR)
+    except KeyError:
+        return
+    for offset in range(0x100):
+        tag = padding.get_tag(offset)
+        if tag in dataset:
+            del dataset[tag]
+    del dataset[PADDING_GROUP, padding.block_start >> 8]
+
+
+def _copy_range(source_file: BinaryIO, offset: int, end: int, output_file: BinaryIO) -> None:
+    source_fd = source_file.fileno()
+
+    # Let the kernel copy the bytes, if it can. Both functions write at (and
+    # advance) the output file's current position.
+    try:
+        output_fd = output_file.fileno()
+        if hasattr(os, "copy_file_range"):
+            while offset < end:
+                copied = os.copy_file_range(source_fd, output_fd, end - offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+        elif hasattr(os, "sendfile"):
+            while offset < end:
+                copied = os.sendfile(output_fd, source_fd, offset, end - offset)
+                if copied == 0:
+                    break
+                offset += copied
+    except OSError:
+        # Not supported for these files, or the output is in memory. Copy the rest the ordinary way.
+        pass
+
+    source_file.seek(offset)
+    while offset < end:
+        chunk = source_file.read(min(end - offset, _COPY_CHUNK_SIZE))
+        if not chunk:
+            break
+        output_file.write(chunk)
+        offset += len(chunk)
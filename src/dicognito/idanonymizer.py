@@ -1,9 +1,10 @@
 """Replace identifier values with something that obscures the patient's identity."""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 
 import pydicom
 
+from dicognito.anonymization_context import AnonymizationContext
 from dicognito.element_anonymizer import ElementAnonymizer
 from dicognito.randomizer import Randomizer
 
@@ -12,6 +13,7 @@ class IDAnonymizer(ElementAnonymizer):
     """Identifier anonymizer."""
 
     _alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    _mitra_linked_attributes_group = 0x0031
 
     def __init__(self, randomizer: Randomizer, id_prefix: str, id_suffix: str, *keywords: str):
         """
@@ -41,6 +43,12 @@ class IDAnonymizer(ElementAnonymizer):
         total_affixes_length = len(self.id_prefix) + len(self.id_suffix)
         self._indices_for_randomizer = [len(self._alphabet)] * (12 - total_affixes_length)
 
+        # Replacements are recorded with their affixes, so anonymizers with
+        # different affixes must not share them.
+        self._replacement_category = (
+            f"ID prefix={self.id_prefix!r} suffix={self.id_suffix!r}" if total_affixes_length else "ID"
+        )
+
     def __call__(self, dataset: pydicom.dataset.Dataset, data_element: pydicom.DataElement) -> bool:
         """
         Replace ID elements with something that obscures the patient's identity.
@@ -84,20 +92,27 @@ class IDAnonymizer(ElementAnonymizer):
         yield 'Replace IssuerOfPatientID with "DICOGNITO"'
         yield 'Replace private "MITRA LINKED ATTRIBUTES 1.0" element "Global Patient ID" with anonymized values'
 
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return [*self.id_tags, self.issuer_tag]
+
+    def handled_groups(self) -> Collection[int]:
+        """Return the groups (typically private) of the elements this anonymizer may act on."""
+        return (self._mitra_linked_attributes_group,)
+
     def _anonymize_mitra_global_patient_id(
         self,
         dataset: pydicom.dataset.Dataset,
         data_element: pydicom.DataElement,
     ) -> bool:
-        mitra_linked_attributes_group = 0x0031
+        mitra_linked_attributes_group = self._mitra_linked_attributes_group
         mitra_global_patient_id_element = 0x0020
         if (
             data_element.tag.group == mitra_linked_attributes_group
             and data_element.tag.element & 0x00FF == mitra_global_patient_id_element
         ):
-            private_tag_group = data_element.tag.element >> 8
-            element = dataset.get((mitra_linked_attributes_group, private_tag_group), None)
-            if element and element.value == "MITRA LINKED ATTRIBUTES 1.0":
+            context = self.context or AnonymizationContext(dataset)
+            if context.private_creator(dataset, data_element.tag) == "MITRA LINKED ATTRIBUTES 1.0":
                 # For pydicom 2.2.0 and above (at least to 2.2.2) the Mitra global patient ID tag
                 # can be misidentified as VR IS, instead of its proper LO. This causes
                 # the anonymize action to fail because most values can't be converted.
@@ -112,9 +127,12 @@ class IDAnonymizer(ElementAnonymizer):
 
     def _replace_id(self, data_element: pydicom.DataElement) -> None:
         if isinstance(data_element.value, pydicom.multival.MultiValue):
-            data_element.value = [self._new_id(original_id) for original_id in data_element.value]
+            data_element.value = [self._get_replacement_id(original_id) for original_id in data_element.value]
         else:
-            data_element.value = self._new_id(data_element.value)
+            data_element.value = self._get_replacement_id(data_element.value)
+
+    def _get_replacement_id(self, original_value: str) -> str:
+        return self.randomizer.get_replacement(self._replacement_category, original_value, self._new_id)
 
     def _new_id(self, original_value: str) -> str:
         indexes = self.randomizer.get_ints_from_ranges(original_value, *self._indices_for_randomizer)
@@ -0,0 +1,150 @@
+"""
+Record which files have been anonymized, so an interrupted run can be resumed.
+
+A manifest is a SQLite database holding the configuration of the run that
+created it (including the seed) and, for each input file that has been
+anonymized, the file's size and modification time and where its anonymized
+version was written.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from dicognito.exceptions import ManifestError
+
+
+class Manifest:
+    """A record of the files anonymized by a run, and of the configuration used."""
+
+    def __init__(self, filename: str):
+        """
+        Open a manifest, creating it if necessary.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the SQLite database file that holds the manifest.
+
+        """
+        self._lock = threading.Lock()
+        # Commit each statement as it's executed, and allow files to be recorded
+        # from any thread (or, via separate Manifests, any process).
+        self._connection = sqlite3.connect(filename, timeout=60, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS configuration (name TEXT PRIMARY KEY, value TEXT)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "output_path TEXT, output_size INTEGER, output_mtime_ns INTEGER)",
+        )
+
+    def close(self) -> None:
+        """Close the manifest."""
+        self._connection.close()
+
+    @property
+    def configuration(self) -> dict[str, Any] | None:
+        """The configuration of the run that created the manifest, or None if none has been recorded."""
+        row = self._connection.execute("SELECT value FROM configuration WHERE name = 'run'").fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def start(self, configuration: dict[str, Any]) -> None:
+        """
+        Start a new run, forgetting any previously-recorded files.
+
+        Parameters
+        ----------
+        configuration : dict[str, Any]
+            The configuration of the new run. Must be serializable as JSON.
+
+        """
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.execute("DELETE FROM files")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO configuration (name, value) VALUES ('run', ?)",
+                (json.dumps(configuration, sort_keys=True),),
+            )
+            self._connection.execute("COMMIT")
+
+    def resume(self, configuration: dict[str, Any]) -> None:
+        """
+        Resume a previous run, checking that its configuration matches.
+
+        Parameters
+        ----------
+        configuration : dict[str, Any]
+            The configuration of the resumed run.
+
+        Raises
+        ------
+        ManifestError
+            If the manifest has no configuration, or the configurations differ.
+
+        """
+        recorded_configuration = self.configuration
+        if recorded_configuration is None:
+            msg = "The manifest does not record a previous run."
+            raise ManifestError(msg)
+        differences = sorted(
+            name
+            for name in recorded_configuration.keys() | configuration.keys()
+            if recorded_configuration.get(name) != configuration.get(name)
+        )
+        if differences:
+            msg = f"The configuration differs from that of the previous run: {', '.join(differences)}."
+            raise ManifestError(msg)
+
+    def is_done(self, filename: str) -> bool:
+        """
+        Determine whether a file has already been anonymized.
+
+        The file is not read. It's done if it's recorded in the manifest and
+        its size and modification time are unchanged since it was recorded,
+        or, if it was anonymized in place, match those of the anonymized file.
+        """
+        path = os.path.abspath(filename)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, output_path, output_size, output_mtime_ns FROM files WHERE path = ?",
+                (path,),
+            ).fetchone()
+        if row is None:
+            return False
+        size, mtime_ns, output_path, output_size, output_mtime_ns = row
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        current = (stat.st_size, stat.st_mtime_ns)
+        return current == (size, mtime_ns) or (output_path == path and current == (output_size, output_mtime_ns))
+
+    def record(self, filename: str, size: int, mtime_ns: int, output_filename: str) -> None:
+        """
+        Record that a file has been anonymized.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the input file.
+        size : int
+            The input file's size, before it was anonymized.
+        mtime_ns : int
+            The input file's modification time, in nanoseconds, before it was anonymized.
+        output_filename : str
+            The name of the file the anonymized dataset was written to.
+
+        """
+        output_path = os.path.abspath(output_filename)
+        output_stat = os.stat(output_path)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(filename), size, mtime_ns, output_path, output_stat.st_size, output_stat.st_mtime_ns),
+            )
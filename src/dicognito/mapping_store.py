@@ -0,0 +1,208 @@
+"""
+Remember the replacement chosen for each original value, across runs.
+
+A mapping store is a SQLite database of (category, original, replacement)
+rows. When a Randomizer has a mapping store, a value that has been
+anonymized before is given the same replacement as last time, even if the
+seed has changed, and new replacements are recorded for later runs.
+
+The store can also be exported in bulk, or searched by replacement value
+to find the original values that were replaced.
+
+Examples
+--------
+>>> with MappingStore("mappings.db") as mapping_store:
+>>>     anonymizer = Anonymizer(mapping_store=mapping_store)
+>>>     for filename in filenames:
+>>>         with load_instance(filename) as dataset:
+>>>             anonymizer.anonymize(dataset)
+>>>             dataset.save_as("new-" + filename)
+
+"""
+
+from __future__ import annotations
+
+import collections
+import csv
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+
+class MappingStore:
+    """A persistent record of the replacements chosen for original values."""
+
+    def __init__(self, filename: str, batch_size: int = 1000, cache_size: int = 4096):
+        """
+        Open a mapping store, creating it if necessary.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the SQLite database file that holds the mappings.
+            Several processes may use the same file at once.
+        batch_size : int
+            The number of new mappings to hold in memory before writing them
+            to the database. Mappings not yet written are written by flush
+            or close.
+        cache_size : int
+            The number of recently used mappings to remember, so they can be
+            found again without querying the database.
+
+        """
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._pending: dict[tuple[str, str], str] = {}
+        self._cache: collections.OrderedDict[tuple[str, str], str] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, timeout=60, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mappings ("
+            "category TEXT NOT NULL, original TEXT NOT NULL, replacement TEXT NOT NULL, "
+            "PRIMARY KEY (category, original)) WITHOUT ROWID",
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS mappings_by_replacement ON mappings (replacement, category)",
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> MappingStore:  # noqa: PYI034
+        """Return the mapping store, to be closed on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the mapping store."""
+        self.close()
+
+    def get(self, category: str, original: str) -> str | None:
+        """
+        Find the replacement recorded for an original value.
+
+        Parameters
+        ----------
+        category : str
+            The kind of value, such as "ID" or "UI". The same original value
+            may have different replacements in different categories.
+        original : str
+            The original value.
+
+        Returns
+        -------
+        The replacement, or None if none has been recorded.
+
+        """
+        key = (category, original)
+        with self._lock:
+            replacement = self._cache.get(key)
+            if replacement is not None:
+                self._cache.move_to_end(key)
+                return replacement
+            replacement = self._pending.get(key)
+            if replacement is None:
+                row = self._connection.execute(
+                    "SELECT replacement FROM mappings WHERE category = ? AND original = ?",
+                    key,
+                ).fetchone()
+                if row is None:
+                    return None
+                replacement = str(row[0])
+            self._remember(key, replacement)
+        return replacement
+
+    def put(self, category: str, original: str, replacement: str) -> None:
+        """
+        Record the replacement for an original value.
+
+        If a replacement has already been recorded for the value, perhaps by
+        another process, the earlier replacement is kept.
+        """
+        with self._lock:
+            self._pending[(category, original)] = replacement
+            if (category, original) not in self._cache:
+                self._remember((category, original), replacement)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Write any mappings held in memory to the database."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Write any mappings held in memory to the database, and close it."""
+        self.flush()
+        self._connection.close()
+
+    def find_originals(self, replacement: str, category: str | None = None) -> list[tuple[str, str]]:
+        """
+        Find the original values that were given a replacement.
+
+        Parameters
+        ----------
+        replacement : str
+            The replacement value, as found in an anonymized dataset.
+        category : str, optional
+            If given, only original values of this category are found.
+
+        Returns
+        -------
+        The (category, original) pairs that were given the replacement.
+
+        """
+        self.flush()
+        query = "SELECT category, original FROM mappings WHERE replacement = ?"
+        parameters: tuple[str, ...] = (replacement,)
+        if category is not None:
+            query += " AND category = ?"
+            parameters += (category,)
+        with self._lock:
+            return [
+                (str(found_category), str(original))
+                for (found_category, original) in self._connection.execute(query, parameters)
+            ]
+
+    def mappings(self) -> Iterator[tuple[str, str, str]]:
+        """Yield every (category, original, replacement) mapping, ordered by category and original value."""
+        self.flush()
+        yield from self._connection.execute(
+            "SELECT category, original, replacement FROM mappings ORDER BY category, original",
+        )
+
+    def export_csv(self, output_file: TextIO) -> None:
+        """Write every mapping to a CSV file, with a header row."""
+        writer = csv.writer(output_file)
+        writer.writerow(("category", "original", "replacement"))
+        writer.writerows(self.mappings())
+
+    def _remember(self, key: tuple[str, str], replacement: str) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = replacement
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO mappings (category, original, replacement) VALUES (?, ?, ?)",
+                ((category, original, replacement) for ((category, original), replacement) in self._pending.items()),
+            )
+        # Another process may have recorded a different replacement first, so
+        # forget the written ones and look them up again when next needed.
+        for key in self._pending:
+            self._cache.pop(key, None)
+        self._pending.clear()
@@ -36,6 +36,11 @@ And run as an anonymization session on two datasets, the following calls would b
 
 * Filter2.after_all()
 * Filter1.after_all()
+
+Each stage runs for one dataset at a time, in the order the datasets are
+anonymized. When the command-line tool is run with --io-threads, datasets
+are written on another thread, so a dataset's after_each stage may run while
+the next dataset's before_each stage does.
 """
 
 from __future__ import annotations
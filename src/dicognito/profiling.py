@@ -0,0 +1,202 @@
+"""Record where an anonymization run spends its time."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pydicom
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class HandlerStatistics:
+    """How often an element handler was offered elements, how often it claimed them, and how long it took."""
+
+    def __init__(self) -> None:
+        """Create a new, empty, HandlerStatistics."""
+        self.calls = 0
+        self.claims = 0
+        self.seconds = 0.0
+        self.claimed_tags: dict[int, int] = {}
+
+    def merge(self, other: HandlerStatistics) -> None:
+        """Add another HandlerStatistics' counts and times to this one's."""
+        self.calls += other.calls
+        self.claims += other.claims
+        self.seconds += other.seconds
+        for tag, count in other.claimed_tags.items():
+            self.claimed_tags[tag] = self.claimed_tags.get(tag, 0) + count
+
+    def to_json_object(self) -> dict[str, Any]:
+        """Convert to an object that can be written as JSON."""
+        return {
+            "calls": self.calls,
+            "claims": self.claims,
+            "seconds": self.seconds,
+            "claimed_tags": {str(pydicom.tag.Tag(tag)): count for tag, count in sorted(self.claimed_tags.items())},
+        }
+
+
+class FileTimings:
+    """The time taken to read, anonymize, and write one file."""
+
+    def __init__(self, filename: str, read_seconds: float, anonymize_seconds: float, write_seconds: float) -> None:
+        """Create a new FileTimings."""
+        self.filename = filename
+        self.read_seconds = read_seconds
+        self.anonymize_seconds = anonymize_seconds
+        self.write_seconds = write_seconds
+
+    def to_json_object(self) -> dict[str, Any]:
+        """Convert to an object that can be written as JSON."""
+        return {
+            "filename": self.filename,
+            "read_seconds": self.read_seconds,
+            "anonymize_seconds": self.anonymize_seconds,
+            "write_seconds": self.write_seconds,
+        }
+
+    @property
+    def total_seconds(self) -> float:
+        """The time taken to read, anonymize, and write the file."""
+        return self.read_seconds + self.anonymize_seconds + self.write_seconds
+
+
+class Profile:
+    """
+    A record of where an anonymization run spent its time.
+
+    Element handler statistics are keyed by the handler's class name. When
+    an anonymizer has several handlers of the same class, the second and
+    later ones are distinguished by a suffix, as in "FixedValueAnonymizer#2".
+
+    File timings are totalled by phase as they're recorded. Only the
+    slowest files' own timings are kept, so a profile's size doesn't grow
+    with the number of files. Files may be recorded from any thread.
+    """
+
+    def __init__(self, slowest_file_count: int = 20) -> None:
+        """
+        Create a new, empty, Profile.
+
+        Parameters
+        ----------
+        slowest_file_count : int
+            The number of files whose individual timings are kept. The
+            timings of the files that took longest are kept.
+
+        """
+        self.handlers: dict[str, HandlerStatistics] = {}
+        self.slowest_file_count = slowest_file_count
+        self.file_count = 0
+        self.read_seconds = 0.0
+        self.anonymize_seconds = 0.0
+        self.write_seconds = 0.0
+        # A min-heap of (total seconds, sequence number, timings), so the
+        # fastest of the slowest files is the one replaced. The sequence
+        # number breaks ties without comparing the timings.
+        self._slowest_files: list[tuple[float, int, FileTimings]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, such as when returning a profile from a worker process. Locks can't be pickled."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled profile, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def slowest_files(self) -> list[FileTimings]:
+        """The timings of the files that took longest, slowest first."""
+        return [timings for (_, _, timings) in sorted(self._slowest_files, reverse=True)]
+
+    def add_file(self, filename: str, read_seconds: float, anonymize_seconds: float, write_seconds: float) -> None:
+        """Record the time taken to read, anonymize, and write a file."""
+        timings = FileTimings(filename, read_seconds, anonymize_seconds, write_seconds)
+        with self._lock:
+            self.file_count += 1
+            self.read_seconds += read_seconds
+            self.anonymize_seconds += anonymize_seconds
+            self.write_seconds += write_seconds
+            self._keep_if_slow(timings)
+
+    def merge(self, other: Profile) -> None:
+        """Add another Profile's statistics, such as one recorded in a worker process, to this one's."""
+        for name, statistics in other.handlers.items():
+            self.handlers.setdefault(name, HandlerStatistics()).merge(statistics)
+        with self._lock:
+            self.file_count += other.file_count
+            self.read_seconds += other.read_seconds
+            self.anonymize_seconds += other.anonymize_seconds
+            self.write_seconds += other.write_seconds
+            for timings in other.slowest_files:
+                self._keep_if_slow(timings)
+
+    def to_json_object(self) -> dict[str, Any]:
+        """Convert to an object that can be written as JSON."""
+        return {
+            "handlers": {name: statistics.to_json_object() for name, statistics in self.handlers.items()},
+            "file_count": self.file_count,
+            "phases": {
+                "read_seconds": self.read_seconds,
+                "anonymize_seconds": self.anonymize_seconds,
+                "write_seconds": self.write_seconds,
+            },
+            "slowest_files": [timings.to_json_object() for timings in self.slowest_files],
+        }
+
+    def report(self) -> str:
+        """Describe the profile in a human-readable table."""
+        return "\n".join(self._report_lines())
+
+    def _report_lines(self) -> Iterator[str]:
+        handler_format = "{:32} {:>10} {:>10} {:>12} {:>12}"
+        yield handler_format.format("Element handler", "Calls", "Claims", "Time (s)", "Per call (us)")
+        for name, statistics in sorted(self.handlers.items(), key=lambda item: -item[1].seconds):
+            per_call = 1e6 * statistics.seconds / statistics.calls if statistics.calls else 0.0
+            yield handler_format.format(
+                name,
+                statistics.calls,
+                statistics.claims,
+                f"{statistics.seconds:.4f}",
+                f"{per_call:.2f}",
+            )
+
+        if not self.file_count:
+            return
+
+        count = self.file_count
+        phase_format = "{:32} {:>12} {:>12}"
+        yield ""
+        yield phase_format.format(f"Phase ({count} files)", "Time (s)", "Per file (ms)")
+        for phase, seconds in (
+            ("read", self.read_seconds),
+            ("anonymize", self.anonymize_seconds),
+            ("write", self.write_seconds),
+        ):
+            yield phase_format.format(phase, f"{seconds:.4f}", f"{1e3 * seconds / count:.2f}")
+
+        # Filenames may be long, so put them last.
+        file_format = "{:>12}  {}"
+        yield ""
+        yield file_format.format("Time (s)", "Slowest files")
+        for timings in self.slowest_files:
+            yield file_format.format(f"{timings.total_seconds:.4f}", timings.filename)
+
+    def _keep_if_slow(self, timings: FileTimings) -> None:
+        if self.slowest_file_count <= 0:
+            return
+        self._sequence += 1
+        entry = (timings.total_seconds, self._sequence, timings)
+        if len(self._slowest_files) < self.slowest_file_count:
+            heapq.heappush(self._slowest_files, entry)
+        elif entry[0] > self._slowest_files[0][0]:
+            heapq.heapreplace(self._slowest_files, entry)
@@ -2,18 +2,65 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+
+    from dicognito.mapping_store import MappingStore
+
+
+class _Hash(Protocol):
+    @property
+    def digest_size(self) -> int: ...
+
+    def copy(self) -> _Hash: ...
+
+    def update(self, data: bytes, /) -> None: ...
+
+    def digest(self) -> bytes: ...
+
+
+def _new_md5_hash(seed: bytes) -> _Hash:
+    hash_state = hashlib.md5()  # noqa: S324
+    hash_state.update(seed)
+    return hash_state
+
+
+def _new_blake2b_hash(seed: bytes) -> _Hash:
+    if len(seed) > hashlib.blake2b.MAX_KEY_SIZE:
+        seed = hashlib.blake2b(seed).digest()
+    return hashlib.blake2b(key=seed, digest_size=16)
+
+
+_HASH_FACTORIES: dict[str, Callable[[bytes], _Hash]] = {
+    "md5": _new_md5_hash,
+    "blake2b": _new_blake2b_hash,
+}
 
 
 class Randomizer:
     """Source of hard-to-predict numbers."""
 
-    def __init__(self, seed: str | None):
+    HASH_ALGORITHMS = tuple(_HASH_FACTORIES)
+    """
+    The names of the supported hash algorithms.
+
+    A name always identifies the same conversion from original values to
+    integers. Should a better conversion be needed, it will be added under
+    a new name, so existing seeds continue to reproduce earlier results.
+    """
+
+    def __init__(
+        self,
+        seed: str | None,
+        cache_size: int = 0,
+        hash_algorithm: str = "md5",
+        mapping_store: MappingStore | None = None,
+    ):
         """
         Create a new Randomizer.
 
@@ -23,6 +70,17 @@ class Randomizer:
             Used to convert input values into large integers.
             The results are completely determined by the
             given seed and the input value.
+        cache_size
+            The number of converted values to remember. When full,
+            the least recently used value is forgotten. If 0, no
+            values are remembered.
+        hash_algorithm
+            The name of the hash algorithm used to convert values, one of
+            HASH_ALGORITHMS. "md5" is the fastest and the default;
+            "blake2b" uses the seed as a key for a stronger keyed hash.
+        mapping_store
+            If supplied, get_replacement uses replacements recorded in the
+            store, and records new ones there.
 
         """
         if seed is None:
@@ -30,6 +88,28 @@ class Randomizer:
         else:
             self.seed = str(seed)
 
+        try:
+            hash_factory = _HASH_FACTORIES[hash_algorithm]
+        except KeyError:
+            msg = f"Unknown hash algorithm '{hash_algorithm}'. Must be one of {', '.join(self.HASH_ALGORITHMS)}."
+            raise ValueError(msg) from None
+        self.hash_algorithm = hash_algorithm
+        self._seeded_hash = hash_factory(self.seed.encode("utf8"))
+        self._digest_bits = 8 * self._seeded_hash.digest_size
+
+        self._cached_to_int = functools.lru_cache(maxsize=cache_size)(self._compute_int)
+        self.mapping_store = mapping_store
+
+    @property
+    def cache_hits(self) -> int:
+        """The number of conversions that were satisfied by the cache."""
+        return self._cached_to_int.cache_info().hits
+
+    @property
+    def cache_misses(self) -> int:
+        """The number of conversions that had to be computed."""
+        return self._cached_to_int.cache_info().misses
+
     def to_int(self, original_value: str) -> int:
         """
         Convert an original data element value into a large integer.
@@ -40,14 +120,40 @@ class Randomizer:
             The original value that will ultimately be replaced.
 
         """
-        message = self.seed + original_value
-        encoded = message.encode("utf8")
-        digest = hashlib.md5(encoded).digest()  # noqa: S324
-        result = 0
-        for c in digest:
-            result *= 0x100
-            result += c
-        return result
+        return self._cached_to_int(original_value)
+
+    def get_replacement(self, category: str, original_value: str, make_replacement: Callable[[str], str]) -> str:
+        """
+        Get the replacement for an original value.
+
+        If the randomizer has a mapping store that has a replacement for the
+        value, that replacement is used. Otherwise a new one is made (and
+        recorded in the mapping store, if there is one).
+
+        Parameters
+        ----------
+        category
+            The kind of value, such as "ID" or "UI". Values in different
+            categories are replaced independently.
+        original_value
+            The original value that will ultimately be replaced.
+        make_replacement
+            Makes a new replacement from the original value.
+
+        """
+        mapping_store = self.mapping_store
+        if mapping_store is None:
+            return make_replacement(original_value)
+        replacement = mapping_store.get(category, original_value)
+        if replacement is None:
+            replacement = make_replacement(original_value)
+            mapping_store.put(category, original_value, replacement)
+        return replacement
+
+    def _compute_int(self, original_value: str) -> int:
+        hash_state = self._seeded_hash.copy()
+        hash_state.update(original_value.encode("utf8"))
+        return int.from_bytes(hash_state.digest(), "big")
 
     def get_ints_from_ranges(self, original_value: str, *suprema: int) -> Sequence[int]:
         """
@@ -63,11 +169,55 @@ class Randomizer:
 
         suprema : sequence of int
             The upper bounds for each of the desired integer ranges.
+            If there are too many, or they are too large, to be drawn
+            from a single digest, the digest is extended as needed.
 
         """
-        big_int = self.to_int(original_value)
+        return self._draw_ints(original_value, [], suprema)
+
+    def get_ints_from_range_groups(self, original_value: str, *range_groups: Sequence[int]) -> Sequence[Sequence[int]]:
+        """
+        Convert an original value into several series of integers, hashing it only once.
+
+        Each group's integers are the same as get_ints_from_ranges would
+        return for that group's suprema alone, so a composite value can be
+        built from parts that match the parts' individually-anonymized
+        equivalents.
+
+        Parameters
+        ----------
+        original_value
+            The original value that will ultimately be replaced.
+
+        range_groups : sequence of sequences of int
+            The upper bounds for each of the desired integer ranges,
+            one sequence of bounds per group.
+
+        """
+        digest_blocks: list[int] = []
+        return [self._draw_ints(original_value, digest_blocks, suprema) for suprema in range_groups]
+
+    def _draw_ints(self, original_value: str, digest_blocks: list[int], suprema: Sequence[int]) -> Sequence[int]:
+        # Treat the digest blocks as one little-endian stream of digits,
+        # and draw each integer from the digits not yet used. Blocks are
+        # computed as they are first needed and shared via digest_blocks.
+        value = 0
+        capacity = 1
+        blocks_used = 0
         result = []
         for s in suprema:
-            result.append(big_int % s)
-            big_int //= s
+            while capacity < s:
+                if blocks_used == len(digest_blocks):
+                    digest_blocks.append(self._get_digest_block(original_value, blocks_used))
+                value += capacity * digest_blocks[blocks_used]
+                capacity <<= self._digest_bits
+                blocks_used += 1
+            result.append(value % s)
+            value //= s
+            capacity //= s
         return result
+
+    def _get_digest_block(self, original_value: str, block_number: int) -> int:
+        if block_number == 0:
+            return self.to_int(original_value)
+        return self.to_int(f"{original_value}\0{block_number}")
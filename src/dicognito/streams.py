@@ -0,0 +1,92 @@
+"""
+Read DICOM objects from, and write them to, a stream such as standard input or output.
+
+A stream holds any number of DICOM Part-10 objects, one after another,
+each preceded by its length in bytes as an 8-byte unsigned big-endian
+integer. Objects are held in memory. Nothing is written to the
+filesystem.
+
+Examples
+--------
+>>> anonymizer = Anonymizer()
+>>> for member in read_members(sys.stdin.buffer):
+>>>     dataset = member.read_dataset()
+>>>     anonymizer.anonymize(dataset)
+>>>     write_dataset(dataset, sys.stdout.buffer)
+
+"""
+
+from __future__ import annotations
+
+import io
+import itertools
+import struct
+from typing import IO, TYPE_CHECKING
+
+from dicognito import header_only
+from dicognito.archives import ArchiveMember
+from dicognito.exceptions import StreamError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Final
+
+    import pydicom
+
+STREAM_NAME: Final = "-"
+"""The source name that stands for standard input."""
+
+_LENGTH: Final = struct.Struct(">Q")
+
+
+def read_members(input_file: IO[bytes], name: str = STREAM_NAME) -> Iterator[ArchiveMember]:
+    """
+    Read each object in a stream.
+
+    Parameters
+    ----------
+    input_file : IO[bytes]
+        The stream to read.
+    name : str
+        The name of the stream. The objects are named by it and their
+        positions in the stream, starting at 1, like "-:1".
+
+    Raises
+    ------
+    StreamError
+        If the stream ends partway through an object or its length.
+
+    """
+    for number in itertools.count(1):
+        length_bytes = input_file.read(_LENGTH.size)
+        if not length_bytes:
+            return
+        if len(length_bytes) < _LENGTH.size:
+            msg = f"The stream ended partway through the length of object {number}."
+            raise StreamError(msg)
+        (length,) = _LENGTH.unpack(length_bytes)
+        contents = input_file.read(length)
+        if len(contents) < length:
+            msg = f"The stream ended partway through object {number}: expected {length} bytes, read {len(contents)}."
+            raise StreamError(msg)
+        yield ArchiveMember(f"{name}:{number}", io.BytesIO(contents))
+
+
+def write_dataset(dataset: pydicom.dataset.Dataset, output_file: IO[bytes]) -> None:
+    """
+    Write a dataset to a stream, preceded by its length, and flush the stream.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to write. If it was read by header_only.read_header, the
+        original file's pixel data is copied into the stream.
+    output_file : IO[bytes]
+        The stream to write to.
+
+    """
+    buffer = io.BytesIO()
+    header_only.write(dataset, buffer)
+    output_file.write(_LENGTH.pack(buffer.tell()))
+    output_file.write(buffer.getbuffer())
+    output_file.flush()
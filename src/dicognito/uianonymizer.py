@@ -1,6 +1,6 @@
 """Replace UIs with a new value."""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterable, Iterator
 
 import pydicom
 import pydicom.dataelem
@@ -13,12 +13,42 @@ class UIAnonymizer(ElementAnonymizer):
     """
     UI anonymizer.
 
-    Any non-empty UI will be replaced except for class UIDs and transfer syntax UIDs.
+    Any non-empty UI will be replaced except for class UIDs, transfer syntax UIDs,
+    and any other exempt elements.
     """
 
-    def __init__(self, randomizer: Randomizer) -> None:
-        """Create a new UIAnonymizer."""
+    def __init__(self, randomizer: Randomizer, exempt_tags: Iterable[int] = ()) -> None:
+        """
+        Create a new UIAnonymizer.
+
+        Parameters
+        ----------
+        randomizer : dicognito.randomizer.Randomizer
+            Provides a source of randomness.
+        exempt_tags : iterable of int
+            Tags of additional UI elements whose values should not be replaced.
+            Elements whose keywords end in "ClassUID" and TransferSyntaxUID
+            are always exempt.
+
+        """
         self._randomizer = randomizer
+        self._exempt_tags = {
+            tag for (keyword, tag) in pydicom.datadict.keyword_dict.items() if keyword.endswith("ClassUID")
+        }
+        self._exempt_tags.add(pydicom.datadict.keyword_dict["TransferSyntaxUID"])
+        self._exempt_tags.update(exempt_tags)
+
+    def add_exempt_tag(self, tag: int) -> None:
+        """
+        Prevent the value of the UI element with the given tag from being replaced.
+
+        Parameters
+        ----------
+        tag : int
+            The tag of the UI element to exempt from anonymization.
+
+        """
+        self._exempt_tags.add(tag)
 
     def __call__(
         self,
@@ -43,23 +73,25 @@ class UIAnonymizer(ElementAnonymizer):
         True if the element was anonymized, or False if not.
 
         """
-        if (
-            data_element.VR != "UI"
-            or not data_element.value
-            or pydicom.datadict.keyword_for_tag(data_element.tag).endswith("ClassUID")
-            or data_element.tag == pydicom.datadict.tag_for_keyword("TransferSyntaxUID")
-        ):
+        if data_element.VR != "UI" or not data_element.value or data_element.tag in self._exempt_tags:
             return False
 
         if isinstance(data_element.value, pydicom.multival.MultiValue):
-            data_element.value = [self._new_ui(v) for v in data_element.value]
+            data_element.value = [self._get_replacement_ui(v) for v in data_element.value]
         else:
-            data_element.value = self._new_ui(data_element.value)
+            data_element.value = self._get_replacement_ui(data_element.value)
         return True
 
     def describe_actions(self) -> Iterator[str]:
         """Describe the actions this anonymizer performs."""
         yield "Replace all UI elements with anonymized values"
 
+    def handled_vrs(self) -> Collection[str]:
+        """Return the VRs of the elements this anonymizer may act on."""
+        return ("UI",)
+
+    def _get_replacement_ui(self, ui: str) -> str:
+        return self._randomizer.get_replacement("UI", ui, self._new_ui)
+
     def _new_ui(self, ui: str) -> str:
         return "2." + str(10**39 + self._randomizer.to_int(ui))
@@ -1,6 +1,6 @@
 """Remove unwanted values from the data_element."""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 
 import pydicom
 
@@ -50,3 +50,7 @@ class UnwantedElementsStripper(ElementAnonymizer):
     def describe_actions(self) -> Iterator[str]:
         """Describe the actions this anonymizer performs."""
         yield from (f"Remove {keyword}" for keyword in map(pydicom.datadict.keyword_for_tag, self.tags))
+
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return self.tags
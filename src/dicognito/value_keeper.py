@@ -1,7 +1,7 @@
 """Retains an element's value."""
 
 import re
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 
 import pydicom
 
@@ -61,6 +61,10 @@ class ValueKeeper(ElementAnonymizer):
             tag_name = f"{group:04X},{elem:04X}"
         yield f"Keep {tag_name} values"
 
+    def handled_tags(self) -> Collection[int]:
+        """Return the tags of the elements this anonymizer may act on."""
+        return (self._tag,)
+
     def _tag_from_name(self, tag_name: str) -> int:
         match = re.fullmatch("([0-9A-F]{4}),([0-9A-F]{4})", tag_name)
         if match:
@@ -0,0 +1,110 @@
+import io
+
+import pydicom
+import pytest
+from pydicom.data import get_testdata_file
+
+from dicognito import header_only
+from dicognito.anonymizer import Anonymizer
+
+
+def read_bytes(test_file_name: str) -> bytes:
+    with open(str(get_testdata_file(test_file_name)), "rb") as file:
+        return file.read()
+
+
+def anonymize_fully(test_file_name: str) -> bytes:
+    return anonymize_buffer_fully(read_bytes(test_file_name))
+
+
+def anonymize_buffer_fully(buffer: bytes) -> bytes:
+    with pydicom.dcmread(io.BytesIO(buffer)) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        output_file = io.BytesIO()
+        dataset.save_as(output_file, enforce_file_format=True)
+        return output_file.getvalue()
+
+
+def read_bytes_with_trailing_elements(test_file_name: str) -> bytes:
+    with pydicom.dcmread(str(get_testdata_file(test_file_name))) as dataset:
+        block = dataset.private_block(0x7FE1, "SECRET CREATOR", create=True)
+        block.add_new(0x01, "PN", "SECRET^PATIENT")
+        signature = pydicom.Dataset()
+        signature.DigitalSignatureUID = "1.2.3.4.5.6.7.8.9"
+        dataset.DigitalSignaturesSequence = [signature]
+        output_file = io.BytesIO()
+        dataset.save_as(output_file, enforce_file_format=True)
+        return output_file.getvalue()
+
+
+@pytest.mark.parametrize(
+    "test_file_name",
+    [
+        "MR_small.dcm",
+        "MR_small_implicit.dcm",
+        "MR_small_bigendian.dcm",
+        "JPEG2000.dcm",
+        "image_dfl.dcm",
+        "rtplan.dcm",
+    ],
+)
+def test_anonymize_bytes_matches_full_anonymization(test_file_name):
+    assert Anonymizer(seed="").anonymize_bytes(read_bytes(test_file_name)) == anonymize_fully(test_file_name)
+
+
+def test_anonymize_bytes_accepts_memoryview_and_leaves_it_unchanged():
+    original = bytearray(read_bytes("JPEG2000.dcm"))
+
+    anonymized = Anonymizer(seed="").anonymize_bytes(memoryview(original))
+
+    assert anonymized == anonymize_fully("JPEG2000.dcm")
+    assert original == read_bytes("JPEG2000.dcm")
+
+
+@pytest.mark.parametrize("test_file_name", ["MR_small.dcm", "image_dfl.dcm", "rtplan.dcm"])
+def test_anonymize_bytes_reads_header_from_prefixes_of_buffer(monkeypatch, test_file_name):
+    monkeypatch.setattr(header_only, "_HEADER_READ_SIZE", 256)
+
+    anonymized = Anonymizer(seed="").anonymize_bytes(bytearray(read_bytes(test_file_name)))
+
+    assert anonymized == anonymize_fully(test_file_name)
+
+
+@pytest.mark.parametrize("test_file_name", ["MR_small.dcm", "MR_small_bigendian.dcm", "JPEG2000.dcm"])
+def test_anonymize_bytes_anonymizes_elements_after_pixel_data(test_file_name):
+    original = read_bytes_with_trailing_elements(test_file_name)
+    expected = anonymize_buffer_fully(original)
+    output_buffer = bytearray(len(expected))
+
+    anonymized = Anonymizer(seed="").anonymize_bytes(bytearray(original))
+    size = Anonymizer(seed="").anonymize_bytes_to(original, output_buffer)
+
+    assert anonymized == expected
+    assert output_buffer[:size] == expected
+    assert b"SECRET^PATIENT" not in anonymized
+    assert b"1.2.3.4.5.6.7.8.9" not in anonymized
+
+
+def test_anonymize_bytes_to_writes_into_buffer():
+    expected = anonymize_fully("MR_small.dcm")
+    output_buffer = bytearray(len(expected) + 10)
+
+    size = Anonymizer(seed="").anonymize_bytes_to(read_bytes("MR_small.dcm"), memoryview(output_buffer))
+
+    assert size == len(expected)
+    assert output_buffer[:size] == expected
+    assert output_buffer[size:] == bytes(10)
+
+
+def test_anonymize_bytes_to_rejects_small_buffer():
+    output_buffer = bytearray(100)
+
+    with pytest.raises(ValueError, match="The output buffer is too small"):
+        Anonymizer(seed="").anonymize_bytes_to(read_bytes("MR_small.dcm"), output_buffer)
+
+    assert output_buffer == bytes(100)
+
+
+def test_anonymize_bytes_rejects_non_dicom():
+    with pytest.raises(pydicom.errors.InvalidDicomError):
+        Anonymizer(seed="").anonymize_bytes(b"not DICOM" * 100)
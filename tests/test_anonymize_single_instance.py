@@ -63,6 +63,18 @@ def test_identifying_uis_are_updated(element_path):
         assert actual != expected
 
 
+def test_ui_exempt_tags_are_left_alone():
+    with load_test_instance() as dataset:
+        expected_study_uid = dataset.StudyInstanceUID
+        expected_series_uid = dataset.SeriesInstanceUID
+
+        anonymizer = Anonymizer(ui_exempt_tags=[pydicom.datadict.keyword_dict["StudyInstanceUID"]])
+        anonymizer.anonymize(dataset)
+
+        assert dataset.StudyInstanceUID == expected_study_uid
+        assert dataset.SeriesInstanceUID != expected_series_uid
+
+
 @pytest.mark.parametrize(
     ("one_element_path", "another_element_path"),
     [("file_meta.MediaStorageSOPInstanceUID", "SOPInstanceUID")],
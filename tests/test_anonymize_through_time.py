@@ -10,7 +10,7 @@ from dicognito.anonymizer import Anonymizer
 from .data_for_tests import load_minimal_instance
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, ValuesView
+    from collections.abc import Callable, Iterator
 
 
 def test_dataset_anonymizes_same_with_same_seed():
@@ -21,7 +21,7 @@ def test_dataset_anonymizes_same_with_same_seed():
         anonymizer1.anonymize(dataset1)
         anonymizer2.anonymize(dataset2)
 
-        mismatches, matches = partition(lambda value: value == dataset2[value.tag], dataset1.values())
+        mismatches, matches = partition(lambda value: value == dataset2[value.tag], iter(dataset1))
 
         assert [value.name for value in matches]
         assert not [value.name for value in mismatches]
@@ -32,7 +32,7 @@ _DatasetValue = pydicom.DataElement | pydicom.dataelem.RawDataElement
 
 def partition(
     predicate: Callable[[_DatasetValue], bool],
-    iterable: ValuesView[_DatasetValue],
+    iterable: Iterator[_DatasetValue],
     # pytest can't collect the tests when we subscript filterfalse and filter
 ) -> tuple[filterfalse, filter]:  # type: ignore[type-arg]
     """Use a predicate to partition entries into false entries and true entries."""
@@ -0,0 +1,68 @@
+import io
+import os
+import pickle
+import tarfile
+import zipfile
+
+import pytest
+from pydicom.data import get_testdata_file
+
+from dicognito import archives
+
+
+def read_bytes(filename: str) -> bytes:
+    with open(filename, "rb") as file:
+        return file.read()
+
+
+@pytest.mark.parametrize("archive_name", ["studies.zip", "studies.tar", "studies.tar.gz", "studies.tar.bz2"])
+def test_members_written_are_read_back(archive_name, tmp_path):
+    archive_filename = str(tmp_path / archive_name)
+    source_filename = str(get_testdata_file("MR_small.dcm"))
+    with archives.ArchiveWriter(archive_filename) as archive, open(source_filename, "rb") as source_file:
+        archive.add("series/first.dcm", source_file)
+        archive.add("series/second.dcm", io.BytesIO(b"not DICOM"))
+
+    members = list(archives.read_members(archive_filename))
+
+    assert members == [
+        os.path.join(archive_filename, "series/first.dcm"),
+        os.path.join(archive_filename, "series/second.dcm"),
+    ]
+    assert members[0].open().read() == read_bytes(source_filename)
+    assert members[1].open().read() == b"not DICOM"
+
+
+def test_directories_in_archives_are_skipped(tmp_path):
+    archive_filename = str(tmp_path / "studies.zip")
+    with zipfile.ZipFile(archive_filename, "w") as archive:
+        archive.writestr("series/", b"")
+        archive.writestr("series/instance.dcm", b"contents")
+
+    assert list(archives.read_members(archive_filename)) == [os.path.join(archive_filename, "series/instance.dcm")]
+
+
+def test_read_dataset_names_dataset_by_member(tmp_path):
+    archive_filename = str(tmp_path / "studies.tar")
+    with tarfile.open(archive_filename, "w") as archive:
+        archive.add(str(get_testdata_file("MR_small.dcm")), "instance.dcm")
+
+    (member,) = archives.read_members(archive_filename)
+    dataset = member.read_dataset()
+
+    assert dataset.filename == os.path.join(archive_filename, "instance.dcm")
+    assert dataset.PatientName == "CompressedSamples^MR1"
+
+
+def test_pickled_member_keeps_contents():
+    member = archives.ArchiveMember("studies.zip/instance.dcm", io.BytesIO(b"contents"))
+
+    unpickled_member = pickle.loads(pickle.dumps(member))  # noqa: S301
+
+    assert unpickled_member == member
+    assert unpickled_member.open().read() == b"contents"
+
+
+def test_writer_refuses_unknown_archive_type(tmp_path):
+    with pytest.raises(ValueError, match="Unknown archive type"):
+        archives.ArchiveWriter(str(tmp_path / "studies.rar"))
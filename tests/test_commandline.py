@@ -1,12 +1,21 @@
+import io
+import json
 import logging
 import os.path
+import re
 import shutil
+import subprocess
 import sys
+import tarfile
+import zipfile
 
 import pydicom
 import pytest
 
 import dicognito.__main__
+import dicognito.header_only
+import dicognito.streams
+from dicognito.manifest import Manifest
 
 from .data_for_tests import load_dcm
 
@@ -113,6 +122,45 @@ def test_summary_no_accession_number(capsys):
     assert expected_output == actual_output
 
 
+def test_summary_csv_counts_instances_of_each_study(capsys):
+    expected_output = """\
+Accession Number,Patient ID,Patient Name,Instances
+028EY1JNTTP8,DQFZ0HDKPYUX,JENSEN^KELLIE^PATRICK,1
+5VIGINLZ0LPZ,DQFZ0HDKPYUX,JENSEN^KELLIE^PATRICK,1
+PYDV44HEDN1E,LXO0DMOPN7PV,BUCHANAN^ALBA^MADGE,2
+"""
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--summary-format", "csv")
+    (actual_output, _) = capsys.readouterr()
+
+    assert expected_output == actual_output
+
+
+def test_summary_json_counts_instances_of_each_study(capsys):
+    summary_file_name = path_to("summary.json")
+    run_dicognito(
+        path_to("p*"),
+        "--output-dir",
+        path_to("new_dir"),
+        "--quiet",
+        "--summary-format",
+        "json",
+        "--summary-file",
+        summary_file_name,
+    )
+    (actual_output, _) = capsys.readouterr()
+
+    with open(summary_file_name) as summary_file:
+        summary = json.load(summary_file)
+
+    assert actual_output == ""
+    assert [(row["AccessionNumber"], row["Instances"]) for row in summary] == [
+        ("028EY1JNTTP8", 1),
+        ("5VIGINLZ0LPZ", 1),
+        ("PYDV44HEDN1E", 2),
+    ]
+    assert summary[2]["PatientName"] == "BUCHANAN^ALBA^MADGE"
+
+
 def test_directory_is_recursed():
     test_name = get_test_name()
     orig_dataset1 = read_original_file(test_name, "p01_s01_s01_i01.dcm")
@@ -220,7 +268,7 @@ def test_burned_in_annotation_fail(caplog):
         run_dicognito("--in-place", path_to(""), "--on-burned-in-annotation", "fail")
 
     log_record = next(log for log in caplog.records if log.levelname == "ERROR")
-    assert f"Error occurred while converting {input_file_name}. Aborting." in log_record.getMessage()
+    assert f"Error occurred while converting {input_file_name}. Skipping." in log_record.getMessage()
     assert expected_message in str(log_record.exc_info[1])
 
 
@@ -287,7 +335,7 @@ def test_conversion_error_logs_filename_and_error_type(caplog):
         run_dicognito(input_file_name, "--output-dir", path_to("new_dir"))
 
     log_record = next(log for log in caplog.records if log.levelname == "ERROR")
-    assert f"Error occurred while converting {input_file_name}. Aborting." in log_record.getMessage()
+    assert f"Error occurred while converting {input_file_name}. Skipping." in log_record.getMessage()
     assert log_record.exc_info is not None
 
 
@@ -339,6 +387,441 @@ def test_bad_keep_element_tag_name_outputs_good_error(capsys):
     )
 
 
+def test_jobs_output_matches_serial_output():
+    run_dicognito(path_to("p*"), "--output-dir", path_to("serial"))
+    run_dicognito(path_to("p*"), "--output-dir", path_to("parallel"), "--jobs", "2")
+
+    assert_directories_identical(path_to("serial"), path_to("parallel"))
+
+
+def test_jobs_summary_reports_on_each_study(capsys):
+    expected_output = """\
+| Accession Number |  Patient ID  |     Patient Name      |
+| ---------------- | ------------ | --------------------- |
+| 028EY1JNTTP8     | DQFZ0HDKPYUX | JENSEN^KELLIE^PATRICK |
+| 5VIGINLZ0LPZ     | DQFZ0HDKPYUX | JENSEN^KELLIE^PATRICK |
+| PYDV44HEDN1E     | LXO0DMOPN7PV | BUCHANAN^ALBA^MADGE   |
+"""
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--jobs", "3")
+    (actual_output, _) = capsys.readouterr()
+
+    assert expected_output == actual_output
+
+
+def test_jobs_without_seed_are_consistent():
+    dicognito.__main__.main((path_to("p*"), "--output-dir", path_to("new_dir"), "--jobs", "4", "--quiet"))
+
+    datasets = [read_file(get_test_name(), "new_dir", file_name) for file_name in os.listdir(path_to("new_dir"))]
+    assert len({dataset.PatientID for dataset in datasets}) == 2  # noqa: PLR2004
+    assert len({dataset.StudyInstanceUID for dataset in datasets}) == 3  # noqa: PLR2004
+
+
+def test_jobs_conversion_error_logs_filename_and_error_type(caplog):
+    input_file_name = path_to("bad.dcm")
+    with pytest.raises(SystemExit):
+        run_dicognito(input_file_name, "--output-dir", path_to("new_dir"), "--jobs", "2")
+
+    log_record = next(log for log in caplog.records if log.levelname == "ERROR")
+    assert f"Error occurred while converting {input_file_name}. Skipping." in log_record.getMessage()
+    assert log_record.exc_info is not None
+
+
+def test_header_only_output_matches_full_output():
+    run_dicognito(path_to("p*"), "--output-dir", path_to("full"))
+    run_dicognito(path_to("p*"), "--output-dir", path_to("header_only"), "--header-only")
+
+    assert_directories_identical(path_to("full"), path_to("header_only"))
+
+
+def test_jobs_must_be_positive(capsys):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("p*"), "--jobs", "0")
+    (_, actual_error) = capsys.readouterr()
+
+    assert "argument --jobs/-j: invalid positive integer value: '0'" in actual_error
+
+
+def test_io_threads_output_matches_unthreaded_output():
+    run_dicognito(path_to("p*"), "--output-dir", path_to("unthreaded"), "--io-threads", "0")
+    run_dicognito(path_to("p*"), "--output-dir", path_to("threaded"), "--io-threads", "3")
+
+    assert_directories_identical(path_to("unthreaded"), path_to("threaded"))
+
+
+def test_io_threads_write_error_logs_filename_and_fails(caplog, monkeypatch):
+    def fail_to_save(_dataset: pydicom.dataset.Dataset, _filename: str) -> None:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(dicognito.header_only, "save_as", fail_to_save)
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--io-threads", "2")
+
+    assert exit_info.value.code == 1
+    errors = [record.getMessage() for record in caplog.records if record.levelname == "ERROR"]
+    assert sorted(errors) == [
+        "2 file(s) could not be converted.",
+        f"Error occurred while converting {path_to('p01_s01_s01_i01.dcm')}. Skipping.",
+        f"Error occurred while converting {path_to('p02_s01_s01_i01.dcm')}. Skipping.",
+    ]
+
+
+def test_io_threads_must_not_be_negative(capsys):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("p*"), "--io-threads", "-1")
+    (_, actual_error) = capsys.readouterr()
+
+    assert "argument --io-threads: invalid non-negative integer value: '-1'" in actual_error
+
+
+def test_resume_skips_files_already_anonymized(capsys):
+    manifest_file_name = path_to("manifest.db")
+    run_dicognito(path_to("p01*"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name)
+    capsys.readouterr()
+
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name, "--resume")
+    (actual_output, _) = capsys.readouterr()
+
+    assert "BUCHANAN^ALBA^MADGE" not in actual_output
+    assert "JENSEN^KELLIE^PATRICK" in actual_output
+    assert len(os.listdir(path_to("new_dir"))) == 2  # noqa: PLR2004
+
+
+def test_resume_retries_files_that_failed(caplog, capsys):
+    manifest_file_name = path_to("manifest.db")
+    with pytest.raises(SystemExit) as exit_info:
+        run_dicognito(path_to("*.dcm"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name)
+    assert exit_info.value.code == 1
+    assert len(os.listdir(path_to("new_dir"))) == 2  # noqa: PLR2004
+    caplog.clear()
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_dicognito(
+            *(path_to("*.dcm"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name, "--resume"),
+        )
+    (actual_output, _) = capsys.readouterr()
+
+    assert exit_info.value.code == 1
+    errors = [record.getMessage() for record in caplog.records if record.levelname == "ERROR"]
+    assert errors == [
+        f"Error occurred while converting {path_to('bad.dcm')}. Skipping.",
+        "1 file(s) could not be converted.",
+    ]
+    assert "BUCHANAN^ALBA^MADGE" not in actual_output
+    assert "JENSEN^KELLIE^PATRICK" not in actual_output
+
+
+def test_resume_in_place_does_not_anonymize_again():
+    manifest_file_name = path_to("manifest.db")
+    run_dicognito(path_to("p*"), "--in-place", "--manifest", manifest_file_name)
+    first_run_dataset = read_file(get_test_name(), "p01_s01_s01_i01.dcm")
+
+    run_dicognito(path_to("p*"), "--in-place", "--manifest", manifest_file_name, "--resume")
+    second_run_dataset = read_file(get_test_name(), "p01_s01_s01_i01.dcm")
+
+    assert first_run_dataset == second_run_dataset
+
+
+def test_resume_without_seed_uses_recorded_seed():
+    manifest_file_name = path_to("manifest.db")
+    dicognito.__main__.main(
+        (path_to("p01*"), "--output-dir", path_to("resumed"), "--manifest", manifest_file_name, "--quiet"),
+    )
+    dicognito.__main__.main(
+        (path_to("p*"), "--output-dir", path_to("resumed"), "--manifest", manifest_file_name, "--quiet", "--resume"),
+    )
+
+    recorded_seed = Manifest(manifest_file_name).configuration["seed"]  # type: ignore[index]
+    run_dicognito(path_to("p*"), "--output-dir", path_to("uninterrupted"), "--quiet", "--seed", recorded_seed)
+
+    assert sorted(os.listdir(path_to("resumed"))) == sorted(os.listdir(path_to("uninterrupted")))
+
+
+def test_resume_with_different_configuration_fails(capsys):
+    manifest_file_name = path_to("manifest.db")
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name, "--quiet")
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_dicognito(
+            *(path_to("p*"), "--output-dir", path_to("new_dir"), "--manifest", manifest_file_name, "--resume"),
+            *("--id-prefix", "X", "--seed", "another seed"),
+        )
+    (_, actual_error) = capsys.readouterr()
+
+    assert exit_info.value.code == 1
+    assert actual_error == (
+        f"Cannot resume the run recorded in {manifest_file_name}: "
+        "The configuration differs from that of the previous run: id_prefix, seed.\n"
+    )
+
+
+def test_resume_requires_manifest(capsys):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("p*"), "--resume")
+    (_, actual_error) = capsys.readouterr()
+
+    assert "argument --resume: requires --manifest" in actual_error
+
+
+def test_mapping_store_makes_runs_with_different_seeds_consistent():
+    mapping_store_file_name = path_to("mappings.db")
+    for seed in ("seed1", "seed2"):
+        output_directory = path_to(seed)
+        run_dicognito(path_to("p*"), "-o", output_directory, "--mapping-store", mapping_store_file_name, "--seed", seed)
+
+    file_names = sorted(os.listdir(path_to("seed1")))
+    assert len(file_names) == 2  # noqa: PLR2004
+    assert file_names == sorted(os.listdir(path_to("seed2")))
+
+
+def test_shards_together_match_single_run():
+    run_dicognito(path_to("p*"), "-o", path_to("single"))
+    shard_file_names = []
+    for shard_number in (1, 2, 3):
+        output_directory = path_to(f"shard{shard_number}")
+        run_dicognito(path_to("p*"), "-o", output_directory, "--shard", f"{shard_number}/3")
+        if os.path.isdir(output_directory):
+            shard_file_names.extend(os.listdir(output_directory))
+
+    assert sorted(shard_file_names) == sorted(os.listdir(path_to("single")))
+
+
+def test_shard_by_study_keeps_studies_together():
+    study_shards: dict[str, set[int]] = {}
+    for shard_number in (1, 2):
+        output_directory = path_to(f"shard{shard_number}")
+        run_dicognito(path_to("p*"), "-o", output_directory, "--shard", f"{shard_number}/2", "--shard-by", "study")
+        for file_name in os.listdir(output_directory) if os.path.isdir(output_directory) else ():
+            study_instance_uid = read_file(get_test_name(), f"shard{shard_number}", file_name).StudyInstanceUID
+            study_shards.setdefault(study_instance_uid, set()).add(shard_number)
+
+    assert len(study_shards) == 3  # noqa: PLR2004
+    assert all(len(shards) == 1 for shards in study_shards.values())
+
+
+@pytest.mark.parametrize("shard", ["0/2", "3/2", "1", "a/b"])
+def test_shard_must_be_valid(capsys, shard):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("p*"), "--shard", shard)
+    (_, actual_error) = capsys.readouterr()
+
+    assert f"argument --shard: invalid shard: '{shard}'. Must be i/N, where 1 <= i <= N" in actual_error
+
+
+def test_shard_requires_seed(capsys):
+    with pytest.raises(SystemExit):
+        dicognito.__main__.main((path_to("p*"), "--shard", "1/2"))
+    (_, actual_error) = capsys.readouterr()
+
+    assert "argument --shard: requires --seed" in actual_error
+
+
+def test_version_does_not_import_pydicom():
+    script = (
+        "import sys\n"
+        "import dicognito.__main__\n"
+        "try:\n"
+        "    dicognito.__main__.main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('pydicom imported:', 'pydicom' in sys.modules)\n"
+    )
+    result = subprocess.run((sys.executable, "-c", script), capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert "pydicom    " in result.stdout
+    assert result.stdout.endswith("pydicom imported: False\n")
+
+
+def test_profile_writes_json_report():
+    report_file_name = path_to("profile.json")
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--profile", report_file_name)
+
+    with open(report_file_name) as report_file:
+        report = json.load(report_file)
+
+    assert report["handlers"]["PNAnonymizer"]["claimed_tags"]["(0010,0010)"] == 2  # noqa: PLR2004
+    assert report["file_count"] == 2  # noqa: PLR2004
+    assert sorted(os.path.basename(timings["filename"]) for timings in report["slowest_files"]) == [
+        "p01_s01_s01_i01.dcm",
+        "p02_s01_s01_i01.dcm",
+    ]
+
+
+def test_profile_with_jobs_reports_on_each_file():
+    report_file_name = path_to("profile.json")
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--profile", report_file_name, "--jobs", "2")
+
+    with open(report_file_name) as report_file:
+        report = json.load(report_file)
+
+    assert report["handlers"]["PNAnonymizer"]["claimed_tags"]["(0010,0010)"] == 2  # noqa: PLR2004
+    assert report["file_count"] == 2  # noqa: PLR2004
+    assert len(report["slowest_files"]) == 2  # noqa: PLR2004
+
+
+def test_profile_prints_report(capsys):
+    run_dicognito(path_to("p*"), "--output-dir", path_to("new_dir"), "--quiet", "--profile")
+    (actual_output, _) = capsys.readouterr()
+
+    assert actual_output.startswith("Element handler")
+    assert "PNAnonymizer" in actual_output
+    assert "Phase (2 files)" in actual_output
+
+
+def test_hash_output_layout_writes_files_in_two_levels_of_subdirectories():
+    run_dicognito(path_to(), "--output-dir", path_to("new_dir"), "--output-layout", "hash")
+
+    output_files = [
+        os.path.relpath(os.path.join(directory, filename), path_to("new_dir"))
+        for (directory, _, filenames) in os.walk(path_to("new_dir"))
+        for filename in filenames
+    ]
+    assert len(output_files) == 4  # noqa: PLR2004
+    for output_file in output_files:
+        (first, second, filename) = output_file.split(os.sep)
+        assert re.fullmatch("[0-9a-f]{2}", first)
+        assert re.fullmatch("[0-9a-f]{2}", second)
+        dataset = read_file(get_test_name(), "new_dir", output_file)
+        assert filename == dataset.SOPInstanceUID + ".dcm"
+
+
+def test_hierarchy_output_layout_writes_files_by_patient_study_and_series():
+    run_dicognito(path_to(), "--output-dir", path_to("new_dir"), "--output-layout", "hierarchy")
+
+    output_files = [
+        os.path.relpath(os.path.join(directory, filename), path_to("new_dir"))
+        for (directory, _, filenames) in os.walk(path_to("new_dir"))
+        for filename in filenames
+    ]
+    assert len(output_files) == 4  # noqa: PLR2004
+    for output_file in output_files:
+        dataset = read_file(get_test_name(), "new_dir", output_file)
+        assert output_file.split(os.sep) == [
+            dataset.PatientID,
+            dataset.StudyInstanceUID,
+            dataset.SeriesInstanceUID,
+            dataset.SOPInstanceUID + ".dcm",
+        ]
+
+
+def test_overwrite_header_requires_in_place_and_header_only(capsys):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("p*"), "--in-place", "--overwrite-header")
+    (_, actual_error) = capsys.readouterr()
+
+    assert "argument --overwrite-header: requires --in-place and --header-only" in actual_error
+
+
+def test_overwrite_header_keeps_pixel_data_in_place():
+    file_name = path_to("p01_s01_s01_i01.dcm")
+    with dicognito.header_only.read_header(file_name) as dataset:
+        pixel_data_offset = dataset.dicognito_pixel_data_offset
+    with open(file_name, "rb") as original_file:
+        original_bytes = original_file.read()
+
+    run_dicognito(file_name, "--in-place", "--header-only", "--overwrite-header")
+
+    with open(file_name, "rb") as anonymized_file:
+        anonymized_bytes = anonymized_file.read()
+    assert len(anonymized_bytes) == len(original_bytes)
+    assert anonymized_bytes[pixel_data_offset:] == original_bytes[pixel_data_offset:]
+    dataset = read_file(get_test_name(), "p01_s01_s01_i01.dcm")
+    assert dataset.PatientName == "BUCHANAN^ALBA^MADGE"
+
+
+def test_anonymizes_members_of_zip_archive():
+    with zipfile.ZipFile(path_to("studies.zip"), "w") as archive:
+        for file_name in ("p01_s01_s01_i01.dcm", "p02_s01_s01_i01.dcm"):
+            archive.write(path_to(file_name), "export/" + file_name)
+
+    run_dicognito(path_to("studies.zip"), "--output-dir", path_to("new_dir"))
+
+    output_file_names = sorted(os.listdir(path_to("new_dir")))
+    assert len(output_file_names) == 2  # noqa: PLR2004
+    patient_names = {
+        str(read_file(get_test_name(), "new_dir", file_name).PatientName) for file_name in output_file_names
+    }
+    assert patient_names == {"BUCHANAN^ALBA^MADGE", "JENSEN^KELLIE^PATRICK"}
+
+
+def test_writes_members_of_tar_archive_to_zip_archive():
+    with tarfile.open(path_to("studies.tar.gz"), "w:gz") as archive:
+        for file_name in ("p01_s01_s01_i01.dcm", "p01_s01_s01_i02.dcm"):
+            archive.add(path_to(file_name), file_name)
+
+    run_dicognito(path_to("studies.tar.gz"), "--output-archive", path_to("anonymized.zip"), "--header-only")
+
+    with zipfile.ZipFile(path_to("anonymized.zip")) as archive:
+        member_names = archive.namelist()
+        assert len(member_names) == 2  # noqa: PLR2004
+        for member_name in member_names:
+            dataset = pydicom.dcmread(io.BytesIO(archive.read(member_name)))
+            assert member_name == dataset.SOPInstanceUID + ".dcm"
+            assert dataset.PatientName == "BUCHANAN^ALBA^MADGE"
+
+
+def test_writes_files_to_archive_by_layout():
+    run_dicognito(
+        path_to("p01_s01_s01_i01.dcm"),
+        "--output-archive",
+        path_to("anonymized.tar"),
+        "--output-layout",
+        "hierarchy",
+    )
+
+    with tarfile.open(path_to("anonymized.tar")) as archive:
+        member_names = archive.getnames()
+        assert len(member_names) == 1
+        member_file = archive.extractfile(member_names[0])
+        assert member_file is not None
+        dataset = pydicom.dcmread(io.BytesIO(member_file.read()))
+    assert member_names[0] == "/".join(
+        (dataset.PatientID, dataset.StudyInstanceUID, dataset.SeriesInstanceUID, dataset.SOPInstanceUID + ".dcm"),
+    )
+
+
+def test_archive_sources_require_output_location(capsys):
+    with pytest.raises(SystemExit):
+        run_dicognito(path_to("studies.zip"), "--in-place")
+    (_, actual_error) = capsys.readouterr()
+
+    assert "archive sources require --output-directory or --output-archive" in actual_error
+
+
+def test_in_place_ignores_archives_found_by_globs_and_directories():
+    test_name = get_test_name()
+    with zipfile.ZipFile(path_to("studies.zip"), "w") as archive:
+        archive.write(path_to("p01_s01_s01_i01.dcm"), "p01_s01_s01_i01.dcm")
+    with open(path_to("studies.zip"), "rb") as archive_file:
+        archive_bytes = archive_file.read()
+
+    run_dicognito(path_to("*"), "--in-place")
+    run_dicognito(path_to(""), "--in-place")
+
+    with open(path_to("studies.zip"), "rb") as archive_file:
+        assert archive_file.read() == archive_bytes
+    anon_dataset = read_file(test_name, "p01_s01_s01_i01.dcm")
+    assert anon_dataset.PatientName != read_original_file(test_name, "p01_s01_s01_i01.dcm").PatientName
+
+
+def test_anonymizes_stream_from_standard_input_to_standard_output(monkeypatch):
+    input_stream = io.BytesIO()
+    for file_name in ("p01_s01_s01_i01.dcm", "p02_s01_s01_i01.dcm"):
+        dicognito.streams.write_dataset(pydicom.dcmread(path_to(file_name)), input_stream)
+    input_stream.seek(0)
+    output_stream = io.BytesIO()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(input_stream))
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(output_stream))
+
+    run_dicognito("-")
+
+    output_stream.seek(0)
+    datasets = [member.read_dataset() for member in dicognito.streams.read_members(output_stream)]
+    assert [str(dataset.PatientName) for dataset in datasets] == ["BUCHANAN^ALBA^MADGE", "JENSEN^KELLIE^PATRICK"]
+
+
 def get_test_name() -> str:
     depth = 1
     while True:
@@ -360,6 +843,17 @@ def read_file(*directory_parts: str) -> pydicom.dataset.Dataset:
     return load_dcm(data_dir, *directory_parts)
 
 
+def assert_directories_identical(expected_directory: str, actual_directory: str) -> None:
+    file_names = sorted(os.listdir(expected_directory))
+    assert file_names == sorted(os.listdir(actual_directory))
+    for file_name in file_names:
+        with open(os.path.join(expected_directory, file_name), "rb") as expected_file:
+            expected_bytes = expected_file.read()
+        with open(os.path.join(actual_directory, file_name), "rb") as actual_file:
+            actual_bytes = actual_file.read()
+        assert expected_bytes == actual_bytes, file_name
+
+
 def read_original_file(*directory_parts: str) -> pydicom.dataset.Dataset:
     return load_dcm("orig_data", *directory_parts)
 
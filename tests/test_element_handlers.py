@@ -1,8 +1,27 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pydicom
 import pytest
 
+from dicognito.addressanonymizer import AddressAnonymizer
+from dicognito.anonymizer import Anonymizer
+from dicognito.datetimeanonymizer import DateTimeAnonymizer
+from dicognito.element_anonymizer import ElementAnonymizer
 from dicognito.exceptions import TagError
+from dicognito.randomizer import Randomizer
+from dicognito.uianonymizer import UIAnonymizer
 from dicognito.value_keeper import ValueKeeper
 
+from .data_for_tests import load_test_instance
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+    from dicognito.anonymization_context import AnonymizationContext
+
 
 def test_value_keeper_raises_good_exception_on_bad_tag():
     with pytest.raises(TagError) as e:
@@ -25,3 +44,280 @@ def test_value_keeper_raises_good_exception_on_bad_tag():
 def test_value_keeper_describes_action(tag_name: str, expected_tag_name: str) -> None:
     description = "".join(ValueKeeper(tag_name).describe_actions())
     assert description == f"Keep {expected_tag_name} values"
+
+
+class RecordingHandler(ElementAnonymizer):
+    def __init__(self, tags: Collection[int] = (), vrs: Collection[str] = ()) -> None:  # noqa: D107
+        self.tags = tags
+        self.vrs = vrs
+        self.seen_tags: list[int] = []
+
+    def __call__(self, dataset: pydicom.Dataset, data_element: pydicom.DataElement) -> bool:  # noqa: ARG002
+        self.seen_tags.append(data_element.tag)
+        return True
+
+    def describe_actions(self) -> Iterator[str]:
+        yield "Record elements"
+
+    def handled_tags(self) -> Collection[int]:
+        return self.tags
+
+    def handled_vrs(self) -> Collection[str]:
+        return self.vrs
+
+
+def test_handler_declaring_nothing_is_offered_every_element():
+    handler = RecordingHandler()
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+        assert len(handler.seen_tags) > len(dataset)
+
+
+def test_handler_declaring_tag_is_offered_only_that_tag():
+    patient_id_tag = pydicom.datadict.keyword_dict["PatientID"]
+    handler = RecordingHandler(tags=(patient_id_tag,))
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        original_patient_id = dataset.PatientID
+        anonymizer.anonymize(dataset)
+
+        assert set(handler.seen_tags) == {patient_id_tag}
+        assert dataset.PatientID == original_patient_id
+
+
+def test_handler_declaring_vr_preempts_default_handlers():
+    handler = RecordingHandler(vrs=("PN",))
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        original_patient_name = dataset.PatientName
+        anonymizer.anonymize(dataset)
+
+        assert pydicom.datadict.tag_for_keyword("PatientName") in handler.seen_tags
+        assert dataset.PatientName == original_patient_name
+
+
+def test_elements_no_handler_is_interested_in_are_left_raw():
+    anonymizer = Anonymizer()
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+        assert isinstance(dataset.get_item(pydicom.datadict.keyword_dict["Rows"]), pydicom.dataelem.RawDataElement)
+        assert not isinstance(
+            dataset.get_item(pydicom.datadict.keyword_dict["PatientName"]),
+            pydicom.dataelem.RawDataElement,
+        )
+
+
+def test_raw_element_is_offered_to_handler_declaring_its_vr():
+    handler = RecordingHandler(vrs=("US",))
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+        assert pydicom.datadict.tag_for_keyword("Rows") in handler.seen_tags
+
+
+def test_names_in_sequences_are_replaced_as_at_top_level():
+    dataset = pydicom.Dataset()
+    dataset.file_meta = pydicom.dataset.FileMetaDataset()
+    dataset.PatientSex = "F"
+    dataset.ReferringPhysicianName = "DOCTOR^JUNE"
+    item = pydicom.Dataset()
+    item.ReferringPhysicianName = "DOCTOR^JUNE"
+    dataset.ReferencedStudySequence = [item]
+
+    Anonymizer().anonymize(dataset)
+
+    assert dataset.ReferringPhysicianName != "DOCTOR^JUNE"
+    assert dataset.ReferencedStudySequence[0].ReferringPhysicianName == dataset.ReferringPhysicianName
+
+
+def test_handlers_have_context_only_during_anonymization():
+    patient_id_tag = pydicom.datadict.keyword_dict["PatientID"]
+    contexts = []
+
+    class ContextRecordingHandler(RecordingHandler):
+        def __call__(self, dataset: pydicom.Dataset, data_element: pydicom.DataElement) -> bool:
+            contexts.append(self.context)
+            return super().__call__(dataset, data_element)
+
+    handler = ContextRecordingHandler(tags=(patient_id_tag,))
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+        assert contexts
+        assert all(context is not None and context.dataset is dataset for context in contexts)
+        assert handler.context is None
+
+
+def test_nested_anonymization_restores_outer_context():
+    patient_id_tag = pydicom.datadict.keyword_dict["PatientID"]
+    anonymizer = Anonymizer()
+    contexts: list[AnonymizationContext | None] = []
+
+    class NestingHandler(RecordingHandler):
+        def __call__(self, dataset: pydicom.Dataset, data_element: pydicom.DataElement) -> bool:
+            if not contexts:
+                contexts.append(self.context)
+                with load_test_instance() as inner_dataset:
+                    anonymizer.anonymize(inner_dataset)
+                contexts.append(self.context)
+            return super().__call__(dataset, data_element)
+
+    handler = NestingHandler(tags=(patient_id_tag,))
+    anonymizer.add_element_handler(handler)
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+        assert len(contexts) == 2  # noqa: PLR2004
+        assert all(context is not None and context.dataset is dataset for context in contexts)
+        assert handler.context is None
+
+
+def test_concurrent_anonymizations_have_separate_contexts():
+    patient_id_tag = pydicom.datadict.keyword_dict["PatientID"]
+    both_anonymizing = threading.Barrier(2)
+    datasets: dict[int, pydicom.Dataset] = {}
+    mismatches = []
+
+    class WaitingHandler(RecordingHandler):
+        def __call__(self, dataset: pydicom.Dataset, data_element: pydicom.DataElement) -> bool:
+            both_anonymizing.wait(timeout=10)
+            if self.context is None or self.context.dataset is not datasets[threading.get_ident()]:
+                mismatches.append(dataset)
+            return super().__call__(dataset, data_element)
+
+    anonymizer = Anonymizer()
+    anonymizer.add_element_handler(WaitingHandler(tags=(patient_id_tag,)))
+
+    def anonymize() -> None:
+        with load_test_instance() as dataset:
+            datasets[threading.get_ident()] = dataset
+            anonymizer.anonymize(dataset)
+
+    threads = [threading.Thread(target=anonymize) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not mismatches
+
+
+def test_address_anonymizer_address_parts_match_individual_parts():
+    address_anonymizer = AddressAnonymizer(Randomizer("SEED"))
+
+    assert address_anonymizer.get_address("INSTITUTIONNAME") == (
+        address_anonymizer.get_street_address("INSTITUTIONNAME"),
+        address_anonymizer.get_region("INSTITUTIONNAME"),
+        address_anonymizer.get_country("INSTITUTIONNAME"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("original", "expected"),
+    [
+        ("2020", "2019"),
+        ("202001", "201912"),
+        ("20200101", "20191231"),
+        ("20200301", "20200229"),
+        ("2020010100", "2019123123"),
+        ("20200101003000.5+0100", "20191231233000.5+0100"),
+    ],
+)
+def test_datetime_anonymizer_shifts_partial_precision_datetimes(original: str, expected: str) -> None:
+    dataset = pydicom.Dataset()
+    dataset.AcquisitionDateTime = original
+    datetime_anonymizer = DateTimeAnonymizer(-1)
+
+    assert datetime_anonymizer(dataset, dataset["AcquisitionDateTime"])
+    assert dataset.AcquisitionDateTime == expected
+
+
+def test_datetime_anonymizer_rejects_malformed_date():
+    dataset = pydicom.Dataset()
+    with pytest.warns(UserWarning, match="Invalid value for VR DA"):
+        dataset.StudyDate = "2020-01-01"
+    datetime_anonymizer = DateTimeAnonymizer(-1)
+
+    with pytest.raises(ValueError, match="does not match format"):
+        datetime_anonymizer(dataset, dataset["StudyDate"])
+
+
+def test_datetime_anonymizer_shifts_time_of_dictionary_date():
+    dataset = pydicom.Dataset()
+    dataset.StudyDate = "20200101"
+    dataset.StudyTime = "003000"
+    datetime_anonymizer = DateTimeAnonymizer(-1)
+
+    assert datetime_anonymizer(dataset, dataset["StudyDate"])
+    assert dataset.StudyDate == "20191231"
+    assert dataset.StudyTime == "233000"
+
+
+def test_datetime_anonymizer_shifts_time_of_registered_private_date():
+    dataset = pydicom.Dataset()
+    block = dataset.private_block(0x0011, "DICOGNITO TEST", create=True)
+    block.add_new(0x01, "DA", "20200101")
+    block.add_new(0x02, "TM", "003000")
+    datetime_anonymizer = DateTimeAnonymizer(-1)
+    datetime_anonymizer.add_date_time_pair((0x0011, "DICOGNITO TEST", 0x01), (0x0011, "DICOGNITO TEST", 0x02))
+
+    assert datetime_anonymizer(dataset, block[0x01])
+    assert block[0x01].value == "20191231"
+    assert block[0x02].value == "233000"
+
+
+def test_anonymizer_shifts_time_of_private_date_in_any_block():
+    date_time_pairs = [((0x0011, "DICOGNITO TEST", 0x01), (0x0011, "DICOGNITO TEST", 0x02))]
+    dataset = pydicom.Dataset()
+    dataset.file_meta = pydicom.dataset.FileMetaDataset()
+    dataset.private_block(0x0011, "OTHER CREATOR", create=True).add_new(0x02, "TM", "003000")
+    block = dataset.private_block(0x0011, "DICOGNITO TEST", create=True)
+    block.add_new(0x01, "DA", "20200101")
+    block.add_new(0x02, "TM", "003000")
+    expected = pydicom.Dataset()
+    expected.file_meta = pydicom.dataset.FileMetaDataset()
+    expected.StudyDate = "20200101"
+    expected.StudyTime = "003000"
+
+    Anonymizer(seed="", date_time_pairs=date_time_pairs).anonymize(dataset)
+    Anonymizer(seed="").anonymize(expected)
+
+    assert block.get_tag(0x01) == 0x00111101  # noqa: PLR2004
+    assert (block[0x01].value, block[0x02].value) == (expected.StudyDate, expected.StudyTime)
+    assert dataset[0x0011, 0x1002].value == "003000"
+
+
+def test_ui_anonymizer_leaves_exempt_tags_alone():
+    study_uid_tag = pydicom.datadict.keyword_dict["StudyInstanceUID"]
+    series_uid_tag = pydicom.datadict.keyword_dict["SeriesInstanceUID"]
+    sop_uid_tag = pydicom.datadict.keyword_dict["SOPInstanceUID"]
+    ui_anonymizer = UIAnonymizer(Randomizer("SEED"), exempt_tags=[study_uid_tag])
+    ui_anonymizer.add_exempt_tag(series_uid_tag)
+
+    dataset = pydicom.Dataset()
+    dataset.StudyInstanceUID = "1.2.3"
+    dataset.SeriesInstanceUID = "1.2.3.4"
+    dataset.SOPInstanceUID = "1.2.3.4.5"
+
+    assert not ui_anonymizer(dataset, dataset[study_uid_tag])
+    assert not ui_anonymizer(dataset, dataset[series_uid_tag])
+    assert ui_anonymizer(dataset, dataset[sop_uid_tag])
+    assert dataset.StudyInstanceUID == "1.2.3"
+    assert dataset.SeriesInstanceUID == "1.2.3.4"
+    assert dataset.SOPInstanceUID != "1.2.3.4.5"
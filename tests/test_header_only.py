@@ -0,0 +1,166 @@
+import os
+import shutil
+from typing import BinaryIO
+
+import pydicom
+import pytest
+from pydicom.data import get_testdata_file
+
+from dicognito import header_only
+from dicognito.anonymizer import Anonymizer
+
+
+def anonymize_fully(source_filename: str, output_filename: str) -> None:
+    with pydicom.dcmread(source_filename) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        dataset.save_as(output_filename, enforce_file_format=True)
+
+
+def anonymize_header_only(source_filename: str, output_filename: str) -> None:
+    with header_only.read_header(source_filename) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        header_only.save_as(dataset, output_filename)
+
+
+def read_bytes(filename: str | os.PathLike[str]) -> bytes:
+    with open(filename, "rb") as file:
+        return file.read()
+
+
+@pytest.mark.parametrize(
+    "test_file_name",
+    [
+        "MR_small.dcm",
+        "MR_small_implicit.dcm",
+        "MR_small_bigendian.dcm",
+        "JPEG2000.dcm",
+        "image_dfl.dcm",
+        "rtplan.dcm",
+    ],
+)
+def test_header_only_output_matches_full_output(test_file_name, tmp_path):
+    source_filename = str(get_testdata_file(test_file_name))
+
+    anonymize_fully(source_filename, str(tmp_path / "full.dcm"))
+    anonymize_header_only(source_filename, str(tmp_path / "header_only.dcm"))
+
+    assert read_bytes(tmp_path / "header_only.dcm") == read_bytes(tmp_path / "full.dcm")
+
+
+def add_trailing_elements(source_filename: str, output_filename: str) -> None:
+    with pydicom.dcmread(source_filename) as dataset:
+        block = dataset.private_block(0x7FE1, "SECRET CREATOR", create=True)
+        block.add_new(0x01, "PN", "SECRET^PATIENT")
+        signature = pydicom.Dataset()
+        signature.DigitalSignatureUID = "1.2.3.4.5.6.7.8.9"
+        dataset.DigitalSignaturesSequence = [signature]
+        dataset.save_as(output_filename, enforce_file_format=True)
+
+
+@pytest.mark.parametrize("test_file_name", ["MR_small.dcm", "MR_small_bigendian.dcm", "JPEG2000.dcm"])
+def test_header_only_anonymizes_elements_after_pixel_data(test_file_name, tmp_path):
+    source_filename = str(tmp_path / "trailing.dcm")
+    add_trailing_elements(str(get_testdata_file(test_file_name)), source_filename)
+
+    anonymize_fully(source_filename, str(tmp_path / "full.dcm"))
+    anonymize_header_only(source_filename, str(tmp_path / "header_only.dcm"))
+
+    header_only_bytes = read_bytes(tmp_path / "header_only.dcm")
+    assert header_only_bytes == read_bytes(tmp_path / "full.dcm")
+    assert b"SECRET^PATIENT" not in header_only_bytes
+    assert b"1.2.3.4.5.6.7.8.9" not in header_only_bytes
+
+
+def test_header_only_does_not_load_pixel_data():
+    with header_only.read_header(str(get_testdata_file("MR_small.dcm"))) as dataset:
+        assert "PixelData" not in dataset
+
+
+def test_header_only_in_place_replaces_original(tmp_path):
+    source_filename = str(get_testdata_file("JPEG2000.dcm"))
+    in_place_filename = str(tmp_path / "in_place.dcm")
+    shutil.copyfile(source_filename, in_place_filename)
+
+    anonymize_fully(source_filename, str(tmp_path / "full.dcm"))
+    anonymize_header_only(in_place_filename, in_place_filename)
+
+    assert read_bytes(in_place_filename) == read_bytes(tmp_path / "full.dcm")
+    assert set(os.listdir(tmp_path)) == {"full.dcm", "in_place.dcm"}
+
+
+def test_failed_save_leaves_no_partial_file(tmp_path, monkeypatch):
+    output_filename = str(tmp_path / "output.dcm")
+
+    def fail_to_copy(_source: BinaryIO, _offset: int, _end: int, destination: BinaryIO) -> None:
+        destination.write(b"partial")
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(header_only, "_copy_range", fail_to_copy)
+    with pytest.raises(OSError, match="disk full"):
+        anonymize_header_only(str(get_testdata_file("JPEG2000.dcm")), output_filename)
+
+    assert os.listdir(tmp_path) == []
+
+
+def add_padding(source_filename: str, output_filename: str, padding_length: int) -> None:
+    with pydicom.dcmread(source_filename) as dataset:
+        padding = dataset.private_block(header_only.PADDING_GROUP, header_only.PADDING_PRIVATE_CREATOR, create=True)
+        padding.add_new(0x00, "OB", bytes(padding_length))
+        dataset.save_as(output_filename, enforce_file_format=True)
+
+
+def test_overwrite_header_leaves_pixel_data_untouched(tmp_path):
+    filename = str(tmp_path / "padded.dcm")
+    add_padding(str(get_testdata_file("JPEG2000.dcm")), filename, 1000)
+    original_bytes = read_bytes(filename)
+
+    with header_only.read_header(filename) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        pixel_data_offset = dataset.dicognito_pixel_data_offset
+        assert header_only.overwrite_header(dataset)
+
+    anonymize_fully(str(get_testdata_file("JPEG2000.dcm")), str(tmp_path / "full.dcm"))
+    with pydicom.dcmread(tmp_path / "full.dcm") as expected, pydicom.dcmread(filename) as actual:
+        padding = actual.private_block(header_only.PADDING_GROUP, header_only.PADDING_PRIVATE_CREATOR)
+        assert len(padding[0x00].value) < 1000  # noqa: PLR2004
+        assert actual.PatientName == expected.PatientName
+        assert actual.SOPInstanceUID == expected.SOPInstanceUID
+
+    assert read_bytes(filename)[pixel_data_offset:] == original_bytes[pixel_data_offset:]
+    assert set(os.listdir(tmp_path)) == {"padded.dcm", "full.dcm"}
+
+
+def test_overwrite_header_leaves_file_untouched_when_header_does_not_fit(tmp_path):
+    filename = str(tmp_path / "in_place.dcm")
+    shutil.copyfile(str(get_testdata_file("JPEG2000.dcm")), filename)
+
+    with header_only.read_header(filename) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        assert not header_only.overwrite_header(dataset)
+        assert not dataset.group_dataset(header_only.PADDING_GROUP)
+
+    assert read_bytes(filename) == read_bytes(str(get_testdata_file("JPEG2000.dcm")))
+
+
+def test_overwrite_header_anonymizes_elements_after_pixel_data(tmp_path):
+    filename = str(tmp_path / "padded.dcm")
+    add_trailing_elements(str(get_testdata_file("JPEG2000.dcm")), str(tmp_path / "trailing.dcm"))
+    add_padding(str(tmp_path / "trailing.dcm"), filename, 1000)
+    original_bytes = read_bytes(filename)
+
+    with header_only.read_header(filename) as dataset:
+        Anonymizer(seed="").anonymize(dataset)
+        pixel_data_offset = dataset.dicognito_pixel_data_offset
+        pixel_data_end = dataset.dicognito_pixel_data_end
+        assert header_only.overwrite_header(dataset)
+
+    anonymize_fully(str(tmp_path / "trailing.dcm"), str(tmp_path / "full.dcm"))
+    with pydicom.dcmread(tmp_path / "full.dcm") as expected, pydicom.dcmread(filename) as actual:
+        assert actual.DigitalSignaturesSequence == expected.DigitalSignaturesSequence
+        assert actual[0x7FE1, 0x1001] == expected[0x7FE1, 0x1001]
+
+    overwritten_bytes = read_bytes(filename)
+    assert overwritten_bytes[pixel_data_offset:pixel_data_end] == original_bytes[pixel_data_offset:pixel_data_end]
+    assert b"SECRET^PATIENT" not in overwritten_bytes
+    assert b"1.2.3.4.5.6.7.8.9" not in overwritten_bytes
@@ -0,0 +1,129 @@
+import io
+import os
+import sqlite3
+
+from dicognito.anonymizer import Anonymizer
+from dicognito.mapping_store import MappingStore
+from dicognito.randomizer import Randomizer
+
+from .data_for_tests import load_test_instance
+
+
+def test_get_returns_none_for_unknown_value(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        assert mapping_store.get("ID", "PATIENT1") is None
+
+
+def test_put_then_get_returns_replacement_before_and_after_reopening(tmp_path):
+    filename = os.path.join(tmp_path, "mappings.db")
+    with MappingStore(filename) as mapping_store:
+        mapping_store.put("ID", "PATIENT1", "ABCDEF")
+        assert mapping_store.get("ID", "PATIENT1") == "ABCDEF"
+        assert mapping_store.get("UI", "PATIENT1") is None
+
+    with MappingStore(filename) as mapping_store:
+        assert mapping_store.get("ID", "PATIENT1") == "ABCDEF"
+
+
+def test_put_keeps_first_replacement(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db"), batch_size=1) as mapping_store:
+        mapping_store.put("ID", "PATIENT1", "FIRST")
+        mapping_store.put("ID", "PATIENT1", "SECOND")
+
+        assert mapping_store.get("ID", "PATIENT1") == "FIRST"
+
+
+def test_get_remembers_recently_used_replacements(tmp_path):
+    filename = os.path.join(tmp_path, "mappings.db")
+    with MappingStore(filename) as mapping_store:
+        mapping_store.put("ID", "PATIENT1", "ABCDEF")
+        mapping_store.put("ID", "PATIENT2", "GHIJKL")
+
+    with MappingStore(filename, cache_size=1) as mapping_store:
+        assert mapping_store.get("ID", "PATIENT1") == "ABCDEF"
+
+        connection = sqlite3.connect(filename)
+        with connection:
+            connection.execute("UPDATE mappings SET replacement = 'CHANGED'")
+        connection.close()
+
+        assert mapping_store.get("ID", "PATIENT1") == "ABCDEF"
+        assert mapping_store.get("ID", "PATIENT2") == "CHANGED"
+        assert mapping_store.get("ID", "PATIENT1") == "CHANGED"
+
+
+def test_find_originals_looks_up_by_replacement(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        mapping_store.put("ID", "PATIENT1", "ABCDEF")
+        mapping_store.put("ID", "PATIENT2", "GHIJKL")
+        mapping_store.put("PN", "NAME^ONE", "ABCDEF")
+
+        assert sorted(mapping_store.find_originals("ABCDEF")) == [("ID", "PATIENT1"), ("PN", "NAME^ONE")]
+        assert mapping_store.find_originals("ABCDEF", category="PN") == [("PN", "NAME^ONE")]
+        assert mapping_store.find_originals("MNOPQR") == []
+
+
+def test_export_csv_writes_all_mappings(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        mapping_store.put("UI", "1.2.3", "2.25.1")
+        mapping_store.put("ID", "PATIENT1", "ABCDEF")
+        output = io.StringIO()
+        mapping_store.export_csv(output)
+
+    assert output.getvalue().splitlines() == [
+        "category,original,replacement",
+        "ID,PATIENT1,ABCDEF",
+        "UI,1.2.3,2.25.1",
+    ]
+
+
+def test_randomizer_records_and_reuses_replacements(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        first = Randomizer("seed1", mapping_store=mapping_store).get_replacement("ID", "PATIENT1", str.lower)
+        second = Randomizer("seed2", mapping_store=mapping_store).get_replacement("ID", "PATIENT1", str.upper)
+
+    assert first == second == "patient1"
+
+
+def test_anonymizers_with_same_store_and_different_seeds_anonymize_identically(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        with load_test_instance() as first_dataset:
+            Anonymizer(seed="seed1", mapping_store=mapping_store).anonymize(first_dataset)
+        with load_test_instance() as second_dataset:
+            Anonymizer(seed="seed2", mapping_store=mapping_store).anonymize(second_dataset)
+
+        assert mapping_store.find_originals(first_dataset.PatientID, "ID") == [("ID", "4MR1")]
+
+    assert first_dataset.PatientID == second_dataset.PatientID
+    assert first_dataset.PatientName == second_dataset.PatientName
+    assert first_dataset.SOPInstanceUID == second_dataset.SOPInstanceUID
+
+
+def test_anonymizers_with_same_store_and_different_id_affixes_use_their_own_affixes(tmp_path):
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store:
+        with load_test_instance() as plain_dataset:
+            Anonymizer(seed="seed1", mapping_store=mapping_store).anonymize(plain_dataset)
+        with load_test_instance() as affixed_dataset:
+            Anonymizer(seed="seed2", id_prefix="PRE", id_suffix="SUF", mapping_store=mapping_store).anonymize(
+                affixed_dataset
+            )
+
+        assert mapping_store.find_originals(affixed_dataset.PatientID) == [
+            ("ID prefix='PRE' suffix='SUF'", "4MR1"),
+        ]
+
+    assert plain_dataset.PatientID != affixed_dataset.PatientID
+    assert len(affixed_dataset.PatientID) == len(plain_dataset.PatientID)
+    assert affixed_dataset.PatientID.startswith("PRE")
+    assert affixed_dataset.PatientID.endswith("SUF")
+    assert plain_dataset.PatientName == affixed_dataset.PatientName
+
+
+def test_mapping_store_does_not_change_anonymized_values(tmp_path):
+    with load_test_instance() as expected:
+        Anonymizer(seed="").anonymize(expected)
+
+    with MappingStore(os.path.join(tmp_path, "mappings.db")) as mapping_store, load_test_instance() as actual:
+        Anonymizer(seed="", mapping_store=mapping_store).anonymize(actual)
+
+    assert actual == expected
@@ -0,0 +1,109 @@
+import concurrent.futures
+import pickle
+
+import pydicom
+
+from dicognito.anonymizer import Anonymizer
+from dicognito.profiling import HandlerStatistics, Profile
+
+from .data_for_tests import load_test_instance
+
+
+def test_profile_is_none_unless_profiling_enabled():
+    assert Anonymizer().profile is None
+
+
+def test_profile_records_calls_and_claims_for_each_handler():
+    anonymizer = Anonymizer(seed="")
+    profile = anonymizer.enable_profiling()
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+    assert anonymizer.profile is profile
+    pn_statistics = profile.handlers["PNAnonymizer"]
+    assert pn_statistics.calls > 0
+    assert pn_statistics.claims == pn_statistics.calls
+    assert pydicom.tag.Tag("PatientName") in pn_statistics.claimed_tags
+    assert profile.handlers["UIAnonymizer"].claims < profile.handlers["UIAnonymizer"].calls
+    assert "FixedValueAnonymizer#2" in profile.handlers
+
+
+def test_profiling_does_not_change_anonymized_values():
+    with load_test_instance() as expected:
+        Anonymizer(seed="").anonymize(expected)
+
+    anonymizer = Anonymizer(seed="")
+    anonymizer.enable_profiling()
+    with load_test_instance() as actual:
+        anonymizer.anonymize(actual)
+
+    assert actual == expected
+
+
+def test_disable_profiling_stops_recording():
+    anonymizer = Anonymizer(seed="")
+    profile = anonymizer.enable_profiling()
+    anonymizer.disable_profiling()
+
+    with load_test_instance() as dataset:
+        anonymizer.anonymize(dataset)
+
+    assert anonymizer.profile is None
+    assert all(statistics.calls == 0 for statistics in profile.handlers.values())
+
+
+def test_merge_adds_statistics():
+    profile = Profile()
+    for _ in range(2):
+        other = Profile()
+        statistics = other.handlers.setdefault("PNAnonymizer", HandlerStatistics())
+        statistics.calls = 3
+        statistics.claims = 2
+        statistics.claimed_tags[0x00100010] = 2
+        other.add_file("file.dcm", 1.0, 2.0, 3.0)
+        profile.merge(other)
+
+    merged = profile.handlers["PNAnonymizer"]
+    assert (merged.calls, merged.claims, merged.claimed_tags) == (6, 4, {0x00100010: 4})
+    assert profile.file_count == 2  # noqa: PLR2004
+    assert (profile.read_seconds, profile.anonymize_seconds, profile.write_seconds) == (2.0, 4.0, 6.0)
+    assert profile.to_json_object()["handlers"]["PNAnonymizer"]["claimed_tags"] == {"(0010,0010)": 4}
+
+
+def test_profile_keeps_only_the_slowest_files():
+    profile = Profile(slowest_file_count=2)
+    for seconds in (3.0, 1.0, 4.0, 2.0):
+        profile.add_file(f"{seconds}.dcm", seconds, 0.0, 0.0)
+
+    other = Profile(slowest_file_count=2)
+    other.add_file("3.5.dcm", 0.0, 3.5, 0.0)
+    profile.merge(other)
+
+    assert profile.file_count == 5  # noqa: PLR2004
+    assert [timings.filename for timings in profile.slowest_files] == ["4.0.dcm", "3.5.dcm"]
+
+
+def test_profile_records_files_from_several_threads():
+    profile = Profile()
+
+    def add_files(thread: int) -> None:
+        for file in range(1000):
+            profile.add_file(f"{thread}-{file}.dcm", 1.0, 0.0, 0.0)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        list(executor.map(add_files, range(4)))
+
+    assert profile.file_count == 4000  # noqa: PLR2004
+    assert profile.read_seconds == 4000.0  # noqa: PLR2004
+
+
+def test_profile_can_be_pickled():
+    profile = Profile()
+    profile.add_file("file.dcm", 1.0, 2.0, 3.0)
+
+    unpickled = pickle.loads(pickle.dumps(profile))  # noqa: S301
+    unpickled.add_file("other.dcm", 1.0, 2.0, 3.0)
+
+    assert unpickled.file_count == 2  # noqa: PLR2004
+    assert [timings.filename for timings in unpickled.slowest_files] == ["other.dcm", "file.dcm"]
@@ -0,0 +1,121 @@
+import pytest
+
+from dicognito.randomizer import Randomizer
+
+
+def test_cached_values_match_uncached_values():
+    cached_randomizer = Randomizer("SEED", cache_size=10)
+    uncached_randomizer = Randomizer("SEED")
+
+    for value in ("PATIENTID", "1.2.3.4", "PATIENTID", ""):
+        assert cached_randomizer.to_int(value) == uncached_randomizer.to_int(value)
+
+
+def test_repeated_values_hit_cache():
+    randomizer = Randomizer("SEED", cache_size=10)
+
+    randomizer.to_int("PATIENTID")
+    randomizer.to_int("STUDYID")
+    randomizer.to_int("PATIENTID")
+
+    assert randomizer.cache_hits == 1
+    assert randomizer.cache_misses == 2  # noqa: PLR2004
+
+
+def test_least_recently_used_value_is_evicted():
+    randomizer = Randomizer("SEED", cache_size=2)
+
+    randomizer.to_int("A")
+    randomizer.to_int("B")
+    randomizer.to_int("A")
+    randomizer.to_int("C")
+    randomizer.to_int("A")
+    randomizer.to_int("B")
+
+    assert randomizer.cache_hits == 2  # noqa: PLR2004
+    assert randomizer.cache_misses == 4  # noqa: PLR2004
+
+
+def test_no_cache_by_default():
+    randomizer = Randomizer("SEED")
+
+    randomizer.to_int("PATIENTID")
+    randomizer.to_int("PATIENTID")
+
+    assert randomizer.cache_hits == 0
+
+
+def test_md5_results_are_unchanged():
+    randomizer = Randomizer("SOME_FIXED_SEED")
+
+    assert randomizer.to_int("PATIENTID") == 332307849792696277434026403497601600756  # noqa: PLR2004
+    assert randomizer.to_int("") == 273365089587036603204892313331270609225  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("hash_algorithm", Randomizer.HASH_ALGORITHMS)
+def test_results_are_reproducible_with_same_seed(hash_algorithm):
+    randomizer1 = Randomizer("SEED", hash_algorithm=hash_algorithm)
+    randomizer2 = Randomizer("SEED", hash_algorithm=hash_algorithm)
+
+    assert randomizer1.to_int("PATIENTID") == randomizer2.to_int("PATIENTID")
+    assert randomizer1.to_int("PATIENTID") != randomizer1.to_int("OTHERPATIENTID")
+
+
+@pytest.mark.parametrize("hash_algorithm", Randomizer.HASH_ALGORITHMS)
+def test_results_fit_in_128_bits(hash_algorithm):
+    randomizer = Randomizer("SEED" * 100, hash_algorithm=hash_algorithm)
+
+    assert randomizer.to_int("PATIENTID") < 2**128
+
+
+def test_blake2b_results_differ_from_md5():
+    md5_randomizer = Randomizer("SEED", hash_algorithm="md5")
+    blake2b_randomizer = Randomizer("SEED", hash_algorithm="blake2b")
+
+    assert md5_randomizer.to_int("PATIENTID") != blake2b_randomizer.to_int("PATIENTID")
+
+
+def test_unknown_hash_algorithm_raises_good_exception():
+    with pytest.raises(ValueError, match=r"Unknown hash algorithm 'sha1'\. Must be one of md5, blake2b\."):
+        Randomizer("SEED", hash_algorithm="sha1")
+
+
+def test_ints_from_ranges_are_unchanged():
+    randomizer = Randomizer("SOME_FIXED_SEED")
+    big_int = randomizer.to_int("PATIENTID")
+
+    assert randomizer.get_ints_from_ranges("PATIENTID", 1000, 36, 7) == [
+        big_int % 1000,
+        big_int // 1000 % 36,
+        big_int // 1000 // 36 % 7,
+    ]
+
+
+def test_ints_from_ranges_extend_beyond_one_digest():
+    randomizer = Randomizer("SEED")
+
+    ints = randomizer.get_ints_from_ranges("PATIENTID", *([2**32] * 16))
+
+    assert all(0 <= i < 2**32 for i in ints)
+    assert all(ints[4:])
+
+
+def test_range_groups_match_individual_ranges():
+    randomizer = Randomizer("SEED")
+
+    groups = randomizer.get_ints_from_range_groups("PATIENTID", (1000, 36), (77,), (2**64, 2**64, 2**64))
+
+    assert groups == [
+        randomizer.get_ints_from_ranges("PATIENTID", 1000, 36),
+        randomizer.get_ints_from_ranges("PATIENTID", 77),
+        randomizer.get_ints_from_ranges("PATIENTID", 2**64, 2**64, 2**64),
+    ]
+
+
+def test_range_groups_hash_value_once():
+    randomizer = Randomizer("SEED", cache_size=10)
+
+    randomizer.get_ints_from_range_groups("PATIENTID", (1000, 36), (77,), (40,))
+
+    assert randomizer.cache_misses == 1
+    assert randomizer.cache_hits == 0
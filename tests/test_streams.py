@@ -0,0 +1,40 @@
+import io
+
+import pydicom
+import pytest
+from pydicom.data import get_testdata_file
+
+from dicognito import streams
+from dicognito.exceptions import StreamError
+
+
+def read_dataset(filename: str) -> pydicom.Dataset:
+    return pydicom.dcmread(str(get_testdata_file(filename)))
+
+
+def test_written_datasets_are_read_back_in_order():
+    stream = io.BytesIO()
+    for filename in ("MR_small.dcm", "rtplan.dcm"):
+        streams.write_dataset(read_dataset(filename), stream)
+    stream.seek(0)
+
+    datasets = [member.read_dataset() for member in streams.read_members(stream)]
+
+    assert [dataset.filename for dataset in datasets] == ["-:1", "-:2"]
+    assert [dataset.SOPInstanceUID for dataset in datasets] == [
+        read_dataset("MR_small.dcm").SOPInstanceUID,
+        read_dataset("rtplan.dcm").SOPInstanceUID,
+    ]
+
+
+def test_empty_stream_has_no_members():
+    assert list(streams.read_members(io.BytesIO())) == []
+
+
+@pytest.mark.parametrize("truncated_length", [3, 20])
+def test_truncated_stream_raises_stream_error(truncated_length):
+    stream = io.BytesIO()
+    streams.write_dataset(read_dataset("MR_small.dcm"), stream)
+
+    with pytest.raises(StreamError, match="The stream ended partway through"):
+        list(streams.read_members(io.BytesIO(stream.getvalue()[:truncated_length])))
@@ -0,0 +1,56 @@
+import csv
+
+import pydicom
+import pytest
+
+from dicognito.filters import Summarize
+
+
+def make_dataset(accession_number: str, patient_id: str, patient_name: str) -> pydicom.Dataset:
+    dataset = pydicom.Dataset()
+    dataset.AccessionNumber = accession_number
+    dataset.PatientID = patient_id
+    dataset.PatientName = patient_name
+    return dataset
+
+
+def read_csv_summary(file_name: str) -> list[list[str]]:
+    with open(file_name, newline="") as summary_file:
+        return list(csv.reader(summary_file))
+
+
+def test_rows_spilled_to_disk_are_merged_and_counted(tmp_path):
+    summary_file_name = str(tmp_path / "summary.csv")
+    summarize = Summarize("csv", summary_file_name, max_rows=2)
+
+    for accession_number in ("C", "A", "B", "A", "D", "C", "A"):
+        summarize.after_each(make_dataset(accession_number, "ID", "NAME"))
+    summarize.after_all()
+
+    assert read_csv_summary(summary_file_name) == [
+        ["Accession Number", "Patient ID", "Patient Name", "Instances"],
+        ["A", "ID", "NAME", "3"],
+        ["B", "ID", "NAME", "1"],
+        ["C", "ID", "NAME", "2"],
+        ["D", "ID", "NAME", "1"],
+    ]
+
+
+def test_merge_adds_counts_from_another_summarize(tmp_path):
+    summary_file_name = str(tmp_path / "summary.csv")
+    summarize = Summarize("csv", summary_file_name)
+    worker_summarize = Summarize()
+
+    summarize.after_each(make_dataset("A", "ID", "NAME"))
+    worker_summarize.after_each(make_dataset("A", "ID", "NAME"))
+    worker_summarize.after_each(make_dataset("B", "ID", "NAME"))
+    summarize.merge(worker_summarize.pop_counts())
+    summarize.after_all()
+
+    assert worker_summarize.pop_counts() == {}
+    assert read_csv_summary(summary_file_name)[1:] == [["A", "ID", "NAME", "2"], ["B", "ID", "NAME", "1"]]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unknown summary format 'xml'"):
+        Summarize("xml")